@@ -0,0 +1,32 @@
+"""Realistic response payloads built from the fixtures in tests/data/mock_data.py."""
+
+from __future__ import annotations
+
+import copy
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from tests.data.mock_data import (  # noqa: E402
+    cloud_deployment_model_mock,
+    device_deployment_model_mock,
+)
+
+
+def deployment_payload() -> dict:
+    return cloud_deployment_model_mock.__wrapped__()
+
+
+def deployment_list_payload(count: int) -> dict:
+    templates = [
+        cloud_deployment_model_mock.__wrapped__(),
+        device_deployment_model_mock.__wrapped__(),
+    ]
+    items = []
+    for i in range(count):
+        item = copy.deepcopy(templates[i % len(templates)])
+        item["metadata"]["name"] = f"deployment-{i}"
+        item["metadata"]["guid"] = f"dep-{i:06d}"
+        items.append(item)
+    return {"metadata": {"continue": count}, "items": items}
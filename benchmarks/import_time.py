@@ -0,0 +1,63 @@
+"""Measure the import time of the SDK with ``python -X importtime``.
+
+Runs each statement in a fresh interpreter and reports the time spent importing
+the modules it loads, along with the slowest of them. The modules imported at
+interpreter startup are not counted.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 5] [--top 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import rapyuta_io_sdk_v2",
+    "from rapyuta_io_sdk_v2 import Configuration",
+    "from rapyuta_io_sdk_v2 import Client",
+    "from rapyuta_io_sdk_v2 import AsyncClient",
+)
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of the top-level imports of
+    `statement`, excluding the ones of interpreter startup."""
+    times = {}
+    for code in ("pass", statement):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        startup, times = times, {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:") :].split("|")
+            # Modules imported by other modules are indented.
+            if not name.startswith("  ") and name.strip() not in startup:
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        runs = [import_times(statement) for _ in range(args.repeat)]
+        best = min(runs, key=lambda times: sum(times.values()))
+        print(f"{statement}: {sum(best.values()) / 1000:.1f} ms, best of {args.repeat}")
+        slowest = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        for name, cumulative in slowest[: args.top]:
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare the cost of decoding list responses in each response mode.
+
+Builds a ``DeploymentList`` payload from the deployment fixtures in
+``tests/data/mock_data.py`` and times ``parse_response`` for every mode. The
+"lazy" timing excludes validating items, which happens when they are accessed.
+
+Usage:
+    python benchmarks/response_modes.py [--items 500] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import httpx
+from _payloads import deployment_list_payload
+
+from rapyuta_io_sdk_v2.models import DeploymentList
+from rapyuta_io_sdk_v2.response import RESPONSE_MODES, parse_response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    response = httpx.Response(200, json=deployment_list_payload(args.items))
+    response.read()
+
+    print(f"DeploymentList with {args.items} items, best of {args.repeat} runs")
+    baseline = None
+    for mode in RESPONSE_MODES:
+        best = min(
+            timeit.repeat(
+                lambda mode=mode: parse_response(response, DeploymentList, mode),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        baseline = baseline or best
+        print(f"  {mode:<10} {best * 1000:8.2f} ms  {baseline / best:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
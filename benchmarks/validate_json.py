@@ -0,0 +1,48 @@
+"""Compare two-pass and single-pass validation of response bodies.
+
+"two-pass" is how responses used to be parsed: ``Model(**response.json())``.
+"single-pass" is ``validate_json``, used by the "model" response mode.
+
+Usage:
+    python benchmarks/validate_json.py [--items 500] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from _payloads import deployment_list_payload, deployment_payload
+
+from rapyuta_io_sdk_v2.models import Deployment, DeploymentList
+from rapyuta_io_sdk_v2.response import validate_json
+
+
+def bench(label: str, model: type, content: bytes, repeat: int, number: int) -> None:
+    def best(func) -> float:
+        return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+    two_pass = best(lambda: model(**json.loads(content)))
+    single_pass = best(lambda: validate_json(model, content))
+
+    print(label)
+    print(f"  two-pass     {two_pass * 1e6:10.1f} us")
+    print(f"  single-pass  {single_pass * 1e6:10.1f} us  {two_pass / single_pass:5.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    single = json.dumps(deployment_payload()).encode()
+    many = json.dumps(deployment_list_payload(args.items)).encode()
+
+    bench("Deployment", Deployment, single, args.repeat, number=200)
+    bench(f"DeploymentList ({args.items} items)", DeploymentList, many, args.repeat, 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,216 @@
-from rapyuta_io_sdk_v2.async_client import AsyncClient as AsyncClient
-from rapyuta_io_sdk_v2.client import Client as Client
-from rapyuta_io_sdk_v2.config import Configuration as Configuration
-from rapyuta_io_sdk_v2.models import (
-    Deployment as Deployment,
-    DeploymentList as DeploymentList,
-    Disk as Disk,
-    DiskList as DiskList,
-    ManagedServiceBinding as ManagedServiceBinding,
-    ManagedServiceBindingList as ManagedServiceBindingList,
-    ManagedServiceInstance as ManagedServiceInstance,
-    ManagedServiceInstanceList as ManagedServiceInstanceList,
-    ManagedServiceProvider as ManagedServiceProvider,
-    ManagedServiceProviderList as ManagedServiceProviderList,
-    Network as Network,
-    NetworkList as NetworkList,
-    OAuth2UpdateURI as OAuth2UpdateURI,
-    Organization as Organization,
-    Package as Package,
-    PackageList as PackageList,
-    Project as Project,
-    ProjectList as ProjectList,
-    Role as Role,
-    RoleList as RoleList,
-    RoleBinding as RoleBinding,
-    RoleBindingList as RoleBindingList,
-    BulkRoleBindingUpdate as BulkRoleBindingUpdate,
-    Secret as Secret,
-    SecretList as SecretList,
-    SecretCreate as SecretCreate,
-    StaticRoute as StaticRoute,
-    StaticRouteList as StaticRouteList,
-    User as User,
-    UserList as UserList,
-    UserGroup as UserGroup,
-    UserGroupCreate as UserGroupCreate,
-    UserGroupList as UserGroupList,
-    Daemon as Daemon,
-    ServiceAccountList as ServiceAccountList,
-    ServiceAccount as ServiceAccount,
-    ServiceAccountTokenList as ServiceAccountTokenList,
-    ServiceAccountToken as ServiceAccountToken,
-    ServiceAccountTokenInfo as ServiceAccountTokenInfo,
-    SSHKeySignRequest as SSHKeySignRequest,
-    SSHKeySignResponse as SSHKeySignResponse,
-)
-from rapyuta_io_sdk_v2.utils import walk_pages as walk_pages
+from __future__ import annotations
+
+import importlib
+import typing
 
 __version__ = "0.3.0"
+
+if typing.TYPE_CHECKING:
+    from rapyuta_io_sdk_v2.apply import (
+        ApplyResult as ApplyResult,
+        apply_resource as apply_resource,
+        apply_resource_async as apply_resource_async,
+        apply_resources as apply_resources,
+        apply_resources_async as apply_resources_async,
+    )
+    from rapyuta_io_sdk_v2.async_client import AsyncClient as AsyncClient
+    from rapyuta_io_sdk_v2.auth import (
+        AsyncTokenManager as AsyncTokenManager,
+        TokenManager as TokenManager,
+    )
+    from rapyuta_io_sdk_v2.bulk import BulkResult as BulkResult
+    from rapyuta_io_sdk_v2.cache import (
+        CacheStats as CacheStats,
+        ConditionalCache as ConditionalCache,
+        PackageCache as PackageCache,
+        ResponseCache as ResponseCache,
+    )
+    from rapyuta_io_sdk_v2.client import Client as Client
+    from rapyuta_io_sdk_v2.codec import (
+        JSONCodec as JSONCodec,
+        OrjsonCodec as OrjsonCodec,
+    )
+    from rapyuta_io_sdk_v2.config import Configuration as Configuration
+    from rapyuta_io_sdk_v2.informer import (
+        DeploymentInformer as DeploymentInformer,
+        DeploymentStore as DeploymentStore,
+        Informer as Informer,
+        InformerFactory as InformerFactory,
+        Store as Store,
+    )
+    from rapyuta_io_sdk_v2.models import (
+        Deployment as Deployment,
+        DeploymentList as DeploymentList,
+        Disk as Disk,
+        DiskList as DiskList,
+        ManagedServiceBinding as ManagedServiceBinding,
+        ManagedServiceBindingList as ManagedServiceBindingList,
+        ManagedServiceInstance as ManagedServiceInstance,
+        ManagedServiceInstanceList as ManagedServiceInstanceList,
+        ManagedServiceProvider as ManagedServiceProvider,
+        ManagedServiceProviderList as ManagedServiceProviderList,
+        Network as Network,
+        NetworkList as NetworkList,
+        OAuth2UpdateURI as OAuth2UpdateURI,
+        Organization as Organization,
+        Package as Package,
+        PackageList as PackageList,
+        Project as Project,
+        ProjectList as ProjectList,
+        Role as Role,
+        RoleList as RoleList,
+        RoleBinding as RoleBinding,
+        RoleBindingList as RoleBindingList,
+        BulkRoleBindingUpdate as BulkRoleBindingUpdate,
+        Secret as Secret,
+        SecretList as SecretList,
+        SecretCreate as SecretCreate,
+        StaticRoute as StaticRoute,
+        StaticRouteList as StaticRouteList,
+        User as User,
+        UserList as UserList,
+        UserGroup as UserGroup,
+        UserGroupCreate as UserGroupCreate,
+        UserGroupList as UserGroupList,
+        Daemon as Daemon,
+        LazyItems as LazyItems,
+        LazyList as LazyList,
+        ServiceAccountList as ServiceAccountList,
+        ServiceAccount as ServiceAccount,
+        ServiceAccountTokenList as ServiceAccountTokenList,
+        ServiceAccountToken as ServiceAccountToken,
+        ServiceAccountTokenInfo as ServiceAccountTokenInfo,
+        SSHKeySignRequest as SSHKeySignRequest,
+        SSHKeySignResponse as SSHKeySignResponse,
+    )
+    from rapyuta_io_sdk_v2.ratelimit import (
+        RateLimit as RateLimit,
+        RateLimiter as RateLimiter,
+    )
+    from rapyuta_io_sdk_v2.retry import (
+        RetryEvent as RetryEvent,
+        RetryPolicy as RetryPolicy,
+    )
+    from rapyuta_io_sdk_v2.transport import (
+        ConnectionPool as ConnectionPool,
+        PoolLimits as PoolLimits,
+    )
+    from rapyuta_io_sdk_v2.utils import walk_pages as walk_pages
+    from rapyuta_io_sdk_v2.utils import walk_items as walk_items
+    from rapyuta_io_sdk_v2.wait import PollPolicy as PollPolicy
+
+# The public names are imported from their modules on first access, so that
+# ``import rapyuta_io_sdk_v2`` does not load httpx, pydantic and every model up
+# front. Keep this in sync with the imports above, which type checkers see.
+
+_EXPORTS = {
+    "rapyuta_io_sdk_v2.apply": (
+        "ApplyResult",
+        "apply_resource",
+        "apply_resource_async",
+        "apply_resources",
+        "apply_resources_async",
+    ),
+    "rapyuta_io_sdk_v2.async_client": ("AsyncClient",),
+    "rapyuta_io_sdk_v2.auth": (
+        "AsyncTokenManager",
+        "TokenManager",
+    ),
+    "rapyuta_io_sdk_v2.bulk": ("BulkResult",),
+    "rapyuta_io_sdk_v2.cache": (
+        "CacheStats",
+        "ConditionalCache",
+        "PackageCache",
+        "ResponseCache",
+    ),
+    "rapyuta_io_sdk_v2.client": ("Client",),
+    "rapyuta_io_sdk_v2.codec": (
+        "JSONCodec",
+        "OrjsonCodec",
+    ),
+    "rapyuta_io_sdk_v2.config": ("Configuration",),
+    "rapyuta_io_sdk_v2.informer": (
+        "DeploymentInformer",
+        "DeploymentStore",
+        "Informer",
+        "InformerFactory",
+        "Store",
+    ),
+    "rapyuta_io_sdk_v2.models": (
+        "Deployment",
+        "DeploymentList",
+        "Disk",
+        "DiskList",
+        "ManagedServiceBinding",
+        "ManagedServiceBindingList",
+        "ManagedServiceInstance",
+        "ManagedServiceInstanceList",
+        "ManagedServiceProvider",
+        "ManagedServiceProviderList",
+        "Network",
+        "NetworkList",
+        "OAuth2UpdateURI",
+        "Organization",
+        "Package",
+        "PackageList",
+        "Project",
+        "ProjectList",
+        "Role",
+        "RoleList",
+        "RoleBinding",
+        "RoleBindingList",
+        "BulkRoleBindingUpdate",
+        "Secret",
+        "SecretList",
+        "SecretCreate",
+        "StaticRoute",
+        "StaticRouteList",
+        "User",
+        "UserList",
+        "UserGroup",
+        "UserGroupCreate",
+        "UserGroupList",
+        "Daemon",
+        "LazyItems",
+        "LazyList",
+        "ServiceAccountList",
+        "ServiceAccount",
+        "ServiceAccountTokenList",
+        "ServiceAccountToken",
+        "ServiceAccountTokenInfo",
+        "SSHKeySignRequest",
+        "SSHKeySignResponse",
+    ),
+    "rapyuta_io_sdk_v2.ratelimit": (
+        "RateLimit",
+        "RateLimiter",
+    ),
+    "rapyuta_io_sdk_v2.retry": (
+        "RetryEvent",
+        "RetryPolicy",
+    ),
+    "rapyuta_io_sdk_v2.transport": (
+        "ConnectionPool",
+        "PoolLimits",
+    ),
+    "rapyuta_io_sdk_v2.utils": (
+        "walk_pages",
+        "walk_items",
+    ),
+    "rapyuta_io_sdk_v2.wait": ("PollPolicy",),
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
@@ -0,0 +1,540 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextvars
+import time
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel
+
+from rapyuta_io_sdk_v2.exceptions import (
+    ApplyError,
+    HttpNotFoundError,
+    ResourceFailedError,
+    WaitTimeoutError,
+)
+from rapyuta_io_sdk_v2.models import (
+    Deployment,
+    Disk,
+    Network,
+    Package,
+    Secret,
+    SecretCreate,
+    StaticRoute,
+)
+from rapyuta_io_sdk_v2.wait import FAILED_PHASES, PollPolicy
+
+if typing.TYPE_CHECKING:
+    from rapyuta_io_sdk_v2.async_client import AsyncClient
+    from rapyuta_io_sdk_v2.client import Client
+
+# Model and key prefix used by ``list_dependencies`` by kind. The prefix also names
+# the client methods of the resource, e.g. ``get_disk`` and ``create_disk``.
+KINDS: dict[str, tuple[type[BaseModel], str]] = {
+    "Secret": (Secret, "secret"),
+    "Package": (Package, "package"),
+    "Disk": (Disk, "disk"),
+    "StaticRoute": (StaticRoute, "staticroute"),
+    "Network": (Network, "network"),
+    "Deployment": (Deployment, "deployment"),
+}
+
+
+@dataclass
+class ApplyResult:
+    """Outcome of applying a resource."""
+
+    # Key of the resource, e.g. ``deployment:nginx``.
+    key: str
+    # "created", "updated" or "unchanged".
+    action: typing.Literal["created", "updated", "unchanged"]
+    # The resource returned by the server, or its current state when unchanged.
+    resource: typing.Any
+    # Paths of the fields that differed, e.g. ``spec.envArgs[0].value``.
+    changes: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ApplyPlan:
+    """Dependency graph of the resources to apply.
+
+    Only the dependencies between the resources of the plan are edges; other
+    dependencies, e.g. on devices, must already exist.
+    """
+
+    # Resource by key, e.g. ``deployment:nginx``.
+    resources: dict[str, BaseModel] = field(default_factory=dict)
+    dependencies: dict[str, set[str]] = field(default_factory=dict)
+    dependents: dict[str, set[str]] = field(default_factory=dict)
+
+    def awaited(self, key: str) -> bool:
+        """Whether other resources depend on the resource, so it must be ready first."""
+        return bool(self.dependents[key])
+
+    def waves(self) -> list[list[str]]:
+        """Keys in topological waves; the resources of a wave are independent."""
+        remaining = {key: len(deps) for key, deps in self.dependencies.items()}
+        wave = [key for key, count in remaining.items() if count == 0]
+        waves = []
+        while wave:
+            waves.append(wave)
+            following = []
+            for key in wave:
+                for dependent in sorted(self.dependents[key]):
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        following.append(dependent)
+            wave = following
+        return waves
+
+
+def resource_key(resource: BaseModel) -> str:
+    """Key of a resource in ``list_dependencies`` form, e.g. ``disk:data``."""
+    for model, prefix in KINDS.values():
+        if isinstance(resource, model):
+            return f"{prefix}:{resource.metadata.name}"
+    raise TypeError(f"cannot apply {type(resource).__name__} resources")
+
+
+def _to_model(resource: BaseModel | dict[str, typing.Any]) -> BaseModel:
+    if isinstance(resource, BaseModel):
+        return resource
+    kind = resource.get("kind")
+    if kind not in KINDS:
+        raise ValueError(f"unsupported kind {kind!r}, expected one of {', '.join(KINDS)}")
+    model = SecretCreate if kind == "Secret" else KINDS[kind][0]
+    return model.model_validate(resource)
+
+
+def diff_resource(
+    desired: BaseModel, current: BaseModel, write_only: bool = False
+) -> list[str]:
+    """Fields of `desired` that differ from `current`.
+
+    ``spec`` and ``metadata.labels`` are compared after normalizing both through
+    their models. Fields the server fills in but `desired` leaves out, such as
+    defaults and status, do not count as changes; labels must match exactly.
+
+    Args:
+        desired (BaseModel): The resource as it should be.
+        current (BaseModel): The resource as returned by the server.
+        write_only (bool, optional): Ignore fields missing from `current`, for
+            resources whose values the server does not return, such as secrets.
+
+    Returns:
+        list[str]: Paths of the differing fields, empty if nothing changed.
+    """
+    want = desired.model_dump(mode="json", by_alias=True, exclude_none=True)
+    have = current.model_dump(mode="json", by_alias=True, exclude_none=True)
+    changes: list[str] = []
+    want_labels = want.get("metadata", {}).get("labels") or {}
+    if want_labels != (have.get("metadata", {}).get("labels") or {}):
+        changes.append("metadata.labels")
+    _diff(want.get("spec"), have.get("spec"), "spec", changes, write_only)
+    return changes
+
+
+def _diff(
+    want: typing.Any,
+    have: typing.Any,
+    path: str,
+    changes: list[str],
+    write_only: bool,
+) -> None:
+    if isinstance(want, dict) and isinstance(have, dict):
+        for name, value in want.items():
+            if name in have:
+                _diff(value, have[name], f"{path}.{name}", changes, write_only)
+            elif not write_only:
+                changes.append(f"{path}.{name}")
+    elif isinstance(want, list) and isinstance(have, list) and len(want) == len(have):
+        for index, (item, current) in enumerate(zip(want, have)):
+            _diff(item, current, f"{path}[{index}]", changes, write_only)
+    elif want != have:
+        changes.append(path)
+
+
+def _get_call(
+    model: BaseModel, prefix: str, name: str, kwargs: dict[str, typing.Any]
+) -> tuple[str, tuple, dict[str, typing.Any]]:
+    kwargs = {**kwargs, "response_mode": "model"}
+    if prefix == "package":
+        kwargs["version"] = model.metadata.version
+    return f"get_{prefix}", (name,), kwargs
+
+
+def _changes(model: BaseModel, current: BaseModel, prefix: str, force: bool) -> list[str]:
+    if prefix == "package":
+        # Published package versions cannot change.
+        return []
+    changes = diff_resource(model, current, write_only=prefix == "secret")
+    if force and not changes:
+        changes = ["spec"]
+    return changes
+
+
+def _update_call(model: BaseModel, prefix: str, name: str) -> tuple[str, tuple]:
+    if prefix == "deployment":
+        return "update_deployment", (model,)
+    if prefix in ("secret", "staticroute"):
+        return f"update_{prefix}", (name, model)
+    raise ValueError(f"cannot update {prefix}:{name}, {prefix}s cannot be updated")
+
+
+def apply_resource(
+    client: Client,
+    resource: BaseModel | dict[str, typing.Any],
+    force: bool = False,
+    **kwargs: typing.Any,
+) -> ApplyResult:
+    """Create a resource, or update it if it differs from the server.
+
+    The current state is fetched with ``get_*``; a client with a ConditionalCache
+    makes this cheap for unchanged resources. No write is made when ``spec`` and
+    ``metadata.labels`` match, see ``diff_resource``. Disks and networks cannot be
+    updated, so a difference raises ValueError.
+
+    Args:
+        client (Client): Client applying the resource.
+        resource: Deployment, Disk, Network, Secret, StaticRoute or Package, as a
+            model or a dict with a ``kind``.
+        force (bool, optional): Update even if nothing differs, e.g. to change
+            secret values, which the server does not return. Defaults to False.
+        **kwargs: Headers passed to every request, e.g. ``project_guid``.
+
+    Returns:
+        ApplyResult: Whether the resource was created, updated or unchanged.
+    """
+    model = _to_model(resource)
+    key = resource_key(model)
+    prefix, name = key.split(":", 1)
+
+    method, args, get_kwargs = _get_call(model, prefix, name, kwargs)
+    try:
+        current = getattr(client, method)(*args, **get_kwargs)
+    except HttpNotFoundError:
+        created = getattr(client, f"create_{prefix}")(model, **kwargs)
+        return ApplyResult(key, "created", created)
+
+    changes = _changes(model, current, prefix, force)
+    if not changes:
+        return ApplyResult(key, "unchanged", current)
+    method, args = _update_call(model, prefix, name)
+    updated = getattr(client, method)(*args, **kwargs)
+    return ApplyResult(key, "updated", updated, changes)
+
+
+async def apply_resource_async(
+    client: AsyncClient,
+    resource: BaseModel | dict[str, typing.Any],
+    force: bool = False,
+    **kwargs: typing.Any,
+) -> ApplyResult:
+    """Async counterpart of ``apply_resource``."""
+    model = _to_model(resource)
+    key = resource_key(model)
+    prefix, name = key.split(":", 1)
+
+    method, args, get_kwargs = _get_call(model, prefix, name, kwargs)
+    try:
+        current = await getattr(client, method)(*args, **get_kwargs)
+    except HttpNotFoundError:
+        created = await getattr(client, f"create_{prefix}")(model, **kwargs)
+        return ApplyResult(key, "created", created)
+
+    changes = _changes(model, current, prefix, force)
+    if not changes:
+        return ApplyResult(key, "unchanged", current)
+    method, args = _update_call(model, prefix, name)
+    updated = await getattr(client, method)(*args, **kwargs)
+    return ApplyResult(key, "updated", updated, changes)
+
+
+def plan(resources: typing.Iterable[BaseModel | dict[str, typing.Any]]) -> ApplyPlan:
+    """Build the dependency graph of resources from their ``list_dependencies``.
+
+    Args:
+        resources: Models or dicts with a ``kind``, e.g. parsed from manifests.
+
+    Returns:
+        ApplyPlan: The dependency graph.
+
+    Raises:
+        ValueError: A resource is listed twice, or the dependencies form a cycle.
+    """
+    result = ApplyPlan()
+    for resource in resources:
+        model = _to_model(resource)
+        key = resource_key(model)
+        if key in result.resources:
+            raise ValueError(f"{key} is listed more than once")
+        result.resources[key] = model
+
+    for key, model in result.resources.items():
+        list_dependencies = getattr(model, "list_dependencies", None)
+        dependencies = (list_dependencies() if list_dependencies else None) or []
+        result.dependencies[key] = {
+            dep for dep in dependencies if dep in result.resources and dep != key
+        }
+        result.dependents.setdefault(key, set())
+        for dep in result.dependencies[key]:
+            result.dependents.setdefault(dep, set()).add(key)
+
+    ordered = {key for wave in result.waves() for key in wave}
+    if len(ordered) != len(result.resources):
+        cycle = sorted(key for key in result.resources if key not in ordered)
+        raise ValueError(f"dependency cycle between {', '.join(cycle)}")
+    return result
+
+
+def _name(key: str) -> str:
+    return key.split(":", 1)[1]
+
+
+def _ready_check(key: str) -> typing.Callable[[typing.Any], bool] | None:
+    """Readiness check of resources that take a while to come up."""
+    prefix = key.split(":", 1)[0]
+    if prefix == "network":
+        return _network_ready
+    if prefix == "disk":
+        return _disk_ready
+    return None
+
+
+def _network_ready(network: Network) -> bool:
+    phase = network.status.phase if network.status is not None else None
+    if phase in FAILED_PHASES:
+        raise ResourceFailedError(
+            f"network {network.metadata.name} is {phase}", resource=network
+        )
+    return phase == "Succeeded"
+
+
+def _disk_ready(disk: Disk) -> bool:
+    status = disk.status.status if disk.status is not None else None
+    if status == "Failed":
+        raise ResourceFailedError(f"disk {disk.metadata.name} failed", resource=disk)
+    return status in ("Available", "Bound")
+
+
+class _Scheduler:
+    """Hands out the keys of a plan once their dependencies are applied."""
+
+    def __init__(self, plan: ApplyPlan) -> None:
+        self.plan = plan
+        self.remaining = {key: len(deps) for key, deps in plan.dependencies.items()}
+        self.ready = collections.deque(
+            key for key, count in self.remaining.items() if count == 0
+        )
+        self.applied: dict[str, typing.Any] = {}
+        self.errors: dict[str, BaseException] = {}
+
+    def done(self, key: str, result: typing.Any) -> None:
+        self.applied[key] = result
+        for dependent in sorted(self.plan.dependents[key]):
+            self.remaining[dependent] -= 1
+            if self.remaining[dependent] == 0:
+                self.ready.append(dependent)
+
+    def failed(self, key: str, exc: BaseException) -> None:
+        self.errors[key] = exc
+        # Stop starting new resources; the ones in flight are allowed to finish.
+        self.ready.clear()
+
+    def result(self) -> dict[str, typing.Any]:
+        if self.errors:
+            skipped = [
+                key
+                for key in self.plan.resources
+                if key not in self.applied and key not in self.errors
+            ]
+            raise ApplyError(
+                f"failed to apply {', '.join(self.errors)}",
+                errors=self.errors,
+                applied=self.applied,
+                skipped=skipped,
+            )
+        return self.applied
+
+
+def apply_resources(
+    client: Client,
+    resources: typing.Iterable[BaseModel | dict[str, typing.Any]],
+    concurrency: int = 8,
+    wait_ready: bool = True,
+    timeout: float = 600.0,
+    poll: PollPolicy | None = None,
+    force: bool = False,
+    **kwargs: typing.Any,
+) -> dict[str, ApplyResult]:
+    """Apply resources concurrently, in the order of their dependencies.
+
+    Every resource is applied with ``apply_resource``: created when missing,
+    updated when it differs from the server and left alone otherwise. Resources
+    are applied as soon as the resources they depend on are, with at most
+    `concurrency` in flight. A created or updated resource that others depend on
+    counts as applied once it is ready, e.g. a deployment once it Succeeded; the
+    rest are not waited for.
+
+    Args:
+        client (Client): Client creating the resources.
+        resources: Deployments, networks, disks, static routes, packages and
+            secrets, as models or dicts with a ``kind``.
+        concurrency (int, optional): Maximum concurrent resources. Defaults to 8.
+        wait_ready (bool, optional): Wait for depended-upon resources to be ready.
+            Defaults to True.
+        timeout (float, optional): Seconds to wait for each resource to be ready.
+            Defaults to 600.
+        poll (PollPolicy, optional): Polling intervals of the readiness checks.
+        force (bool, optional): Update resources even if nothing differs.
+        **kwargs: Headers passed to every request, e.g. ``project_guid``.
+
+    Returns:
+        dict[str, ApplyResult]: The outcomes by key, e.g. ``deployment:nginx``.
+
+    Raises:
+        ValueError: The dependencies form a cycle.
+        ApplyError: Some resources failed. Resources depending on them are skipped.
+    """
+    scheduler = _Scheduler(plan(resources))
+
+    def apply_one(key: str) -> ApplyResult:
+        resource = scheduler.plan.resources[key]
+        result = apply_resource(client, resource, force=force, **kwargs)
+        if wait_ready and result.action != "unchanged" and scheduler.plan.awaited(key):
+            _wait_ready(client, key, timeout, poll, kwargs)
+        return result
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        running: dict[Future, str] = {}
+        while scheduler.ready or running:
+            while scheduler.ready and len(running) < concurrency:
+                key = scheduler.ready.popleft()
+                # Run in a copy of the caller's context, to keep its scope.
+                context = contextvars.copy_context()
+                running[executor.submit(context.run, apply_one, key)] = key
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                key = running.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    scheduler.failed(key, exc)
+                elif not scheduler.errors:
+                    scheduler.done(key, future.result())
+                else:
+                    scheduler.applied[key] = future.result()
+
+    return scheduler.result()
+
+
+async def apply_resources_async(
+    client: AsyncClient,
+    resources: typing.Iterable[BaseModel | dict[str, typing.Any]],
+    concurrency: int = 8,
+    wait_ready: bool = True,
+    timeout: float = 600.0,
+    poll: PollPolicy | None = None,
+    force: bool = False,
+    **kwargs: typing.Any,
+) -> dict[str, ApplyResult]:
+    """Async counterpart of ``apply_resources``."""
+    scheduler = _Scheduler(plan(resources))
+
+    async def apply_one(key: str) -> ApplyResult:
+        resource = scheduler.plan.resources[key]
+        result = await apply_resource_async(client, resource, force=force, **kwargs)
+        if wait_ready and result.action != "unchanged" and scheduler.plan.awaited(key):
+            await _wait_ready_async(client, key, timeout, poll, kwargs)
+        return result
+
+    running: dict[asyncio.Future, str] = {}
+    try:
+        while scheduler.ready or running:
+            while scheduler.ready and len(running) < concurrency:
+                key = scheduler.ready.popleft()
+                running[asyncio.ensure_future(apply_one(key))] = key
+
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                key = running.pop(task)
+                exc = task.exception()
+                if exc is not None:
+                    scheduler.failed(key, exc)
+                elif not scheduler.errors:
+                    scheduler.done(key, task.result())
+                else:
+                    scheduler.applied[key] = task.result()
+    finally:
+        for task in running:
+            task.cancel()
+
+    return scheduler.result()
+
+
+def _wait_ready(
+    client: Client,
+    key: str,
+    timeout: float,
+    poll: PollPolicy | None,
+    kwargs: dict[str, typing.Any],
+) -> None:
+    name = _name(key)
+    if key.startswith("deployment:"):
+        client.wait_for_deployment(name, timeout=timeout, poll=poll, **kwargs)
+        return
+
+    check = _ready_check(key)
+    if check is None:
+        return
+    get = getattr(client, f"get_{key.split(':', 1)[0]}")
+    deadline = time.monotonic() + timeout
+    for interval in (poll or PollPolicy()).intervals():
+        if check(get(name, **{**kwargs, "response_mode": "model"})):
+            return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise WaitTimeoutError(f"timed out waiting for {key}", pending=[key])
+        time.sleep(min(interval, remaining))
+
+
+async def _wait_ready_async(
+    client: AsyncClient,
+    key: str,
+    timeout: float,
+    poll: PollPolicy | None,
+    kwargs: dict[str, typing.Any],
+) -> None:
+    name = _name(key)
+    if key.startswith("deployment:"):
+        await client.wait_for_deployment(name, timeout=timeout, poll=poll, **kwargs)
+        return
+
+    check = _ready_check(key)
+    if check is None:
+        return
+    get = getattr(client, f"get_{key.split(':', 1)[0]}")
+    deadline = time.monotonic() + timeout
+    for interval in (poll or PollPolicy()).intervals():
+        if check(await get(name, **{**kwargs, "response_mode": "model"})):
+            return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise WaitTimeoutError(f"timed out waiting for {key}", pending=[key])
+        await asyncio.sleep(min(interval, remaining))
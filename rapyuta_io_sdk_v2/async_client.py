@@ -14,13 +14,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import platform
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, ContextManager, Sequence
 
 import httpx
-from yaml import safe_load
 
-from rapyuta_io_sdk_v2.config import Configuration
+from rapyuta_io_sdk_v2.cache import (
+    STREAM_EXTENSION,
+    ConditionalCache,
+    PackageCache,
+    ResponseCache,
+)
+from rapyuta_io_sdk_v2.codec import (
+    AsyncCodecClient,
+    JSONCodec,
+    default_codec,
+)
+from rapyuta_io_sdk_v2.config import Configuration, scope
+from rapyuta_io_sdk_v2.exceptions import WaitTimeoutError
 from rapyuta_io_sdk_v2.models import (
     Secret,
     SecretCreate,
@@ -71,21 +85,96 @@ from rapyuta_io_sdk_v2.models.sshkey import (
     SSHKeySignRequest,
     SSHKeySignResponse,
 )
-from rapyuta_io_sdk_v2.utils import handle_server_errors
+from rapyuta_io_sdk_v2.ratelimit import RateLimiter
+from rapyuta_io_sdk_v2.response import (
+    M,
+    ResponseMode,
+    check_response_mode,
+    parse_response,
+)
+from rapyuta_io_sdk_v2.retry import RetryPolicy
+from rapyuta_io_sdk_v2.transport import (
+    ConnectionPool,
+    build_async_transport,
+)
+from rapyuta_io_sdk_v2.utils import handle_server_errors, walk_items_async
+from rapyuta_io_sdk_v2.wait import FAILED_PHASES, PollPolicy, deployment_ready
 
+if TYPE_CHECKING:
+    from rapyuta_io_sdk_v2.bulk import BulkResult
 
-class AsyncClient:
-    """AsyncClient class for the SDK."""
 
-    def __init__(self, config: Configuration | None = None, **kwargs: Any):
+class AsyncClient:
+    """AsyncClient class for the SDK.
+
+    Args:
+        config (Configuration): Configuration object.
+        pool (ConnectionPool, optional): Connection pool to send requests through.
+            A pool can be shared by many clients. Defaults to a private pool.
+        retry (RetryPolicy, optional): Retry transient server and connection errors
+            with exponential backoff. Defaults to no retries.
+        rate_limiter (RateLimiter, optional): Client-side rate limiter. A limiter can
+            be shared by many clients. Defaults to no rate limiting.
+        cache (ResponseCache, optional): Cache for GET responses, invalidated by the
+            writes made through the client. Defaults to no caching.
+        package_cache (PackageCache, optional): Cache for published package versions,
+            which never expire. Defaults to no caching.
+        conditional_cache (ConditionalCache, optional): Send conditional GET
+            requests, replaying the stored response and model on 304 Not Modified.
+            Defaults to unconditional requests.
+        single_flight (bool, optional): Send identical GET requests made by
+            concurrent tasks once and share the response, or the exception, between
+            them. Requests with different request IDs are not shared. Defaults to
+            False.
+        response_mode (str, optional): How responses are decoded: "model" validates
+            them into models, "raw" returns plain dicts, "construct" builds the
+            top-level model without validation, leaving nested objects as dicts,
+            and "lazy" returns list responses as LazyList, whose items are
+            validated on access. "raw" and "construct" cost about a third of
+            "model" for large lists, mostly JSON decoding; see
+            benchmarks/response_modes.py. Methods also accept a `response_mode`
+            keyword to override it per call. Defaults to "model".
+        codec (JSONCodec, optional): JSON codec for request and response bodies.
+            Defaults to orjson when it is installed, the standard library otherwise.
+        **kwargs: Additional keyword arguments.
+    """
+
+    def __init__(
+        self,
+        config: Configuration | None = None,
+        pool: ConnectionPool | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        package_cache: PackageCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        single_flight: bool = False,
+        response_mode: ResponseMode = "model",
+        codec: JSONCodec | None = None,
+        **kwargs: Any,
+    ):
         self.config: Configuration = config or Configuration()
+        # A pool created here is private to the client and closed with it.
+        self.owns_pool: bool = pool is None
+        self.pool: ConnectionPool = pool or ConnectionPool()
+        self.cache: ResponseCache | None = cache
+        self.package_cache: PackageCache | None = package_cache
+        self.conditional_cache: ConditionalCache | None = conditional_cache
+        self.response_mode: str = check_response_mode(response_mode)
+        self.codec: JSONCodec = codec or default_codec()
         timeout: float = float(kwargs.get("timeout", 10))
-        self.c: httpx.AsyncClient = httpx.AsyncClient(
+        self.c: httpx.AsyncClient = AsyncCodecClient(
             timeout=timeout,
-            limits=httpx.Limits(
-                max_keepalive_connections=5,
-                max_connections=5,
-                keepalive_expiry=30,
+            codec=self.codec,
+            transport=build_async_transport(
+                self.pool,
+                retry=retry,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                package_cache=package_cache,
+                conditional_cache=conditional_cache,
+                single_flight=single_flight,
+                owns_pool=self.owns_pool,
             ),
             headers={
                 "User-Agent": (
@@ -93,23 +182,30 @@ class AsyncClient:
                 )
             },
         )
-        self.sync_client: httpx.Client = httpx.Client(
-            timeout=timeout,
-            limits=httpx.Limits(
-                max_keepalive_connections=5,
-                max_connections=5,
-                keepalive_expiry=30,
-            ),
-            headers={
-                "User-Agent": (
-                    f"rio-sdk-v2;N/A;{platform.processor() or platform.machine()};{platform.system()};{platform.release()} {platform.version()}"
-                )
-            },
-        )
+        # In-flight token refreshes by the token being refreshed.
+        self._refreshes: dict[str, asyncio.Future] = {}
         self.rip_host = self.config.hosts.get("rip_host")
         self.v2api_host = self.config.hosts.get("v2api_host")
 
-    def get_auth_token(self, email: str, password: str) -> str:
+    def _parse(self, result: httpx.Response, model: type[M], mode: str | None = None):
+        """Decode a successful response into `model` using the response mode."""
+        return parse_response(result, model, mode or self.response_mode, self.codec)
+
+    async def aclose(self) -> None:
+        """Close the client's connections.
+
+        A private pool is closed with the client, a pool passed to it stays open
+        for the other clients sharing it.
+        """
+        await self.c.aclose()
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def get_auth_token(self, email: str, password: str) -> str:
         """Get the authentication token for the user.
 
         Args:
@@ -119,7 +215,7 @@ class AsyncClient:
         Returns:
             str: authentication token
         """
-        result = self.sync_client.post(
+        result = await self.c.post(
             url=f"{self.rip_host}/user/login",
             headers={"Content-Type": "application/json"},
             json={
@@ -128,9 +224,24 @@ class AsyncClient:
             },
         )
         handle_server_errors(result)
-        return result.json()["data"].get("token")
+        return self.codec.loads(result.content)["data"].get("token")
+
+    async def get_subject(self, auth_token: str) -> dict:
+        """Get subject(user or service account) from auth token.
+
+        Args:
+            auth_token (str): Authentication token
+        """
+        result = await self.c.get(
+            url=f"{self.rip_host}/user/info",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+
+        handle_server_errors(result)
+
+        return self.codec.loads(result.content)
 
-    def login(
+    async def login(
         self,
         email: str,
         password: str,
@@ -145,10 +256,10 @@ class AsyncClient:
             str: authentication token
         """
 
-        token = self.get_auth_token(email, password)
+        token = await self.get_auth_token(email, password)
         self.config.auth_token = token
 
-    def logout(self, token: str | None = None) -> None:
+    async def logout(self, token: str | None = None) -> None:
         """Expire the authentication token.
 
         Args:
@@ -158,7 +269,7 @@ class AsyncClient:
         if token is None:
             token = self.config.auth_token
 
-        result = self.sync_client.post(
+        result = await self.c.post(
             url=f"{self.rip_host}/user/logout",
             headers={
                 "Content-Type": "application/json",
@@ -167,9 +278,15 @@ class AsyncClient:
         )
         handle_server_errors(result)
 
-    def refresh_token(self, token: str | None = None, set_token: bool = True) -> str:
+    async def refresh_token(
+        self, token: str | None = None, set_token: bool = True
+    ) -> str:
         """Refresh the authentication token.
 
+        Concurrent calls refreshing the same token share a single request, so many
+        tasks finding the token expired refresh it only once. The shared request
+        is not cancelled when one of the callers is.
+
         Args:
             token (str): The token to refresh.
             set_token (bool): Set the refreshed token in the configuration.
@@ -181,15 +298,31 @@ class AsyncClient:
         if token is None:
             token = self.config.auth_token
 
-        result = self.sync_client.post(
+        refresh = self._refreshes.get(token)
+        if refresh is None:
+            refresh = asyncio.ensure_future(self._refresh_token(token))
+            self._refreshes[token] = refresh
+            refresh.add_done_callback(functools.partial(self._refreshed, token))
+
+        refreshed = await asyncio.shield(refresh)
+        if set_token:
+            self.config.auth_token = refreshed
+        return refreshed
+
+    async def _refresh_token(self, token: str) -> str:
+        result = await self.c.post(
             url=f"{self.rip_host}/refreshtoken",
             headers={"Content-Type": "application/json"},
             json={"token": token},
         )
         handle_server_errors(result)
-        if set_token:
-            self.config.auth_token = result.json()["data"].get("token")
-        return result.json()["data"].get("token")
+        return self.codec.loads(result.content)["data"].get("token")
+
+    def _refreshed(self, token: str, refresh: asyncio.Future) -> None:
+        self._refreshes.pop(token, None)
+        # See AsyncSingleFlightTransport._land.
+        if not refresh.cancelled():
+            refresh.exception()
 
     def set_organization(self, organization_guid: str) -> None:
         """Set the organization GUID.
@@ -207,6 +340,28 @@ class AsyncClient:
         """
         self.config.set_project(project_guid)
 
+    def scope(
+        self,
+        organization_guid: str | None = None,
+        project_guid: str | None = None,
+        request_id: str | None = None,
+    ) -> ContextManager[None]:
+        """Override the organization, project and request ID in the current context.
+
+        Unlike ``set_project``, the override only applies to requests made in the
+        ``with`` block by the current thread or task, so one client can serve many
+        projects concurrently. It applies to every client used in the block.
+
+        Args:
+            organization_guid (str, optional): Organization GUID to use.
+            project_guid (str, optional): Project GUID to use.
+            request_id (str, optional): X-Request-ID sent with the requests.
+
+        Returns:
+            ContextManager: Use with ``with``.
+        """
+        return scope(organization_guid, project_guid, request_id)
+
     # -----------------Organization----------------
     async def get_organization(
         self, organization_guid: str | None = None, **kwargs
@@ -229,7 +384,7 @@ class AsyncClient:
             ),
         )
         handle_server_errors(result)
-        return Organization(**result.json())
+        return self._parse(result, Organization, kwargs.get("response_mode"))
 
     async def update_organization(
         self,
@@ -258,7 +413,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Organization(**result.json())
+        return self._parse(result, Organization, kwargs.get("response_mode"))
 
     # ---------------------User--------------------
     async def list_users(
@@ -286,7 +441,28 @@ class AsyncClient:
 
         handle_server_errors(result)
 
-        return UserList(**result.json())
+        return self._parse(result, UserList, kwargs.get("response_mode"))
+
+    def iter_users(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[User]:
+        """Iterate over all users, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_users`.
+
+        Yields:
+            User: Each user.
+        """
+        return walk_items_async(
+            self.list_users, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def add_user(self, user: User | dict, **kwargs) -> User:
         """Add a User in Organization.
@@ -304,7 +480,7 @@ class AsyncClient:
 
         handle_server_errors(result)
 
-        return UserList(**result.json())
+        return self._parse(result, UserList, kwargs.get("response_mode"))
 
     async def get_myself(self, **kwargs) -> User:
         """Get my User details.
@@ -319,7 +495,7 @@ class AsyncClient:
             ),
         )
         handle_server_errors(result)
-        return User(**result.json())
+        return self._parse(result, User, kwargs.get("response_mode"))
 
     async def update_myself(self, body: User | dict[str, Any], **kwargs) -> User:
         """Update my user details.
@@ -341,7 +517,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return User(**result.json())
+        return self._parse(result, User, kwargs.get("response_mode"))
 
     async def get_user(self, email_id: str, **kwargs) -> User:
         """Get User details.
@@ -354,7 +530,7 @@ class AsyncClient:
             headers=self.config.get_headers(with_project=False, **kwargs),
         )
         handle_server_errors(result)
-        return User(**result.json())
+        return self._parse(result, User, kwargs.get("response_mode"))
 
     async def update_user(
         self, email_id: str, body: User | dict[str, Any], **kwargs
@@ -376,7 +552,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return User(**result.json())
+        return self._parse(result, User, kwargs.get("response_mode"))
 
     async def delete_user(self, email_id: str, **kwargs):
         """
@@ -405,21 +581,23 @@ class AsyncClient:
         Returns:
             UserPermissions: User permissions object containing organization, projects, and groups permissions
         """
-        organization_guid = organization_guid or self.config.organization_guid
+        organization_guid = organization_guid or self.config.scoped_organization_guid
 
-        headers = self.config.get_headers(
-            with_project=False,
-            organization_guid=organization_guid,
-            **kwargs,
-        )
-        headers["userguid"] = user_guid
+        headers = {
+            **self.config.get_headers(
+                with_project=False,
+                organization_guid=organization_guid,
+                **kwargs,
+            ),
+            "userguid": user_guid,
+        }
 
         result = await self.c.get(
             url=f"{self.v2api_host}/v2/users/permissions/",
             headers=headers,
         )
         handle_server_errors(result)
-        return UserPermissions(**result.json())
+        return self._parse(result, UserPermissions, kwargs.get("response_mode"))
 
     # ----------------- Projects -----------------
     async def list_projects(
@@ -466,7 +644,28 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ProjectList(**result.json())
+        return self._parse(result, ProjectList, kwargs.get("response_mode"))
+
+    def iter_projects(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[Project]:
+        """Iterate over all projects, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_projects`.
+
+        Yields:
+            Project: Each project.
+        """
+        return walk_items_async(
+            self.list_projects, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def get_project(self, project_guid: str | None = None, **kwargs) -> Project:
         """Get a project by its GUID.
@@ -485,7 +684,7 @@ class AsyncClient:
             Project details as a dictionary.
         """
         if project_guid is None:
-            project_guid = self.config.project_guid
+            project_guid = self.config.scoped_project_guid
         if not project_guid:
             raise ValueError("project_guid is required")
         result = await self.c.get(
@@ -493,7 +692,7 @@ class AsyncClient:
             headers=self.config.get_headers(with_project=False, **kwargs),
         )
         handle_server_errors(result)
-        return Project(**result.json())
+        return self._parse(result, Project, kwargs.get("response_mode"))
 
     async def create_project(self, body: Project | dict[str, Any], **kwargs) -> Project:
         """Create a new project.
@@ -517,7 +716,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Project(**result.json())
+        return self._parse(result, Project, kwargs.get("response_mode"))
 
     async def update_project(
         self, body: Project | dict[str, Any], project_guid: str | None = None, **kwargs
@@ -540,7 +739,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Project(**result.json())
+        return self._parse(result, Project, kwargs.get("response_mode"))
 
     async def delete_project(self, project_guid: str, **kwargs) -> None:
         """Delete a project by its GUID.
@@ -566,7 +765,7 @@ class AsyncClient:
         Returns:
             Dict[str, Any]: Project owner update result.
         """
-        project_guid = project_guid or self.config.project_guid
+        project_guid = project_guid or self.config.scoped_project_guid
 
         result = await self.c.put(
             url=f"{self.v2api_host}/v2/projects/{project_guid}/owner/",
@@ -608,7 +807,28 @@ class AsyncClient:
         )
 
         handle_server_errors(response=result)
-        return PackageList(**result.json())
+        return self._parse(result, PackageList, kwargs.get("response_mode"))
+
+    def iter_packages(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[Package]:
+        """Iterate over all packages, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_packages`.
+
+        Yields:
+            Package: Each package.
+        """
+        return walk_items_async(
+            self.list_packages, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def create_package(self, body: Package | dict[str, Any], **kwargs) -> Package:
         """Create a new package.
@@ -632,7 +852,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return Package(**result.json())
+        return self._parse(result, Package, kwargs.get("response_mode"))
 
     async def get_package(
         self, name: str, version: str | None = None, **kwargs
@@ -653,7 +873,7 @@ class AsyncClient:
         )
         handle_server_errors(result)
 
-        return Package(**result.json())
+        return self._parse(result, Package, kwargs.get("response_mode"))
 
     async def delete_package(self, name: str, version: str, **kwargs) -> None:
         """Delete a package by its name.
@@ -730,10 +950,31 @@ class AsyncClient:
 
         handle_server_errors(response=result)
 
-        return DeploymentList(**result.json())
+        return self._parse(result, DeploymentList, kwargs.get("response_mode"))
 
     # -------------------Deployment-------------------
 
+    def iter_deployments(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[Deployment]:
+        """Iterate over all deployments, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_deployments`.
+
+        Yields:
+            Deployment: Each deployment.
+        """
+        return walk_items_async(
+            self.list_deployments, limit=limit, concurrency=concurrency, **kwargs
+        )
+
     async def create_deployment(
         self, body: Deployment | dict[str, Any], **kwargs
     ) -> Deployment:
@@ -755,7 +996,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return Deployment(**result.json())
+        return self._parse(result, Deployment, kwargs.get("response_mode"))
 
     async def get_deployment(
         self, name: str, guid: str | None = None, **kwargs
@@ -778,7 +1019,7 @@ class AsyncClient:
 
         handle_server_errors(response=result)
 
-        return Deployment(**result.json())
+        return self._parse(result, Deployment, kwargs.get("response_mode"))
 
     async def update_deployment(
         self, name: str, body: Deployment | dict[str, Any], **kwargs
@@ -801,7 +1042,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Deployment(**result.json())
+        return self._parse(result, Deployment, kwargs.get("response_mode"))
 
     async def delete_deployment(self, name: str, **kwargs) -> None:
         """Delete a deployment by its name.
@@ -817,6 +1058,106 @@ class AsyncClient:
         handle_server_errors(result)
         return None
 
+    async def wait_for_deployment(
+        self,
+        name: str,
+        phases: Sequence[str] = ("Succeeded",),
+        statuses: Sequence[str] | None = None,
+        timeout: float = 300.0,
+        poll: PollPolicy | None = None,
+        **kwargs,
+    ) -> Deployment:
+        """Wait until a deployment reaches one of the phases.
+
+        The deployment is polled often at first and less often as time passes, see
+        PollPolicy.
+
+        Args:
+            name (str): Deployment name.
+            phases (Sequence[str], optional): Phases to wait for. Defaults to ("Succeeded",).
+            statuses (Sequence[str], optional): Statuses the deployment must also be in,
+                e.g. ("Running",). Defaults to any status.
+            timeout (float, optional): Seconds to wait. Defaults to 300.
+            poll (PollPolicy, optional): Polling intervals. Defaults to PollPolicy().
+
+        Returns:
+            Deployment: The deployment in the awaited phase.
+
+        Raises:
+            DeploymentFailedError: The deployment is FailedToStart or FailedToUpdate.
+            WaitTimeoutError: The deployment did not reach the phases in time.
+        """
+        kwargs["response_mode"] = "model"
+        deadline = time.monotonic() + timeout
+        for interval in (poll or PollPolicy()).intervals():
+            deployment = await self.get_deployment(name, **kwargs)
+            if deployment_ready(deployment, phases, statuses):
+                return deployment
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WaitTimeoutError(
+                    f"timed out waiting for deployment {name}", pending=[name]
+                )
+            await asyncio.sleep(min(interval, remaining))
+
+    async def wait_for_deployments(
+        self,
+        names: Sequence[str],
+        phases: Sequence[str] = ("Succeeded",),
+        statuses: Sequence[str] | None = None,
+        timeout: float = 300.0,
+        poll: PollPolicy | None = None,
+        **kwargs,
+    ) -> dict[str, Deployment]:
+        """Wait until all the deployments reach one of the phases.
+
+        Every poll is a single ``list_deployments`` call for the deployments still
+        pending, filtered by the awaited and the failed phases.
+
+        Args:
+            names (Sequence[str]): Deployment names.
+            phases (Sequence[str], optional): Phases to wait for. Defaults to ("Succeeded",).
+            statuses (Sequence[str], optional): Statuses the deployments must also be
+                in, e.g. ("Running",). Defaults to any status.
+            timeout (float, optional): Seconds to wait. Defaults to 300.
+            poll (PollPolicy, optional): Polling intervals. Defaults to PollPolicy().
+
+        Returns:
+            dict[str, Deployment]: The deployments by name.
+
+        Raises:
+            DeploymentFailedError: A deployment is FailedToStart or FailedToUpdate.
+            WaitTimeoutError: Some deployments did not reach the phases in time. Their
+                names are in the `pending` attribute.
+        """
+        kwargs["response_mode"] = "model"
+        pending = list(dict.fromkeys(names))
+        ready: dict[str, Deployment] = {}
+        deadline = time.monotonic() + timeout
+        for interval in (poll or PollPolicy()).intervals():
+            async for deployment in walk_items_async(
+                self.list_deployments,
+                names=pending,
+                phases=[*phases, *FAILED_PHASES],
+                **kwargs,
+            ):
+                name = deployment.metadata.name
+                if name in pending and deployment_ready(deployment, phases, statuses):
+                    ready[name] = deployment
+
+            pending = [name for name in pending if name not in ready]
+            if not pending:
+                return {name: ready[name] for name in names}
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WaitTimeoutError(
+                    f"timed out waiting for deployments {', '.join(pending)}",
+                    pending=pending,
+                )
+            await asyncio.sleep(min(interval, remaining))
+
     async def get_deployment_graph(self, name: str, **kwargs) -> dict[str, Any]:
         """Get a deployment graph by its name. [Experimental]
 
@@ -853,7 +1194,10 @@ class AsyncClient:
         url = f"{self.v2api_host}/v2/deployments/{name}/logs/?replica={replica}&executable={executable}"
 
         async with self.c.stream(
-            "GET", url=url, headers=self.config.get_headers()
+            "GET",
+            url=url,
+            headers=self.config.get_headers(),
+            extensions={STREAM_EXTENSION: True},
         ) as response:
             response.raise_for_status()
 
@@ -902,7 +1246,28 @@ class AsyncClient:
         )
 
         handle_server_errors(response=result)
-        return DiskList(**result.json())
+        return self._parse(result, DiskList, kwargs.get("response_mode"))
+
+    def iter_disks(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[Disk]:
+        """Iterate over all disks, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_disks`.
+
+        Yields:
+            Disk: Each disk.
+        """
+        return walk_items_async(
+            self.list_disks, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def get_disk(self, name: str, **kwargs) -> Disk:
         """Get a disk by its name.
@@ -920,7 +1285,7 @@ class AsyncClient:
         )
         handle_server_errors(response=result)
 
-        return Disk(**result.json())
+        return self._parse(result, Disk, kwargs.get("response_mode"))
 
     async def create_disk(self, body: Disk | dict[str, Any], **kwargs) -> Disk:
         """Create a new disk.
@@ -940,7 +1305,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Disk(**result.json())
+        return self._parse(result, Disk, kwargs.get("response_mode"))
 
     async def delete_disk(self, name: str, **kwargs) -> None:
         """Delete a disk by its name.
@@ -977,7 +1342,7 @@ class AsyncClient:
         )
 
         handle_server_errors(response=result)
-        return Daemon(**result.json())
+        return self._parse(result, Daemon)
 
     # -------------------Static Routes-------------------
 
@@ -1019,7 +1384,28 @@ class AsyncClient:
         )
 
         handle_server_errors(response=result)
-        return StaticRouteList(**result.json())
+        return self._parse(result, StaticRouteList, kwargs.get("response_mode"))
+
+    def iter_staticroutes(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[StaticRoute]:
+        """Iterate over all static routes, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_staticroutes`.
+
+        Yields:
+            StaticRoute: Each static route.
+        """
+        return walk_items_async(
+            self.list_staticroutes, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def create_staticroute(
         self, body: StaticRoute | dict[str, Any], **kwargs
@@ -1041,7 +1427,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return StaticRoute(**result.json())
+        return self._parse(result, StaticRoute, kwargs.get("response_mode"))
 
     async def get_staticroute(self, name: str, **kwargs) -> StaticRoute:
         """Get a static route by its name.
@@ -1059,7 +1445,7 @@ class AsyncClient:
         )
         handle_server_errors(response=result)
 
-        return StaticRoute(**result.json())
+        return self._parse(result, StaticRoute, kwargs.get("response_mode"))
 
     async def update_staticroute(
         self, name: str, body: StaticRoute | dict[str, Any], **kwargs
@@ -1082,7 +1468,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return StaticRoute(**result.json())
+        return self._parse(result, StaticRoute, kwargs.get("response_mode"))
 
     async def delete_staticroute(self, name: str, **kwargs) -> None:
         """Delete a static route by its name.
@@ -1150,7 +1536,28 @@ class AsyncClient:
         )
 
         handle_server_errors(response=result)
-        return NetworkList(**result.json())
+        return self._parse(result, NetworkList, kwargs.get("response_mode"))
+
+    def iter_networks(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[Network]:
+        """Iterate over all networks, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_networks`.
+
+        Yields:
+            Network: Each network.
+        """
+        return walk_items_async(
+            self.list_networks, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def create_network(self, body: Network | dict[str, Any], **kwargs) -> Network:
         """Create a new network.
@@ -1170,7 +1577,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Network(**result.json())
+        return self._parse(result, Network, kwargs.get("response_mode"))
 
     async def get_network(self, name: str, **kwargs) -> Network:
         """Get a network by its name.
@@ -1188,7 +1595,7 @@ class AsyncClient:
         )
         handle_server_errors(response=result)
 
-        return Network(**result.json())
+        return self._parse(result, Network, kwargs.get("response_mode"))
 
     async def delete_network(self, name: str, **kwargs) -> None:
         """Delete a network by its name.
@@ -1249,7 +1656,28 @@ class AsyncClient:
         )
 
         handle_server_errors(response=result)
-        return SecretList(**result.json())
+        return self._parse(result, SecretList, kwargs.get("response_mode"))
+
+    def iter_secrets(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[Secret]:
+        """Iterate over all secrets, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_secrets`.
+
+        Yields:
+            Secret: Each secret.
+        """
+        return walk_items_async(
+            self.list_secrets, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def create_secret(
         self, body: SecretCreate | dict[str, Any], **kwargs
@@ -1272,7 +1700,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return Secret(**result.json())
+        return self._parse(result, Secret, kwargs.get("response_mode"))
 
     async def get_secret(self, name: str, **kwargs) -> Secret:
         """Get a secret by its name.
@@ -1290,7 +1718,7 @@ class AsyncClient:
         )
         handle_server_errors(response=result)
 
-        return Secret(**result.json())
+        return self._parse(result, Secret, kwargs.get("response_mode"))
 
     async def update_secret(
         self, name: str, body: Secret | dict[str, Any], **kwargs
@@ -1313,7 +1741,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Secret(**result.json())
+        return self._parse(result, Secret, kwargs.get("response_mode"))
 
     async def delete_secret(self, name: str, **kwargs) -> None:
         """Delete a secret by its name.
@@ -1371,7 +1799,28 @@ class AsyncClient:
             params=params,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
+
+    def iter_oauth2_clients(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all OAuth2 clients, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_oauth2_clients`.
+
+        Yields:
+            dict[str, Any]: Each OAuth2 client.
+        """
+        return walk_items_async(
+            self.list_oauth2_clients, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def get_oauth2_client(self, client_id: str, **kwargs) -> dict[str, Any]:
         """Get an OAuth2 client by its client_id.
@@ -1387,7 +1836,7 @@ class AsyncClient:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def create_oauth2_client(self, body: dict, **kwargs) -> dict[str, Any]:
         """Create a new OAuth2 client.
@@ -1404,7 +1853,7 @@ class AsyncClient:
             json=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def update_oauth2_client(
         self, client_id: str, body: dict, **kwargs
@@ -1424,7 +1873,7 @@ class AsyncClient:
             json=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def update_oauth2_client_uris(
         self, client_id: str, update: OAuth2UpdateURI, **kwargs
@@ -1444,7 +1893,7 @@ class AsyncClient:
             json=update.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def delete_oauth2_client(self, client_id: str, **kwargs) -> None:
         """Delete an OAuth2 client by its client_id.
@@ -1496,7 +1945,28 @@ class AsyncClient:
             params=parameters,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
+
+    def iter_configtrees(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all config trees, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_configtrees`.
+
+        Yields:
+            dict[str, Any]: Each config tree.
+        """
+        return walk_items_async(
+            self.list_configtrees, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def create_configtree(
         self, body: dict, with_project: bool = True, **kwargs
@@ -1517,7 +1987,7 @@ class AsyncClient:
             json=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def get_configtree(
         self,
@@ -1554,7 +2024,7 @@ class AsyncClient:
             },
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def set_configtree_revision(
         self, name: str, configtree: object, project_guid: str | None = None, **kwargs
@@ -1576,7 +2046,7 @@ class AsyncClient:
             json=configtree,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def update_configtree(
         self, name: str, body: dict, with_project: bool = True, **kwargs
@@ -1600,7 +2070,7 @@ class AsyncClient:
 
         handle_server_errors(result)
 
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def delete_configtree(self, name: str, **kwargs) -> None:
         """Delete a config tree by its name.
@@ -1656,7 +2126,34 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
+
+    def iter_revisions(
+        self,
+        tree_name: str,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all revisions of a config tree, fetching one page at a time.
+
+        Args:
+            tree_name (str): Config tree name.
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_revisions`.
+
+        Yields:
+            dict[str, Any]: Each revision.
+        """
+        return walk_items_async(
+            self.list_revisions,
+            tree_name=tree_name,
+            limit=limit,
+            concurrency=concurrency,
+            **kwargs,
+        )
 
     async def create_revision(
         self, name: str, body: dict, project_guid: str | None = None, **kwargs
@@ -1679,7 +2176,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def put_keys_in_revision(
         self, name: str, revision_id: str, config_values: dict, **kwargs
@@ -1702,7 +2199,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def commit_revision(
         self,
@@ -1742,7 +2239,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def get_key_in_revision(
         self,
@@ -1771,6 +2268,9 @@ class AsyncClient:
         # The data received from the API is always in string format. To use
         # appropriate data-type in Python (as well in exports), we are
         # passing it through YAML parser.
+        # yaml is only needed here, so it is not imported with the client.
+        from yaml import safe_load
+
         return safe_load(result.text)
 
     async def put_key_in_revision(
@@ -1800,7 +2300,7 @@ class AsyncClient:
             content=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     async def delete_key_in_revision(
         self,
@@ -1858,7 +2358,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     # Managed Service API
 
@@ -1875,7 +2375,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ManagedServiceProviderList(**result.json())
+        return self._parse(result, ManagedServiceProviderList)
 
     async def list_instances(
         self,
@@ -1883,6 +2383,7 @@ class AsyncClient:
         limit: int = 50,
         label_selector: list[str] = None,
         providers: list[str] = None,
+        **kwargs,
     ) -> ManagedServiceInstanceList:
         """List all instances in a project.
 
@@ -1897,7 +2398,7 @@ class AsyncClient:
         """
         result = await self.c.get(
             url=f"{self.v2api_host}/v2/managedservices/",
-            headers=self.config.get_headers(),
+            headers=self.config.get_headers(**kwargs),
             params={
                 "continue": cont,
                 "limit": limit,
@@ -1907,7 +2408,30 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ManagedServiceInstanceList(**result.json())
+        return self._parse(
+            result, ManagedServiceInstanceList, kwargs.get("response_mode")
+        )
+
+    def iter_instances(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[ManagedServiceInstance]:
+        """Iterate over all managed service instances, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_instances`.
+
+        Yields:
+            ManagedServiceInstance: Each managed service instance.
+        """
+        return walk_items_async(
+            self.list_instances, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def get_instance(self, name: str) -> ManagedServiceInstance:
         """Get an instance by its name.
@@ -1925,7 +2449,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ManagedServiceInstance(**result.json())
+        return self._parse(result, ManagedServiceInstance)
 
     async def create_instance(
         self, body: ManagedServiceInstance | dict[str, Any]
@@ -1945,7 +2469,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ManagedServiceInstance(**result.json())
+        return self._parse(result, ManagedServiceInstance)
 
     async def delete_instance(self, name: str) -> None:
         """Delete an instance.
@@ -1990,7 +2514,34 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ManagedServiceBindingList(**result.json())
+        return self._parse(result, ManagedServiceBindingList)
+
+    def iter_instance_bindings(
+        self,
+        instance_name: str,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[ManagedServiceBinding]:
+        """Iterate over all bindings of a managed service instance, fetching one page at a time.
+
+        Args:
+            instance_name (str): Instance name.
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_instance_bindings`.
+
+        Yields:
+            ManagedServiceBinding: Each binding.
+        """
+        return walk_items_async(
+            self.list_instance_bindings,
+            instance_name=instance_name,
+            limit=limit,
+            concurrency=concurrency,
+            **kwargs,
+        )
 
     async def create_instance_binding(
         self, instance_name: str, body: ManagedServiceBinding | dict
@@ -2015,7 +2566,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ManagedServiceBinding(**result.json())
+        return self._parse(result, ManagedServiceBinding)
 
     async def get_instance_binding(
         self, instance_name: str, name: str
@@ -2036,7 +2587,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ManagedServiceBinding(**result.json())
+        return self._parse(result, ManagedServiceBinding)
 
     async def delete_instance_binding(self, instance_name: str, name: str) -> None:
         """Delete an instance binding.
@@ -2085,7 +2636,28 @@ class AsyncClient:
 
         handle_server_errors(response=result)
 
-        return UserGroupList(**result.json())
+        return self._parse(result, UserGroupList, kwargs.get("response_mode"))
+
+    def iter_user_groups(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[UserGroup]:
+        """Iterate over all user groups, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_user_groups`.
+
+        Yields:
+            UserGroup: Each user group.
+        """
+        return walk_items_async(
+            self.list_user_groups, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def get_user_group(
         self, group_name: str, group_guid: str, **kwargs
@@ -2098,7 +2670,7 @@ class AsyncClient:
         )
         handle_server_errors(result)
 
-        return UserGroup(**result.json())
+        return self._parse(result, UserGroup, kwargs.get("response_mode"))
 
     async def create_user_group(self, user_group: UserGroup, **kwargs) -> UserGroup:
         result = await self.c.post(
@@ -2108,7 +2680,7 @@ class AsyncClient:
         )
         handle_server_errors(result)
 
-        return UserGroup(**result.json())
+        return self._parse(result, UserGroup, kwargs.get("response_mode"))
 
     async def update_user_group(self, user_group: UserGroup, **kwargs) -> UserGroup:
         result = await self.c.put(
@@ -2123,7 +2695,7 @@ class AsyncClient:
         )
         handle_server_errors(result)
 
-        return UserGroup(**result.json())
+        return self._parse(result, UserGroup, kwargs.get("response_mode"))
 
     async def delete_user_group(self, group_name: str, group_guid: str, **kwargs) -> None:
         result = await self.c.delete(
@@ -2160,7 +2732,28 @@ class AsyncClient:
 
         handle_server_errors(result)
 
-        return RoleList(**result.json())
+        return self._parse(result, RoleList, kwargs.get("response_mode"))
+
+    def iter_roles(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[Role]:
+        """Iterate over all roles, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_roles`.
+
+        Yields:
+            Role: Each role.
+        """
+        return walk_items_async(
+            self.list_roles, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def get_role(self, role_name: str, **kwargs) -> Role:
         result = await self.c.get(
@@ -2169,7 +2762,7 @@ class AsyncClient:
         )
         handle_server_errors(result)
 
-        return Role(**result.json())
+        return self._parse(result, Role, kwargs.get("response_mode"))
 
     async def create_role(self, role: Role | dict, **kwargs) -> Role:
         if isinstance(role, dict):
@@ -2181,7 +2774,7 @@ class AsyncClient:
         )
         handle_server_errors(result)
 
-        return Role(**result.json())
+        return self._parse(result, Role, kwargs.get("response_mode"))
 
     async def update_role(self, role: Role, **kwargs) -> Role:
         if isinstance(role, dict):
@@ -2193,7 +2786,7 @@ class AsyncClient:
         )
         handle_server_errors(result)
 
-        return Role(**result.json())
+        return self._parse(result, Role, kwargs.get("response_mode"))
 
     async def delete_role(self, role_name: str, **kwargs) -> None:
         result = await self.c.delete(
@@ -2249,7 +2842,28 @@ class AsyncClient:
 
         handle_server_errors(result)
 
-        return RoleBindingList(**result.json())
+        return self._parse(result, RoleBindingList, kwargs.get("response_mode"))
+
+    def iter_role_bindings(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[RoleBinding]:
+        """Iterate over all role bindings, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_role_bindings`.
+
+        Yields:
+            RoleBinding: Each role binding.
+        """
+        return walk_items_async(
+            self.list_role_bindings, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def get_role_binding(self, binding_guid: str, **kwargs) -> RoleBinding:
         result = await self.c.get(
@@ -2258,7 +2872,7 @@ class AsyncClient:
         )
         handle_server_errors(result)
 
-        return RoleBinding(**result.json())
+        return self._parse(result, RoleBinding, kwargs.get("response_mode"))
 
     async def update_role_binding(
         self, binding: BulkRoleBindingUpdate | dict, **kwargs
@@ -2273,9 +2887,9 @@ class AsyncClient:
         handle_server_errors(result)
 
         try:
-            return RoleBinding(**result.json())
+            return self._parse(result, RoleBinding, kwargs.get("response_mode"))
         except Exception:
-            return result.json()
+            return self.codec.loads(result.content)
 
     # -------------------ServiceAccount-------------------
 
@@ -2307,7 +2921,28 @@ class AsyncClient:
 
         handle_server_errors(result)
 
-        return ServiceAccountList(**result.json())
+        return self._parse(result, ServiceAccountList, kwargs.get("response_mode"))
+
+    def iter_service_accounts(
+        self,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[ServiceAccount]:
+        """Iterate over all service accounts, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_service_accounts`.
+
+        Yields:
+            ServiceAccount: Each service account.
+        """
+        return walk_items_async(
+            self.list_service_accounts, limit=limit, concurrency=concurrency, **kwargs
+        )
 
     async def get_service_account(
         self,
@@ -2320,7 +2955,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ServiceAccount(**result.json())
+        return self._parse(result, ServiceAccount, kwargs.get("response_mode"))
 
     async def create_service_account(
         self,
@@ -2336,7 +2971,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ServiceAccount(**result.json())
+        return self._parse(result, ServiceAccount, kwargs.get("response_mode"))
 
     async def update_service_account(
         self,
@@ -2355,7 +2990,7 @@ class AsyncClient:
         )
 
         handle_server_errors(result)
-        return ServiceAccount(**result.json())
+        return self._parse(result, ServiceAccount, kwargs.get("response_mode"))
 
     async def delete_service_account(
         self,
@@ -2380,7 +3015,7 @@ class AsyncClient:
 
         handle_server_errors(result)
 
-        return ServiceAccountTokenList(**result.json())
+        return self._parse(result, ServiceAccountTokenList, kwargs.get("response_mode"))
 
     async def create_service_account_token(
         self, name: str, expiry_at: ServiceAccountToken | dict, **kwargs
@@ -2396,7 +3031,7 @@ class AsyncClient:
 
         handle_server_errors(result)
 
-        return ServiceAccountTokenInfo(**result.json())
+        return self._parse(result, ServiceAccountTokenInfo, kwargs.get("response_mode"))
 
     async def refresh_service_account_token(
         self, name: str, token_id: str, expiry_at: ServiceAccountToken | dict, **kwargs
@@ -2412,7 +3047,7 @@ class AsyncClient:
 
         handle_server_errors(result)
 
-        return ServiceAccountTokenInfo(**result.json())
+        return self._parse(result, ServiceAccountTokenInfo, kwargs.get("response_mode"))
 
     async def delete_service_account_token(
         self, name: str, token_id: str, **kwargs
@@ -2465,7 +3100,34 @@ class AsyncClient:
             params=params,
         )
         handle_server_errors(result)
-        return FileUploadList(**result.json())
+        return self._parse(result, FileUploadList, kwargs.get("response_mode"))
+
+    def iter_fileuploads(
+        self,
+        device_guid: str,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[FileUpload]:
+        """Iterate over all file uploads of a device, fetching one page at a time.
+
+        Args:
+            device_guid (str): Device GUID.
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_fileuploads`.
+
+        Yields:
+            FileUpload: Each file upload.
+        """
+        return walk_items_async(
+            self.list_fileuploads,
+            device_guid=device_guid,
+            limit=limit,
+            concurrency=concurrency,
+            **kwargs,
+        )
 
     async def get_fileupload(
         self,
@@ -2487,7 +3149,7 @@ class AsyncClient:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return FileUpload(**result.json())
+        return self._parse(result, FileUpload, kwargs.get("response_mode"))
 
     async def create_fileupload(
         self,
@@ -2513,7 +3175,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
         handle_server_errors(result)
-        return FileUpload(**result.json())
+        return self._parse(result, FileUpload, kwargs.get("response_mode"))
 
     async def delete_fileupload(
         self,
@@ -2577,7 +3239,7 @@ class AsyncClient:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     # -------------------SharedURL-------------------
     async def list_sharedurls(
@@ -2606,7 +3268,34 @@ class AsyncClient:
             },
         )
         handle_server_errors(result)
-        return SharedURLList(**result.json())
+        return self._parse(result, SharedURLList, kwargs.get("response_mode"))
+
+    def iter_sharedurls(
+        self,
+        fileupload_guid: str,
+        limit: int = 50,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[SharedURL]:
+        """Iterate over all shared URLs of a file upload, fetching one page at a time.
+
+        Args:
+            fileupload_guid (str): File upload GUID.
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): Maximum number of page requests in
+                flight, see `walk_pages_async`. Defaults to 1.
+            **kwargs: Filters passed on to `list_sharedurls`.
+
+        Yields:
+            SharedURL: Each shared URL.
+        """
+        return walk_items_async(
+            self.list_sharedurls,
+            fileupload_guid=fileupload_guid,
+            limit=limit,
+            concurrency=concurrency,
+            **kwargs,
+        )
 
     async def get_sharedurl(
         self,
@@ -2656,7 +3345,7 @@ class AsyncClient:
             json=body.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
         handle_server_errors(result)
-        return SharedURL(**result.json())
+        return self._parse(result, SharedURL, kwargs.get("response_mode"))
 
     # -------------------SSH Certificates-------------------
     async def sign_ssh_public_key(
@@ -2684,4 +3373,104 @@ class AsyncClient:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return SSHKeySignResponse(**result.json())
+        return self._parse(result, SSHKeySignResponse, kwargs.get("response_mode"))
+
+    # -------------------Bulk-------------------
+    async def create_many(
+        self,
+        resources: Sequence[Any],
+        concurrency: int = 8,
+        fail_fast: bool = False,
+        **kwargs,
+    ) -> list[BulkResult]:
+        """Create resources concurrently, at most `concurrency` at a time.
+
+        Args:
+            resources (Sequence): Deployments, disks, networks, secrets, static routes
+                or packages, as models or dicts with a ``kind``.
+            concurrency (int, optional): Maximum number of requests in flight.
+                Defaults to 8.
+            fail_fast (bool, optional): Stop at the first error instead of trying
+                every resource. Defaults to False.
+
+        Returns:
+            list[BulkResult]: The outcome of every resource, in the same order.
+
+        Raises:
+            BulkError: A resource failed and `fail_fast` is set.
+        """
+        # bulk loads apply and every model, so it is not imported with the client.
+        from rapyuta_io_sdk_v2.bulk import create_stages, run_stages_async
+
+        stages = create_stages(self, resources, kwargs)
+        return await run_stages_async(stages, concurrency, fail_fast)
+
+    async def update_many(
+        self,
+        resources: Sequence[Any],
+        concurrency: int = 8,
+        fail_fast: bool = False,
+        **kwargs,
+    ) -> list[BulkResult]:
+        """Update deployments, secrets and static routes concurrently.
+
+        Args:
+            resources (Sequence): Resources to update, as models or dicts with a
+                ``kind``.
+            concurrency (int, optional): Maximum number of requests in flight.
+                Defaults to 8.
+            fail_fast (bool, optional): Stop at the first error instead of trying
+                every resource. Defaults to False.
+
+        Returns:
+            list[BulkResult]: The outcome of every resource, in the same order.
+
+        Raises:
+            ValueError: A resource cannot be updated, e.g. a disk.
+            BulkError: A resource failed and `fail_fast` is set.
+        """
+        from rapyuta_io_sdk_v2.bulk import run_stages_async, update_stages
+
+        stages = update_stages(self, resources, kwargs)
+        return await run_stages_async(stages, concurrency, fail_fast)
+
+    async def delete_many(
+        self,
+        resources: Sequence[Any],
+        concurrency: int = 8,
+        fail_fast: bool = False,
+        timeout: float = 300.0,
+        poll: PollPolicy | None = None,
+        **kwargs,
+    ) -> list[BulkResult]:
+        """Delete resources concurrently, in dependency order.
+
+        Deployments are deleted first, then static routes, networks, disks,
+        secrets and packages, so no resource is deleted while a deployment being
+        deleted still uses it. Every kind is polled until it is gone before the
+        next one is deleted. The resources used by a deployment that cannot be
+        deleted are skipped.
+
+        Args:
+            resources (Sequence): Resources as models, dicts with a ``kind`` or keys
+                such as ``disk:data``. Packages must be passed as resources, since
+                deleting them needs their version.
+            concurrency (int, optional): Maximum number of requests in flight.
+                Defaults to 8.
+            fail_fast (bool, optional): Stop at the first error instead of trying
+                every resource. Defaults to False.
+            timeout (float, optional): Seconds to wait for the resources of a kind
+                to be gone. Defaults to 300.
+            poll (PollPolicy, optional): Polling interval while waiting.
+
+        Returns:
+            list[BulkResult]: The outcome of every resource, in the same order.
+
+        Raises:
+            BulkError: A resource failed and `fail_fast` is set.
+        """
+        from rapyuta_io_sdk_v2.bulk import delete_stages, run_stages_async
+
+        uses: dict[str, list[str] | None] = {}
+        stages = delete_stages(self, resources, kwargs, uses, timeout, poll)
+        return await run_stages_async(stages, concurrency, fail_fast, uses)
@@ -0,0 +1,303 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import threading
+import time
+import typing
+from datetime import datetime
+
+if typing.TYPE_CHECKING:
+    from rapyuta_io_sdk_v2.async_client import AsyncClient
+    from rapyuta_io_sdk_v2.client import Client
+
+# Keys of the expiry in the response of ``get_subject``.
+SUBJECT_EXPIRY_KEYS = ("exp", "expiresAt", "expires_at")
+
+
+def token_expiry(token: str) -> float | None:
+    """Expiry of a JWT from its ``exp`` claim, as a UNIX timestamp.
+
+    The signature is not verified; the claim is only used to schedule refreshes.
+
+    Returns:
+        float | None: The expiry, or None if the token is not a JWT with ``exp``.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except ValueError:
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        return float(exp)
+    return None
+
+
+def subject_expiry(subject: dict) -> float | None:
+    """Expiry of a token from the response of ``get_subject``, if it has one."""
+    for source in (subject, subject.get("data")):
+        if not isinstance(source, dict):
+            continue
+        for key in SUBJECT_EXPIRY_KEYS:
+            value = source.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+            if isinstance(value, str):
+                try:
+                    return datetime.fromisoformat(
+                        value.replace("Z", "+00:00")
+                    ).timestamp()
+                except ValueError:
+                    pass
+    return None
+
+
+class _TokenSchedule:
+    """When to refresh the token of a client; shared by the token managers."""
+
+    def __init__(
+        self,
+        refresh_before: float,
+        check_interval: float,
+        retry_interval: float,
+        lifetime: float | None,
+        on_error: typing.Callable[[Exception], None] | None,
+        clock: typing.Callable[[], float],
+    ) -> None:
+        self.refresh_before = refresh_before
+        self.check_interval = check_interval
+        self.retry_interval = retry_interval
+        self.lifetime = lifetime
+        self.on_error = on_error
+        self.last_error: Exception | None = None
+        self._clock = clock
+        # The last token seen and its expiry.
+        self._expiry: tuple[str, float | None] | None = None
+
+    def _known(self, token: str) -> tuple[bool, float | None]:
+        if self._expiry is not None and self._expiry[0] == token:
+            return True, self._expiry[1]
+        expiry = token_expiry(token)
+        if expiry is not None:
+            self._expiry = (token, expiry)
+            return True, expiry
+        return False, None
+
+    def _learned(self, token: str, subject: dict) -> float | None:
+        expiry = subject_expiry(subject)
+        if expiry is None and self.lifetime is not None:
+            expiry = self._clock() + self.lifetime
+        self._expiry = (token, expiry)
+        return expiry
+
+    def _delay(self, expiry: float | None) -> float | None:
+        if expiry is None:
+            return None
+        return max(0.0, expiry - self.refresh_before - self._clock())
+
+    def _wait(self, delay: float | None) -> float:
+        # A delay of 0 after a refresh means the new token is about to expire as
+        # well; back off instead of refreshing in a loop.
+        if delay is None:
+            return self.check_interval
+        if delay == 0:
+            return self.retry_interval
+        return min(delay, self.check_interval)
+
+    def _failed(self, exc: Exception) -> None:
+        self.last_error = exc
+        if self.on_error is not None:
+            self.on_error(exc)
+
+
+class TokenManager(_TokenSchedule):
+    """Refresh the token of a client in the background, shortly before it expires.
+
+    The expiry is read from the ``exp`` claim of the token, or else from
+    ``get_subject``. A background thread refreshes the token `refresh_before`
+    seconds ahead of it, so requests keep using a valid token instead of all
+    failing with UnauthorizedAccessError at once. Tokens set later, e.g. by
+    ``login``, are picked up within `check_interval` seconds.
+
+    Args:
+        client (Client): Client whose ``config.auth_token`` is refreshed.
+        refresh_before (float, optional): Seconds before the expiry to refresh the
+            token. Defaults to 300.
+        check_interval (float, optional): Maximum seconds between checks of the
+            token. Defaults to 60.
+        retry_interval (float, optional): Seconds to wait after a failed refresh.
+            Defaults to 10.
+        lifetime (float, optional): Lifetime assumed for tokens whose expiry cannot
+            be learned. Defaults to never refreshing them.
+        on_error (Callable[[Exception], None], optional): Called with the errors of
+            background refreshes. The manager keeps running.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        refresh_before: float = 300.0,
+        check_interval: float = 60.0,
+        retry_interval: float = 10.0,
+        lifetime: float | None = None,
+        on_error: typing.Callable[[Exception], None] | None = None,
+        clock: typing.Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(
+            refresh_before, check_interval, retry_interval, lifetime, on_error, clock
+        )
+        self.client = client
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def expires_at(self) -> float | None:
+        """Expiry of the current token as a UNIX timestamp, None if unknown."""
+        token = self.client.config.auth_token
+        if not token:
+            return None
+        known, expiry = self._known(token)
+        if known:
+            return expiry
+        return self._learned(token, self.client.get_subject(token))
+
+    def refresh_if_needed(self) -> bool:
+        """Refresh the token if it expires within `refresh_before` seconds.
+
+        Returns:
+            bool: Whether the token was refreshed.
+        """
+        if self._delay(self.expires_at()) != 0:
+            return False
+        self.client.refresh_token()
+        return True
+
+    def start(self) -> TokenManager:
+        """Start refreshing in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="TokenManager", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop refreshing and wait for the thread to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> TokenManager:
+        return self.start()
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.refresh_if_needed()
+                wait = self._wait(self._delay(self.expires_at()))
+            except Exception as exc:
+                self._failed(exc)
+                wait = self.retry_interval
+            self._stopped.wait(wait)
+
+
+class AsyncTokenManager(_TokenSchedule):
+    """Async counterpart of TokenManager, refreshing in an asyncio task.
+
+    Args:
+        client (AsyncClient): Client whose ``config.auth_token`` is refreshed.
+        See TokenManager for the other arguments.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        refresh_before: float = 300.0,
+        check_interval: float = 60.0,
+        retry_interval: float = 10.0,
+        lifetime: float | None = None,
+        on_error: typing.Callable[[Exception], None] | None = None,
+        clock: typing.Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(
+            refresh_before, check_interval, retry_interval, lifetime, on_error, clock
+        )
+        self.client = client
+        self._task: asyncio.Task | None = None
+
+    async def expires_at(self) -> float | None:
+        """Expiry of the current token as a UNIX timestamp, None if unknown."""
+        token = self.client.config.auth_token
+        if not token:
+            return None
+        known, expiry = self._known(token)
+        if known:
+            return expiry
+        return self._learned(token, await self.client.get_subject(token))
+
+    async def refresh_if_needed(self) -> bool:
+        """Refresh the token if it expires within `refresh_before` seconds.
+
+        Returns:
+            bool: Whether the token was refreshed.
+        """
+        if self._delay(await self.expires_at()) != 0:
+            return False
+        await self.client.refresh_token()
+        return True
+
+    def start(self) -> AsyncTokenManager:
+        """Start refreshing in a task of the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return self
+
+    async def stop(self) -> None:
+        """Cancel the refresh task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def __aenter__(self) -> AsyncTokenManager:
+        return self.start()
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        await self.stop()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh_if_needed()
+                wait = self._wait(self._delay(await self.expires_at()))
+            except Exception as exc:
+                self._failed(exc)
+                wait = self.retry_interval
+            await asyncio.sleep(wait)
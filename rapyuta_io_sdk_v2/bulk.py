@@ -0,0 +1,334 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from rapyuta_io_sdk_v2.apply import _to_model, _update_call, resource_key
+from rapyuta_io_sdk_v2.exceptions import BulkError, HttpNotFoundError, WaitTimeoutError
+from rapyuta_io_sdk_v2.wait import PollPolicy
+
+# Resources are deleted one kind at a time in this order, so that deployments are
+# gone before the routes, networks, disks, secrets and packages they use.
+DELETE_ORDER = ("deployment", "staticroute", "network", "disk", "secret", "package")
+
+# Resources for the bulk helpers: models or dicts with a ``kind``. Deletes also
+# take keys, e.g. ``disk:data``.
+Resource = typing.Union[BaseModel, typing.Dict[str, typing.Any]]
+
+
+@dataclass
+class BulkResult:
+    """Outcome of one item of a bulk operation."""
+
+    # Key of the resource, e.g. ``deployment:nginx``.
+    key: str
+    # Value returned by the client method, e.g. the created resource.
+    result: typing.Any = None
+    # Exception raised for the item, if any.
+    error: BaseException | None = None
+    # Whether the item was not attempted because an earlier item failed.
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.skipped
+
+
+# A call is the index of the item, its key and the client call to make; a stage is
+# a list of calls that may run concurrently.
+_Call = typing.Tuple[int, str, typing.Callable[[], typing.Any]]
+
+# Keys of the resources used by each deployment being deleted, or None while they
+# are unknown. Filled in by the delete calls of deployments given as keys.
+_Uses = typing.Dict[str, typing.Optional[typing.List[str]]]
+
+
+def create_stages(
+    client: typing.Any, resources: typing.Sequence[Resource], kwargs: dict
+) -> list[list[_Call]]:
+    calls = []
+    for index, resource in enumerate(resources):
+        model = _to_model(resource)
+        key = resource_key(model)
+        method = getattr(client, f"create_{key.split(':', 1)[0]}")
+        calls.append((index, key, functools.partial(method, model, **kwargs)))
+    return [calls]
+
+
+def update_stages(
+    client: typing.Any, resources: typing.Sequence[Resource], kwargs: dict
+) -> list[list[_Call]]:
+    calls = []
+    for index, resource in enumerate(resources):
+        model = _to_model(resource)
+        key = resource_key(model)
+        prefix, name = key.split(":", 1)
+        method, args = _update_call(model, prefix, name)
+        calls.append(
+            (index, key, functools.partial(getattr(client, method), *args, **kwargs))
+        )
+    return [calls]
+
+
+def delete_stages(
+    client: typing.Any,
+    items: typing.Sequence[Resource | str],
+    kwargs: dict,
+    uses: _Uses | None = None,
+    timeout: float = 300.0,
+    poll: PollPolicy | None = None,
+) -> list[list[_Call]]:
+    """Calls deleting the items, one stage per kind in DELETE_ORDER.
+
+    The deletes of every stage but the last wait until the resources are gone, so
+    the next stage does not delete resources still in use. The resources used by
+    the deployments are recorded in `uses`, for ``run_stages`` to skip them when
+    a deployment cannot be deleted.
+    """
+    uses = {} if uses is None else uses
+    stages: dict[str, list[_Call]] = {prefix: [] for prefix in DELETE_ORDER}
+    models: dict[int, BaseModel] = {}
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            prefix, _, name = item.partition(":")
+            if prefix == "package":
+                raise ValueError(f"cannot delete {item}, pass the package to delete")
+            if prefix not in stages or not name:
+                raise ValueError(
+                    f"invalid key {item!r}, expected <kind>:<name> with kind one of "
+                    f"{', '.join(DELETE_ORDER)}"
+                )
+            args: tuple = (name,)
+        else:
+            model = _to_model(item)
+            prefix, name = resource_key(model).split(":", 1)
+            args = (name,)
+            if prefix == "package":
+                args = (name, model.metadata.version)
+            models[index] = model
+
+        method = getattr(client, f"delete_{prefix}")
+        stages[prefix].append(
+            (index, f"{prefix}:{name}", functools.partial(method, *args, **kwargs))
+        )
+
+    ordered = [stage for stage in stages.values() if stage]
+    for stage in ordered[:-1]:
+        for position, (index, key, func) in enumerate(stage):
+            # Deployments given as keys are fetched before they are deleted, to
+            # learn what they use.
+            record = None
+            if key.startswith("deployment:"):
+                if index in models:
+                    uses[key] = models[index].list_dependencies()
+                else:
+                    uses[key] = None
+                    record = uses
+            wait = (
+                _delete_and_wait_async
+                if asyncio.iscoroutinefunction(func.func)
+                else _delete_and_wait
+            )
+            call = functools.partial(wait, client, key, func, kwargs, record, timeout, poll)
+            stage[position] = (index, key, call)
+    return ordered
+
+
+def _delete_and_wait(
+    client: typing.Any,
+    key: str,
+    delete: typing.Callable[[], typing.Any],
+    kwargs: dict,
+    uses: _Uses | None,
+    timeout: float,
+    poll: PollPolicy | None,
+) -> typing.Any:
+    """Delete a resource and wait until it is gone, recording what it uses."""
+    prefix, name = key.split(":", 1)
+    get = getattr(client, f"get_{prefix}")
+    if uses is not None:
+        try:
+            deployment = get(name, **{**kwargs, "response_mode": "model"})
+            uses[key] = deployment.list_dependencies()
+        except HttpNotFoundError:
+            uses[key] = []
+
+    result = delete()
+    deadline = time.monotonic() + timeout
+    for interval in (poll or PollPolicy()).intervals():
+        try:
+            get(name, **{**kwargs, "response_mode": "raw"})
+        except HttpNotFoundError:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise WaitTimeoutError(
+                f"timed out waiting for {key} to be deleted", pending=[key]
+            )
+        time.sleep(min(interval, remaining))
+
+
+async def _delete_and_wait_async(
+    client: typing.Any,
+    key: str,
+    delete: typing.Callable[[], typing.Any],
+    kwargs: dict,
+    uses: _Uses | None,
+    timeout: float,
+    poll: PollPolicy | None,
+) -> typing.Any:
+    """Async counterpart of ``_delete_and_wait``."""
+    prefix, name = key.split(":", 1)
+    get = getattr(client, f"get_{prefix}")
+    if uses is not None:
+        try:
+            deployment = await get(name, **{**kwargs, "response_mode": "model"})
+            uses[key] = deployment.list_dependencies()
+        except HttpNotFoundError:
+            uses[key] = []
+
+    result = await delete()
+    deadline = time.monotonic() + timeout
+    for interval in (poll or PollPolicy()).intervals():
+        try:
+            await get(name, **{**kwargs, "response_mode": "raw"})
+        except HttpNotFoundError:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise WaitTimeoutError(
+                f"timed out waiting for {key} to be deleted", pending=[key]
+            )
+        await asyncio.sleep(min(interval, remaining))
+
+
+def _blocked(
+    results: list[BulkResult], stage: list[_Call], uses: _Uses | None
+) -> set[str] | None:
+    """Keys used by the deployments of a stage that failed, None if unknown."""
+    blocked: set[str] = set()
+    for index, key, _ in stage:
+        if results[index].ok or uses is None or key not in uses:
+            continue
+        if uses[key] is None:
+            return None
+        blocked.update(uses[key])
+    return blocked
+
+
+def run_stages(
+    stages: list[list[_Call]],
+    concurrency: int = 8,
+    fail_fast: bool = False,
+    uses: _Uses | None = None,
+) -> list[BulkResult]:
+    """Make the calls of each stage on a thread pool, one stage after the other.
+
+    Args:
+        stages (list[list[_Call]]): Calls to make, see ``create_stages``.
+        concurrency (int, optional): Maximum number of calls in flight.
+        fail_fast (bool, optional): Stop at the first error instead of collecting
+            the errors of all the items.
+        uses (dict, optional): Resources used by the deployments, see
+            ``delete_stages``. The resources used by a deployment that failed are
+            skipped in the later stages, all of them if they are unknown.
+
+    Returns:
+        list[BulkResult]: The outcomes in the order of the items.
+
+    Raises:
+        BulkError: An item failed and `fail_fast` is set. The items not attempted are
+            marked as skipped in the `results` attribute.
+    """
+    results: list[BulkResult] = [None] * sum(len(stage) for stage in stages)
+    stop = threading.Event()
+    blocked: set[str] | None = set()
+
+    def run(call: _Call) -> None:
+        index, key, func = call
+        if stop.is_set() or blocked is None or key in blocked:
+            results[index] = BulkResult(key, skipped=True)
+            return
+        try:
+            results[index] = BulkResult(key, result=func())
+        except Exception as exc:
+            results[index] = BulkResult(key, error=exc)
+            if fail_fast:
+                stop.set()
+
+    context = contextvars.copy_context()
+
+    def run_in_context(call: _Call) -> None:
+        # Every call runs in its own copy of the caller's context, to keep its scope.
+        context.copy().run(run, call)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for stage in stages:
+            list(executor.map(run_in_context, stage))
+            failed = _blocked(results, stage, uses)
+            blocked = None if failed is None or blocked is None else blocked | failed
+
+    if stop.is_set():
+        raise _bulk_error(results)
+    return results
+
+
+async def run_stages_async(
+    stages: list[list[_Call]],
+    concurrency: int = 8,
+    fail_fast: bool = False,
+    uses: _Uses | None = None,
+) -> list[BulkResult]:
+    """Async counterpart of ``run_stages``, bounded by a semaphore."""
+    results: list[BulkResult] = [None] * sum(len(stage) for stage in stages)
+    semaphore = asyncio.Semaphore(concurrency)
+    stop = asyncio.Event()
+    blocked: set[str] | None = set()
+
+    async def run(call: _Call) -> None:
+        index, key, func = call
+        async with semaphore:
+            if stop.is_set() or blocked is None or key in blocked:
+                results[index] = BulkResult(key, skipped=True)
+                return
+            try:
+                results[index] = BulkResult(key, result=await func())
+            except Exception as exc:
+                results[index] = BulkResult(key, error=exc)
+                if fail_fast:
+                    stop.set()
+
+    for stage in stages:
+        await asyncio.gather(*(run(call) for call in stage))
+        failed = _blocked(results, stage, uses)
+        blocked = None if failed is None or blocked is None else blocked | failed
+
+    if stop.is_set():
+        raise _bulk_error(results)
+    return results
+
+
+def _bulk_error(results: list[BulkResult]) -> BulkError:
+    failed = [result.key for result in results if result.error is not None]
+    return BulkError(f"bulk operation failed for {', '.join(failed)}", results=results)
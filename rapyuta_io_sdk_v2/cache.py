@@ -0,0 +1,681 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+import typing
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import quote
+
+import httpx
+
+from rapyuta_io_sdk_v2.constants import APP_NAME
+from rapyuta_io_sdk_v2.utils import get_default_app_dir
+
+# Headers selecting the organization, project, group or user a request is made
+# for. Responses are cached separately for each combination.
+SCOPE_HEADERS = ("organizationguid", "project", "groupguid", "userguid")
+
+# Collections of read-mostly resources cached by default. Deployments, devices and
+# the like change state while they are polled, so they are only cached when a TTL
+# is set for them in ``ttls``.
+CACHED_RESOURCES = ("packages", "projects", "organizations", "secrets", "networks")
+
+# The cached body is stored decoded, so headers describing the wire encoding
+# must not be replayed with it.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# Request extension marking streamed requests, e.g. ``stream_deployment_logs``.
+# Their body is consumed incrementally by the caller, so it is never buffered or
+# cached by the transports.
+STREAM_EXTENSION = "rapyuta_io_sdk_v2.stream"
+
+
+def is_streamed(request: httpx.Request) -> bool:
+    return bool(request.extensions.get(STREAM_EXTENSION))
+
+
+@dataclass
+class CacheStats:
+    """Counters of a ResponseCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    prefix: tuple[str, str]
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+
+def _credentials(request: httpx.Request) -> str | None:
+    """Digest of the credentials of a request, so that responses are only served
+    back to the user they were fetched for."""
+    authorization = request.headers.get("authorization")
+    if authorization is None:
+        return None
+    return hashlib.sha256(authorization.encode()).hexdigest()
+
+
+def _resource(path: str) -> str:
+    """Collection a path belongs to, e.g. ``/v2/packages/`` for ``/v2/packages/x/``."""
+    segments = [segment for segment in path.split("/") if segment]
+    return "/" + "/".join(segments[:2]) + "/"
+
+
+def _prefix(request: httpx.Request) -> tuple[str, str]:
+    return (request.url.host, _resource(request.url.path))
+
+
+class ResponseCache:
+    """In-memory TTL/LRU cache for GET responses.
+
+    Successful GET responses are cached per method, path, query parameters,
+    organization/project headers and credentials. Streamed responses, e.g. deployment logs, are
+    never cached. Any other request sent through a client using
+    the cache invalidates the cached responses of the same resource, e.g. an
+    ``update_package`` call drops cached ``get_package`` and ``list_packages``
+    responses.
+
+    Only packages, projects, organizations, secrets and networks are cached by
+    default, so polling e.g. ``get_deployment`` always sees the current state.
+
+    A cache can be shared by several clients, which then see each other's writes.
+    Clients authenticated as different users never see each other's responses,
+    and responses cached with a token are not reused once it is refreshed.
+
+    Args:
+        ttl (float, optional): Seconds a response stays fresh. Defaults to 30.
+        maxsize (int, optional): Maximum number of cached responses. The least
+            recently used response is evicted first. Defaults to 1024.
+        ttls (dict[str, float], optional): TTL per resource, keyed by a path
+            segment such as ``packages`` or ``projects``. A TTL of 0 disables
+            caching for the resource, any other TTL enables it.
+        resources (Sequence[str], optional): Resources cached with ``ttl``, keyed
+            by their collection, e.g. ``packages``. Defaults to CACHED_RESOURCES.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        maxsize: int = 1024,
+        ttls: dict[str, float] | None = None,
+        resources: typing.Sequence[str] = CACHED_RESOURCES,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.ttls = dict(ttls or {})
+        self.resources = frozenset(resources)
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        # Invalidations per (host, collection), so that a GET answered before a
+        # concurrent write is not cached after the write invalidated the cache.
+        self._generations: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self, request: httpx.Request) -> int:
+        """Invalidation count of the resource of the request; pass it to ``put``."""
+        with self._lock:
+            return self._generations.get(_prefix(request), 0)
+
+    def ttl_for(self, request: httpx.Request) -> float:
+        if self.ttls:
+            for segment in request.url.path.split("/"):
+                if segment in self.ttls:
+                    return self.ttls[segment]
+        segments = [segment for segment in request.url.path.split("/") if segment]
+        if len(segments) > 1 and segments[1] in self.resources:
+            return self.ttl
+        return 0.0
+
+    @staticmethod
+    def key(request: httpx.Request) -> tuple:
+        return (
+            request.method,
+            request.url.host,
+            request.url.path,
+            tuple(sorted(request.url.params.multi_items())),
+            tuple(request.headers.get(header) for header in SCOPE_HEADERS),
+            _credentials(request),
+        )
+
+    def get(self, request: httpx.Request) -> httpx.Response | None:
+        """Cached response for the request, or None on a miss."""
+        if self.ttl_for(request) <= 0:
+            return None
+
+        key = self.key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+
+        return httpx.Response(
+            status_code=entry.status_code,
+            headers=entry.headers,
+            content=entry.content,
+            request=request,
+        )
+
+    def put(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        generation: int | None = None,
+    ) -> None:
+        """Cache a response whose body has been read.
+
+        Args:
+            generation (int, optional): ``generation`` of the request taken before
+                it was sent. The response is not cached if the resource has been
+                invalidated since.
+        """
+        ttl = self.ttl_for(request)
+        if ttl <= 0 or response.status_code != httpx.codes.OK:
+            return
+
+        entry = _Entry(
+            expires_at=self._clock() + ttl,
+            prefix=_prefix(request),
+            status_code=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in _WIRE_HEADERS
+            ],
+            content=response.content,
+        )
+        key = self.key(request)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(
+                entry.prefix, 0
+            ):
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, request: httpx.Request) -> None:
+        """Drop the cached responses of the resource a write request targets."""
+        prefix = _prefix(request)
+        with self._lock:
+            self._generations[prefix] = self._generations.get(prefix, 0) + 1
+            stale = [
+                key for key, entry in self._entries.items() if entry.prefix == prefix
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.stats.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Transport serving GET requests from a ResponseCache."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache) -> None:
+        self.transport = transport
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if is_streamed(request):
+            return self.transport.handle_request(request)
+        if request.method != "GET":
+            try:
+                return self.transport.handle_request(request)
+            finally:
+                self.cache.invalidate(request)
+
+        response = self.cache.get(request)
+        if response is not None:
+            return response
+
+        generation = self.cache.generation(request)
+        response = self.transport.handle_request(request)
+        if response.status_code == httpx.codes.OK:
+            response.read()
+            self.cache.put(request, response, generation)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Async transport serving GET requests from a ResponseCache."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache) -> None:
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if is_streamed(request):
+            return await self.transport.handle_async_request(request)
+        if request.method != "GET":
+            try:
+                return await self.transport.handle_async_request(request)
+            finally:
+                self.cache.invalidate(request)
+
+        response = self.cache.get(request)
+        if response is not None:
+            return response
+
+        generation = self.cache.generation(request)
+        response = await self.transport.handle_async_request(request)
+        if response.status_code == httpx.codes.OK:
+            await response.aread()
+            self.cache.put(request, response, generation)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+# Response extension holding the models already parsed from a revalidated body,
+# keyed by (model, response mode). See ``response.parse_response``.
+PARSED_EXTENSION = "rapyuta_io_sdk_v2.parsed"
+
+
+@dataclass
+class _Validated:
+    etag: str | None
+    last_modified: str | None
+    headers: list[tuple[str, str]]
+    content: bytes
+    parsed: dict[tuple, typing.Any]
+
+
+class ConditionalCache:
+    """Validators of GET responses for conditional requests.
+
+    The ``ETag`` and ``Last-Modified`` headers of successful GET responses are
+    stored with the body, per URL, organization/project headers and credentials. The next GET
+    of the same URL sends ``If-None-Match``/``If-Modified-Since`` and, when the
+    server answers ``304 Not Modified``, the stored body is replayed without being
+    downloaded again. The model parsed from the body is kept as well, so polling
+    an unchanged resource returns the same model instance without re-validating it;
+    copy it before modifying it.
+
+    Unlike ResponseCache, every call still reaches the server, so responses are
+    never stale. Streamed responses, e.g. deployment logs, are not stored.
+
+    Args:
+        maxsize (int, optional): Maximum number of stored responses. The least
+            recently used response is evicted first. Defaults to 1024.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple, _Validated] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def prepare(self, request: httpx.Request) -> _Validated | None:
+        """Add the stored validators to the request, returning their entry."""
+        if request.method != "GET" or any(
+            header in request.headers for header in ("if-none-match", "if-modified-since")
+        ):
+            return None
+
+        key = ResponseCache.key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            return None
+
+        if entry.etag is not None:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            request.headers["If-Modified-Since"] = entry.last_modified
+        return entry
+
+    def resolve(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        entry: _Validated | None,
+    ) -> httpx.Response:
+        """Replay the entry on 304, or store the validators of a fresh response.
+
+        The body of a 200 response must have been read.
+        """
+        if entry is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            with self._lock:
+                self.stats.hits += 1
+            return httpx.Response(
+                status_code=httpx.codes.OK,
+                headers=entry.headers,
+                content=entry.content,
+                request=request,
+                extensions={PARSED_EXTENSION: entry.parsed},
+            )
+
+        if request.method != "GET" or response.status_code != httpx.codes.OK:
+            return response
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            self.stats.misses += 1
+        if etag is None and last_modified is None:
+            return response
+
+        fresh = _Validated(
+            etag=etag,
+            last_modified=last_modified,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in _WIRE_HEADERS
+            ],
+            content=response.content,
+            parsed={},
+        )
+        key = ResponseCache.key(request)
+        with self._lock:
+            self._entries[key] = fresh
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        response.extensions[PARSED_EXTENSION] = fresh.parsed
+        return response
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ConditionalTransport(httpx.BaseTransport):
+    """Transport revalidating GET requests with a ConditionalCache."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ConditionalCache) -> None:
+        self.transport = transport
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if is_streamed(request):
+            return self.transport.handle_request(request)
+        entry = self.cache.prepare(request)
+        response = self.transport.handle_request(request)
+        if response.status_code in (httpx.codes.OK, httpx.codes.NOT_MODIFIED):
+            response.read()
+        return self.cache.resolve(request, response, entry)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncConditionalTransport(httpx.AsyncBaseTransport):
+    """Async transport revalidating GET requests with a ConditionalCache."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, cache: ConditionalCache
+    ) -> None:
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if is_streamed(request):
+            return await self.transport.handle_async_request(request)
+        entry = self.cache.prepare(request)
+        response = await self.transport.handle_async_request(request)
+        if response.status_code in (httpx.codes.OK, httpx.codes.NOT_MODIFIED):
+            await response.aread()
+        return self.cache.resolve(request, response, entry)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class PackageCache:
+    """Cache of published package versions.
+
+    A package version cannot change once it is published, so cached versions
+    never expire. ``get_package`` calls with a version are served from the cache
+    after the first request, and ``delete_package`` removes the deleted version
+    (or all versions, when called without one).
+
+    Packages are cached in memory per API host, organization, project and
+    credentials, so a version is only served back to the user it was fetched for.
+    Deleting a version removes it for all credentials.
+
+    With ``persist=True`` they are also written to disk and survive restarts of
+    the process, e.g. across CI pipeline runs. On disk they are kept per API host,
+    organization and project only, so that they are still found after the token
+    is rotated, and are served to any credentials of that project. The files are
+    stored at ``<path>/<digest of the scope>/<package>/<version>.json``, readable
+    only by the current OS user. Remove them with ``clear``, or by deleting
+    ``path``.
+
+    Args:
+        persist (bool, optional): Keep the cached packages on disk. Defaults to False.
+        path (str, optional): Directory of the on-disk cache. Defaults to
+            ``cache/packages`` in the rio-cli application directory.
+    """
+
+    def __init__(self, persist: bool = False, path: str | None = None) -> None:
+        self.persist = persist
+        self.path = path or os.path.join(
+            get_default_app_dir(APP_NAME), "cache", "packages"
+        )
+        self.stats = CacheStats()
+        self._entries: dict[tuple, bytes] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def match(request: httpx.Request) -> tuple[tuple, str] | None:
+        """Split a request for a single package into (scope, name), or None."""
+        segments = [segment for segment in request.url.path.split("/") if segment]
+        if len(segments) != 3 or segments[:2] != ["v2", "packages"]:
+            return None
+        scope = (
+            request.url.host,
+            request.headers.get("organizationguid"),
+            request.headers.get("project"),
+            _credentials(request),
+        )
+        return scope, segments[2]
+
+    def get(self, scope: tuple, name: str, version: str) -> bytes | None:
+        key = (scope, name, version)
+        with self._lock:
+            content = self._entries.get(key)
+        if content is None and self.persist:
+            try:
+                with open(self._file(scope, name, version), "rb") as f:
+                    content = f.read()
+            except OSError:
+                content = None
+            if content is not None:
+                with self._lock:
+                    self._entries[key] = content
+
+        with self._lock:
+            if content is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return content
+
+    def put(self, scope: tuple, name: str, version: str, content: bytes) -> None:
+        with self._lock:
+            self._entries[(scope, name, version)] = content
+        if self.persist:
+            path = self._file(scope, name, version)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see a
+            # partially written package.
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+    def discard(self, scope: tuple, name: str, version: str | None = None) -> None:
+        """Remove a cached version, or all versions of the package, for all
+        credentials."""
+        namespace = scope[:-1]
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[0][:-1] == namespace
+                and key[1] == name
+                and version in (None, key[2])
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.stats.invalidations += len(stale)
+
+        if self.persist:
+            if version is None:
+                shutil.rmtree(self._dir(scope, name), ignore_errors=True)
+            else:
+                try:
+                    os.unlink(self._file(scope, name, version))
+                except FileNotFoundError:
+                    pass
+
+    def clear(self) -> None:
+        """Remove all cached packages, including the on-disk cache."""
+        with self._lock:
+            self._entries.clear()
+        if self.persist:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def _dir(self, scope: tuple, name: str) -> str:
+        # The credentials are left out, see the class docstring.
+        digest = hashlib.sha256(repr(scope[:-1]).encode()).hexdigest()[:32]
+        return os.path.join(self.path, digest, quote(name, safe=""))
+
+    def _file(self, scope: tuple, name: str, version: str) -> str:
+        return os.path.join(self._dir(scope, name), quote(version, safe="") + ".json")
+
+
+class PackageCacheTransport(httpx.BaseTransport):
+    """Transport serving versioned ``get_package`` requests from a PackageCache."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: PackageCache) -> None:
+        self.transport = transport
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        match = self.cache.match(request)
+        version = request.url.params.get("version")
+        if match is None or request.method not in ("GET", "DELETE"):
+            return self.transport.handle_request(request)
+
+        if request.method == "DELETE":
+            response = self.transport.handle_request(request)
+            if response.status_code < 400:
+                self.cache.discard(*match, version or None)
+            return response
+
+        if not version:
+            return self.transport.handle_request(request)
+
+        content = self.cache.get(*match, version)
+        if content is not None:
+            return _cached_package(request, content)
+
+        response = self.transport.handle_request(request)
+        if response.status_code == httpx.codes.OK:
+            self.cache.put(*match, version, response.read())
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncPackageCacheTransport(httpx.AsyncBaseTransport):
+    """Async transport serving versioned ``get_package`` requests from a PackageCache."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: PackageCache) -> None:
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        match = self.cache.match(request)
+        version = request.url.params.get("version")
+        if match is None or request.method not in ("GET", "DELETE"):
+            return await self.transport.handle_async_request(request)
+
+        if request.method == "DELETE":
+            response = await self.transport.handle_async_request(request)
+            if response.status_code < 400:
+                self.cache.discard(*match, version or None)
+            return response
+
+        if not version:
+            return await self.transport.handle_async_request(request)
+
+        content = self.cache.get(*match, version)
+        if content is not None:
+            return _cached_package(request, content)
+
+        response = await self.transport.handle_async_request(request)
+        if response.status_code == httpx.codes.OK:
+            self.cache.put(*match, version, await response.aread())
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def _cached_package(request: httpx.Request, content: bytes) -> httpx.Response:
+    return httpx.Response(
+        status_code=httpx.codes.OK,
+        headers={"Content-Type": "application/json"},
+        content=content,
+        request=request,
+    )
@@ -15,12 +15,21 @@
 from __future__ import annotations
 
 import platform
-from typing import Any
+import time
+import typing
+from typing import Any, ContextManager, Iterator, Sequence
 
 import httpx
-from yaml import safe_load
 
-from rapyuta_io_sdk_v2.config import Configuration
+from rapyuta_io_sdk_v2.cache import (
+    STREAM_EXTENSION,
+    ConditionalCache,
+    PackageCache,
+    ResponseCache,
+)
+from rapyuta_io_sdk_v2.codec import CodecClient, JSONCodec, default_codec
+from rapyuta_io_sdk_v2.config import Configuration, scope
+from rapyuta_io_sdk_v2.exceptions import WaitTimeoutError
 from rapyuta_io_sdk_v2.models import (
     Secret,
     SecretCreate,
@@ -71,7 +80,20 @@ from rapyuta_io_sdk_v2.models.sshkey import (
     SSHKeySignRequest,
     SSHKeySignResponse,
 )
-from rapyuta_io_sdk_v2.utils import handle_server_errors
+from rapyuta_io_sdk_v2.ratelimit import RateLimiter
+from rapyuta_io_sdk_v2.response import (
+    M,
+    ResponseMode,
+    check_response_mode,
+    parse_response,
+)
+from rapyuta_io_sdk_v2.retry import RetryPolicy
+from rapyuta_io_sdk_v2.transport import ConnectionPool, build_transport
+from rapyuta_io_sdk_v2.utils import handle_server_errors, walk_items
+from rapyuta_io_sdk_v2.wait import FAILED_PHASES, PollPolicy, deployment_ready
+
+if typing.TYPE_CHECKING:
+    from rapyuta_io_sdk_v2.bulk import BulkResult
 
 
 class Client:
@@ -79,18 +101,72 @@ class Client:
 
     Args:
         config (Configuration): Configuration object.
+        pool (ConnectionPool, optional): Connection pool to send requests through.
+            A pool can be shared by many clients. Defaults to a private pool.
+        retry (RetryPolicy, optional): Retry transient server and connection errors
+            with exponential backoff. Defaults to no retries.
+        rate_limiter (RateLimiter, optional): Client-side rate limiter. A limiter can
+            be shared by many clients. Defaults to no rate limiting.
+        cache (ResponseCache, optional): Cache for GET responses, invalidated by the
+            writes made through the client. Defaults to no caching.
+        package_cache (PackageCache, optional): Cache for published package versions,
+            which never expire. Defaults to no caching.
+        conditional_cache (ConditionalCache, optional): Send conditional GET
+            requests, replaying the stored response and model on 304 Not Modified.
+            Defaults to unconditional requests.
+        single_flight (bool, optional): Send identical GET requests made by
+            concurrent threads once and share the response, or the exception, between
+            them. Requests with different request IDs are not shared. Defaults to
+            False.
+        response_mode (str, optional): How responses are decoded: "model" validates
+            them into models, "raw" returns plain dicts, "construct" builds the
+            top-level model without validation, leaving nested objects as dicts,
+            and "lazy" returns list responses as LazyList, whose items are
+            validated on access. "raw" and "construct" cost about a third of
+            "model" for large lists, mostly JSON decoding; see
+            benchmarks/response_modes.py. Methods also accept a `response_mode`
+            keyword to override it per call. Defaults to "model".
+        codec (JSONCodec, optional): JSON codec for request and response bodies.
+            Defaults to orjson when it is installed, the standard library otherwise.
         **kwargs: Additional keyword arguments.
     """
 
-    def __init__(self, config: Configuration | None = None, **kwargs) -> None:
+    def __init__(
+        self,
+        config: Configuration | None = None,
+        pool: ConnectionPool | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        package_cache: PackageCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        single_flight: bool = False,
+        response_mode: ResponseMode = "model",
+        codec: JSONCodec | None = None,
+        **kwargs,
+    ) -> None:
         self.config = config or Configuration()
+        # A pool created here is private to the client and closed with it.
+        self.owns_pool = pool is None
+        self.pool = pool or ConnectionPool()
+        self.cache = cache
+        self.package_cache = package_cache
+        self.conditional_cache = conditional_cache
+        self.response_mode = check_response_mode(response_mode)
+        self.codec = codec or default_codec()
         timeout = kwargs.get("timeout", 60)
-        self.c = httpx.Client(
+        self.c = CodecClient(
             timeout=timeout,
-            limits=httpx.Limits(
-                max_keepalive_connections=5,
-                max_connections=5,
-                keepalive_expiry=30,
+            codec=self.codec,
+            transport=build_transport(
+                self.pool,
+                retry=retry,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                package_cache=package_cache,
+                conditional_cache=conditional_cache,
+                single_flight=single_flight,
+                owns_pool=self.owns_pool,
             ),
             headers={
                 "User-Agent": (
@@ -101,6 +177,24 @@ class Client:
         self.v2api_host = self.config.hosts.get("v2api_host")
         self.rip_host = self.config.hosts.get("rip_host")
 
+    def _parse(self, result: httpx.Response, model: type[M], mode: str | None = None):
+        """Decode a successful response into `model` using the response mode."""
+        return parse_response(result, model, mode or self.response_mode, self.codec)
+
+    def close(self) -> None:
+        """Close the client's connections.
+
+        A private pool is closed with the client, a pool passed to it stays open
+        for the other clients sharing it.
+        """
+        self.c.close()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
     def get_auth_token(self, email: str, password: str) -> str:
         """Get the authentication token for the user.
 
@@ -120,7 +214,7 @@ class Client:
             },
         )
         handle_server_errors(result)
-        return result.json()["data"].get("token")
+        return self.codec.loads(result.content)["data"].get("token")
 
     def get_subject(self, auth_token: str) -> dict:
         """Get subject(user or service account) from auth token.
@@ -135,7 +229,7 @@ class Client:
 
         handle_server_errors(result)
 
-        return result.json()
+        return self.codec.loads(result.content)
 
     def login(self, email: str, password: str) -> None:
         """Get the authentication token for the user.
@@ -191,8 +285,8 @@ class Client:
         )
         handle_server_errors(result)
         if set_token:
-            self.config.auth_token = result.json()["data"].get("token")
-        return result.json()["data"].get("token")
+            self.config.auth_token = self.codec.loads(result.content)["data"].get("token")
+        return self.codec.loads(result.content)["data"].get("token")
 
     def set_organization(self, organization_guid: str) -> None:
         """Set the organization GUID.
@@ -210,6 +304,28 @@ class Client:
         """
         self.config.set_project(project_guid)
 
+    def scope(
+        self,
+        organization_guid: str | None = None,
+        project_guid: str | None = None,
+        request_id: str | None = None,
+    ) -> ContextManager[None]:
+        """Override the organization, project and request ID in the current context.
+
+        Unlike ``set_project``, the override only applies to requests made in the
+        ``with`` block by the current thread or task, so one client can serve many
+        projects concurrently. It applies to every client used in the block.
+
+        Args:
+            organization_guid (str, optional): Organization GUID to use.
+            project_guid (str, optional): Project GUID to use.
+            request_id (str, optional): X-Request-ID sent with the requests.
+
+        Returns:
+            ContextManager: Use with ``with``.
+        """
+        return scope(organization_guid, project_guid, request_id)
+
     # -----------------Organization----------------
     def get_organization(
         self, organization_guid: str | None = None, **kwargs
@@ -225,7 +341,7 @@ class Client:
         Returns:
             Organization: Organization details as an Organization object.
         """
-        organization_guid = organization_guid or self.config.organization_guid
+        organization_guid = organization_guid or self.config.scoped_organization_guid
 
         result = self.c.get(
             url=f"{self.v2api_host}/v2/organizations/{organization_guid}/",
@@ -234,7 +350,7 @@ class Client:
             ),
         )
         handle_server_errors(result)
-        return Organization(**result.json())
+        return self._parse(result, Organization, kwargs.get("response_mode"))
 
     def update_organization(
         self,
@@ -263,7 +379,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Organization(**result.json())
+        return self._parse(result, Organization, kwargs.get("response_mode"))
 
     # ---------------------User--------------------
     def list_users(
@@ -291,7 +407,26 @@ class Client:
 
         handle_server_errors(result)
 
-        return UserList(**result.json())
+        return self._parse(result, UserList, kwargs.get("response_mode"))
+
+    def iter_users(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[User]:
+        """Iterate over all users, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_users`.
+
+        Yields:
+            User: Each user.
+        """
+        return walk_items(self.list_users, limit=limit, prefetch=prefetch, **kwargs)
 
     def add_user(self, user: User | dict, **kwargs) -> User:
         """Add a User in Organization.
@@ -309,7 +444,7 @@ class Client:
 
         handle_server_errors(result)
 
-        return UserList(**result.json())
+        return self._parse(result, UserList, kwargs.get("response_mode"))
 
     def get_myself(self, **kwargs) -> User:
         """Get my User details.
@@ -324,7 +459,7 @@ class Client:
             ),
         )
         handle_server_errors(result)
-        return User(**result.json())
+        return self._parse(result, User, kwargs.get("response_mode"))
 
     def update_myself(self, body: User | dict[str, Any], **kwargs) -> User:
         """Update my user details.
@@ -346,7 +481,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return User(**result.json())
+        return self._parse(result, User, kwargs.get("response_mode"))
 
     def get_user(self, email_id: str, **kwargs) -> User:
         """Get User details.
@@ -359,7 +494,7 @@ class Client:
             headers=self.config.get_headers(with_project=False, **kwargs),
         )
         handle_server_errors(result)
-        return User(**result.json())
+        return self._parse(result, User, kwargs.get("response_mode"))
 
     def update_user(self, email_id: str, body: User | dict[str, Any], **kwargs) -> User:
         """Update the user details.
@@ -379,7 +514,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return User(**result.json())
+        return self._parse(result, User, kwargs.get("response_mode"))
 
     def delete_user(self, email_id: str, **kwargs):
         """
@@ -408,21 +543,23 @@ class Client:
         Returns:
             UserPermissions: User permissions object containing organization, projects, and groups permissions
         """
-        organization_guid = organization_guid or self.config.organization_guid
+        organization_guid = organization_guid or self.config.scoped_organization_guid
 
-        headers = self.config.get_headers(
-            with_project=False,
-            organization_guid=organization_guid,
-            **kwargs,
-        )
-        headers["userguid"] = user_guid
+        headers = {
+            **self.config.get_headers(
+                with_project=False,
+                organization_guid=organization_guid,
+                **kwargs,
+            ),
+            "userguid": user_guid,
+        }
 
         result = self.c.get(
             url=f"{self.v2api_host}/v2/users/permissions/",
             headers=headers,
         )
         handle_server_errors(result)
-        return UserPermissions(**result.json())
+        return self._parse(result, UserPermissions, kwargs.get("response_mode"))
 
     # -------------------Project-------------------
     def get_project(self, project_guid: str | None = None, **kwargs) -> Project:
@@ -441,7 +578,7 @@ class Client:
         Returns:
             Project: Project details as a Project object.
         """
-        project_guid = project_guid or self.config.project_guid
+        project_guid = project_guid or self.config.scoped_project_guid
 
         result = self.c.get(
             url=f"{self.v2api_host}/v2/projects/{project_guid}/",
@@ -450,7 +587,7 @@ class Client:
             ),
         )
         handle_server_errors(result)
-        return Project(**result.json())
+        return self._parse(result, Project, kwargs.get("response_mode"))
 
     def list_projects(
         self,
@@ -495,7 +632,26 @@ class Client:
         )
 
         handle_server_errors(response=result)
-        return ProjectList(**result.json())
+        return self._parse(result, ProjectList, kwargs.get("response_mode"))
+
+    def iter_projects(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[Project]:
+        """Iterate over all projects, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_projects`.
+
+        Yields:
+            Project: Each project.
+        """
+        return walk_items(self.list_projects, limit=limit, prefetch=prefetch, **kwargs)
 
     def create_project(self, body: Project | dict[str, Any], **kwargs) -> Project:
         """Create a new project.
@@ -515,7 +671,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Project(**result.json())
+        return self._parse(result, Project, kwargs.get("response_mode"))
 
     def update_project(
         self, body: Project | dict[str, Any], project_guid: str | None = None, **kwargs
@@ -538,7 +694,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Project(**result.json())
+        return self._parse(result, Project, kwargs.get("response_mode"))
 
     def delete_project(self, project_guid: str, **kwargs) -> None:
         """Delete a project by its GUID.
@@ -567,7 +723,7 @@ class Client:
         Returns:
             Dict[str, Any]: Project owner update result.
         """
-        project_guid = project_guid or self.config.project_guid
+        project_guid = project_guid or self.config.scoped_project_guid
 
         result = self.c.put(
             url=f"{self.v2api_host}/v2/projects/{project_guid}/owner/",
@@ -575,7 +731,7 @@ class Client:
             json=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     # -------------------Package-------------------
     def list_packages(
@@ -610,7 +766,26 @@ class Client:
         )
 
         handle_server_errors(response=result)
-        return PackageList(**result.json())
+        return self._parse(result, PackageList, kwargs.get("response_mode"))
+
+    def iter_packages(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[Package]:
+        """Iterate over all packages, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_packages`.
+
+        Yields:
+            Package: Each package.
+        """
+        return walk_items(self.list_packages, limit=limit, prefetch=prefetch, **kwargs)
 
     def create_package(self, body: Package | dict[str, Any], **kwargs) -> Package:
         """Create a new package.
@@ -631,7 +806,7 @@ class Client:
         )
 
         handle_server_errors(result)
-        return Package(**result.json())
+        return self._parse(result, Package, kwargs.get("response_mode"))
 
     def get_package(self, name: str, version: str | None = None, **kwargs) -> Package:
         """Get a package by its name.
@@ -651,7 +826,7 @@ class Client:
         )
 
         handle_server_errors(response=result)
-        return Package(**result.json())
+        return self._parse(result, Package, kwargs.get("response_mode"))
 
     def delete_package(self, name: str, version: str, **kwargs) -> None:
         """Delete a package by its name.
@@ -728,7 +903,26 @@ class Client:
 
         handle_server_errors(response=result)
 
-        return DeploymentList(**result.json())
+        return self._parse(result, DeploymentList, kwargs.get("response_mode"))
+
+    def iter_deployments(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[Deployment]:
+        """Iterate over all deployments, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_deployments`.
+
+        Yields:
+            Deployment: Each deployment.
+        """
+        return walk_items(self.list_deployments, limit=limit, prefetch=prefetch, **kwargs)
 
     def create_deployment(
         self, body: Deployment | dict[str, Any], **kwargs
@@ -751,7 +945,7 @@ class Client:
         )
 
         handle_server_errors(result)
-        return Deployment(**result.json())
+        return self._parse(result, Deployment, kwargs.get("response_mode"))
 
     def get_deployment(self, name: str, guid: str | None = None, **kwargs) -> Deployment:
         """Get a deployment by its name.
@@ -767,7 +961,7 @@ class Client:
         )
 
         handle_server_errors(result)
-        return Deployment(**result.json())
+        return self._parse(result, Deployment, kwargs.get("response_mode"))
 
     def update_deployment(
         self, body: Deployment | dict[str, Any], **kwargs
@@ -786,7 +980,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Deployment(**result.json())
+        return self._parse(result, Deployment, kwargs.get("response_mode"))
 
     def delete_deployment(self, name: str, **kwargs) -> None:
         """Delete a deployment by its name.
@@ -801,6 +995,106 @@ class Client:
         )
         handle_server_errors(result)
 
+    def wait_for_deployment(
+        self,
+        name: str,
+        phases: Sequence[str] = ("Succeeded",),
+        statuses: Sequence[str] | None = None,
+        timeout: float = 300.0,
+        poll: PollPolicy | None = None,
+        **kwargs,
+    ) -> Deployment:
+        """Wait until a deployment reaches one of the phases.
+
+        The deployment is polled often at first and less often as time passes, see
+        PollPolicy.
+
+        Args:
+            name (str): Deployment name.
+            phases (Sequence[str], optional): Phases to wait for. Defaults to ("Succeeded",).
+            statuses (Sequence[str], optional): Statuses the deployment must also be in,
+                e.g. ("Running",). Defaults to any status.
+            timeout (float, optional): Seconds to wait. Defaults to 300.
+            poll (PollPolicy, optional): Polling intervals. Defaults to PollPolicy().
+
+        Returns:
+            Deployment: The deployment in the awaited phase.
+
+        Raises:
+            DeploymentFailedError: The deployment is FailedToStart or FailedToUpdate.
+            WaitTimeoutError: The deployment did not reach the phases in time.
+        """
+        kwargs["response_mode"] = "model"
+        deadline = time.monotonic() + timeout
+        for interval in (poll or PollPolicy()).intervals():
+            deployment = self.get_deployment(name, **kwargs)
+            if deployment_ready(deployment, phases, statuses):
+                return deployment
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WaitTimeoutError(
+                    f"timed out waiting for deployment {name}", pending=[name]
+                )
+            time.sleep(min(interval, remaining))
+
+    def wait_for_deployments(
+        self,
+        names: Sequence[str],
+        phases: Sequence[str] = ("Succeeded",),
+        statuses: Sequence[str] | None = None,
+        timeout: float = 300.0,
+        poll: PollPolicy | None = None,
+        **kwargs,
+    ) -> dict[str, Deployment]:
+        """Wait until all the deployments reach one of the phases.
+
+        Every poll is a single ``list_deployments`` call for the deployments still
+        pending, filtered by the awaited and the failed phases.
+
+        Args:
+            names (Sequence[str]): Deployment names.
+            phases (Sequence[str], optional): Phases to wait for. Defaults to ("Succeeded",).
+            statuses (Sequence[str], optional): Statuses the deployments must also be
+                in, e.g. ("Running",). Defaults to any status.
+            timeout (float, optional): Seconds to wait. Defaults to 300.
+            poll (PollPolicy, optional): Polling intervals. Defaults to PollPolicy().
+
+        Returns:
+            dict[str, Deployment]: The deployments by name.
+
+        Raises:
+            DeploymentFailedError: A deployment is FailedToStart or FailedToUpdate.
+            WaitTimeoutError: Some deployments did not reach the phases in time. Their
+                names are in the `pending` attribute.
+        """
+        kwargs["response_mode"] = "model"
+        pending = list(dict.fromkeys(names))
+        ready: dict[str, Deployment] = {}
+        deadline = time.monotonic() + timeout
+        for interval in (poll or PollPolicy()).intervals():
+            for deployment in walk_items(
+                self.list_deployments,
+                names=pending,
+                phases=[*phases, *FAILED_PHASES],
+                **kwargs,
+            ):
+                name = deployment.metadata.name
+                if name in pending and deployment_ready(deployment, phases, statuses):
+                    ready[name] = deployment
+
+            pending = [name for name in pending if name not in ready]
+            if not pending:
+                return {name: ready[name] for name in names}
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WaitTimeoutError(
+                    f"timed out waiting for deployments {', '.join(pending)}",
+                    pending=pending,
+                )
+            time.sleep(min(interval, remaining))
+
     def get_deployment_graph(self, name: str, **kwargs) -> dict[str, Any]:
         """Get a deployment graph by its name. [Experimental]
 
@@ -813,7 +1107,7 @@ class Client:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def get_deployment_history(
         self, name: str, guid: str | None = None, **kwargs
@@ -830,12 +1124,17 @@ class Client:
             params={"guid": guid},
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def stream_deployment_logs(self, name: str, executable: str, replica: int = 0):
         url = f"{self.v2api_host}/v2/deployments/{name}/logs/?replica={replica}&executable={executable}"
 
-        with self.c.stream("GET", url=url, headers=self.config.get_headers()) as response:
+        with self.c.stream(
+            "GET",
+            url=url,
+            headers=self.config.get_headers(),
+            extensions={STREAM_EXTENSION: True},
+        ) as response:
             # check status without reading the streaming content
             response.raise_for_status()
 
@@ -881,7 +1180,26 @@ class Client:
             },
         )
         handle_server_errors(result)
-        return DiskList(**result.json())
+        return self._parse(result, DiskList, kwargs.get("response_mode"))
+
+    def iter_disks(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[Disk]:
+        """Iterate over all disks, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_disks`.
+
+        Yields:
+            Disk: Each disk.
+        """
+        return walk_items(self.list_disks, limit=limit, prefetch=prefetch, **kwargs)
 
     def get_disk(self, name: str, **kwargs) -> Disk:
         """Get a disk by its name.
@@ -898,7 +1216,7 @@ class Client:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return Disk(**result.json())
+        return self._parse(result, Disk, kwargs.get("response_mode"))
 
     def create_disk(self, body: Disk | dict[str, Any], **kwargs) -> Disk:
         """Create a new disk.
@@ -915,7 +1233,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Disk(**result.json())
+        return self._parse(result, Disk, kwargs.get("response_mode"))
 
     def delete_disk(self, name: str, **kwargs) -> None:
         """Delete a disk by its name.
@@ -951,7 +1269,7 @@ class Client:
         )
 
         handle_server_errors(response=result)
-        return Daemon(**result.json())
+        return self._parse(result, Daemon)
 
     # -------------------Static Routes-------------------
     def list_staticroutes(
@@ -991,7 +1309,28 @@ class Client:
             },
         )
         handle_server_errors(result)
-        return StaticRouteList(**result.json())
+        return self._parse(result, StaticRouteList, kwargs.get("response_mode"))
+
+    def iter_staticroutes(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[StaticRoute]:
+        """Iterate over all static routes, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_staticroutes`.
+
+        Yields:
+            StaticRoute: Each static route.
+        """
+        return walk_items(
+            self.list_staticroutes, limit=limit, prefetch=prefetch, **kwargs
+        )
 
     def create_staticroute(
         self, body: StaticRoute | dict[str, Any], **kwargs
@@ -1011,7 +1350,7 @@ class Client:
         )
 
         handle_server_errors(result)
-        return StaticRoute(**result.json())
+        return self._parse(result, StaticRoute, kwargs.get("response_mode"))
 
     def get_staticroute(self, name: str, **kwargs) -> StaticRoute:
         """Get a static route by its name.
@@ -1028,7 +1367,7 @@ class Client:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return StaticRoute(**result.json())
+        return self._parse(result, StaticRoute, kwargs.get("response_mode"))
 
     def update_staticroute(
         self, name: str, body: StaticRoute | dict[str, Any], **kwargs
@@ -1052,7 +1391,7 @@ class Client:
         )
 
         handle_server_errors(result)
-        return StaticRoute(**result.json())
+        return self._parse(result, StaticRoute, kwargs.get("response_mode"))
 
     def delete_staticroute(self, name: str, **kwargs) -> None:
         """Delete a static route by its name.
@@ -1118,7 +1457,26 @@ class Client:
         )
 
         handle_server_errors(result)
-        return NetworkList(**result.json())
+        return self._parse(result, NetworkList, kwargs.get("response_mode"))
+
+    def iter_networks(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[Network]:
+        """Iterate over all networks, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_networks`.
+
+        Yields:
+            Network: Each network.
+        """
+        return walk_items(self.list_networks, limit=limit, prefetch=prefetch, **kwargs)
 
     def create_network(self, body: Network | dict[str, Any], **kwargs) -> Network:
         """Create a new network.
@@ -1135,7 +1493,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return Network(**result.json())
+        return self._parse(result, Network, kwargs.get("response_mode"))
 
     def get_network(self, name: str, **kwargs) -> Network:
         """Get a network by its name.
@@ -1152,7 +1510,7 @@ class Client:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return Network(**result.json())
+        return self._parse(result, Network, kwargs.get("response_mode"))
 
     def delete_network(self, name: str, **kwargs) -> None:
         """Delete a network by its name.
@@ -1212,7 +1570,26 @@ class Client:
         )
 
         handle_server_errors(result)
-        return SecretList(**result.json())
+        return self._parse(result, SecretList, kwargs.get("response_mode"))
+
+    def iter_secrets(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[Secret]:
+        """Iterate over all secrets, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_secrets`.
+
+        Yields:
+            Secret: Each secret.
+        """
+        return walk_items(self.list_secrets, limit=limit, prefetch=prefetch, **kwargs)
 
     def create_secret(self, body: SecretCreate | dict[str, Any], **kwargs) -> Secret:
         """Create a new secret.
@@ -1230,7 +1607,7 @@ class Client:
         )
 
         handle_server_errors(result)
-        return Secret(**result.json())
+        return self._parse(result, Secret, kwargs.get("response_mode"))
 
     def get_secret(self, name: str, **kwargs) -> Secret:
         """Get a secret by its name.
@@ -1247,7 +1624,7 @@ class Client:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(response=result)
-        return Secret(**result.json())
+        return self._parse(result, Secret, kwargs.get("response_mode"))
 
     def update_secret(
         self, name: str, body: SecretCreate | dict[str, Any], **kwargs
@@ -1271,7 +1648,7 @@ class Client:
         )
 
         handle_server_errors(response=result)
-        return Secret(**result.json())
+        return self._parse(result, Secret, kwargs.get("response_mode"))
 
     def delete_secret(self, name: str, **kwargs) -> None:
         """Delete a secret by its name.
@@ -1328,7 +1705,28 @@ class Client:
             params=params,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
+
+    def iter_oauth2_clients(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all OAuth2 clients, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_oauth2_clients`.
+
+        Yields:
+            dict[str, Any]: Each OAuth2 client.
+        """
+        return walk_items(
+            self.list_oauth2_clients, limit=limit, prefetch=prefetch, **kwargs
+        )
 
     def get_oauth2_client(self, client_id: str, **kwargs) -> dict[str, Any]:
         """Get an OAuth2 client by its client_id.
@@ -1344,7 +1742,7 @@ class Client:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def create_oauth2_client(self, body: dict[str, Any], **kwargs) -> dict[str, Any]:
         """Create a new OAuth2 client.
@@ -1361,7 +1759,7 @@ class Client:
             json=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def update_oauth2_client(
         self, client_id: str, body: dict[str, Any], **kwargs
@@ -1381,7 +1779,7 @@ class Client:
             json=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def update_oauth2_client_uris(
         self, client_id: str, update: OAuth2UpdateURI, **kwargs
@@ -1401,7 +1799,7 @@ class Client:
             json=update.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def delete_oauth2_client(self, client_id: str, **kwargs) -> None:
         """Delete an OAuth2 client by its client_id.
@@ -1451,7 +1849,26 @@ class Client:
             params=parameters,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
+
+    def iter_configtrees(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all config trees, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_configtrees`.
+
+        Yields:
+            dict[str, Any]: Each config tree.
+        """
+        return walk_items(self.list_configtrees, limit=limit, prefetch=prefetch, **kwargs)
 
     def create_configtree(
         self, body: dict[str, Any], with_project: bool = True, **kwargs
@@ -1471,7 +1888,7 @@ class Client:
             json=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def get_configtree(
         self,
@@ -1511,7 +1928,7 @@ class Client:
             params=parameters,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def set_configtree_revision(
         self,
@@ -1536,7 +1953,7 @@ class Client:
             json=configtree,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def update_configtree(
         self, name: str, body: dict[str, Any], with_project: bool = True, **kwargs
@@ -1557,7 +1974,7 @@ class Client:
             json=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def delete_configtree(self, name: str, **kwargs) -> None:
         """Delete a config tree by its name.
@@ -1608,7 +2025,34 @@ class Client:
             params=parameters,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
+
+    def iter_revisions(
+        self,
+        tree_name: str,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all revisions of a config tree, fetching one page at a time.
+
+        Args:
+            tree_name (str): Config tree name.
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_revisions`.
+
+        Yields:
+            dict[str, Any]: Each revision.
+        """
+        return walk_items(
+            self.list_revisions,
+            tree_name=tree_name,
+            limit=limit,
+            prefetch=prefetch,
+            **kwargs,
+        )
 
     def create_revision(
         self,
@@ -1633,7 +2077,7 @@ class Client:
             json=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def put_keys_in_revision(
         self, name: str, revision_id: str, config_values: dict[str, Any], **kwargs
@@ -1654,7 +2098,7 @@ class Client:
             json=config_values,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def commit_revision(
         self,
@@ -1693,7 +2137,7 @@ class Client:
             json=config_tree_revision,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def get_key_in_revision(
         self,
@@ -1722,6 +2166,9 @@ class Client:
         # The data received from the API is always in string format. To use
         # appropriate data-type in Python (as well in exports), we are
         # passing it through YAML parser.
+        # yaml is only needed here, so it is not imported with the client.
+        from yaml import safe_load
+
         return safe_load(result.text)
 
     def put_key_in_revision(
@@ -1750,7 +2197,7 @@ class Client:
             content=body,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     def delete_key_in_revision(
         self,
@@ -1804,7 +2251,7 @@ class Client:
             json=config_key_rename,
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     # Managed Service API
 
@@ -1819,7 +2266,7 @@ class Client:
             headers=self.config.get_headers(with_project=False),
         )
         handle_server_errors(result)
-        return ManagedServiceProviderList(**result.json())
+        return self._parse(result, ManagedServiceProviderList)
 
     def list_instances(
         self,
@@ -1827,6 +2274,7 @@ class Client:
         limit: int = 50,
         label_selector: list[str] = None,
         providers: list[str] = None,
+        **kwargs,
     ) -> ManagedServiceInstanceList:
         """List all instances in a project.
 
@@ -1841,7 +2289,7 @@ class Client:
         """
         result = self.c.get(
             url=f"{self.v2api_host}/v2/managedservices/",
-            headers=self.config.get_headers(),
+            headers=self.config.get_headers(**kwargs),
             params={
                 "continue": cont,
                 "limit": limit,
@@ -1850,7 +2298,28 @@ class Client:
             },
         )
         handle_server_errors(result)
-        return ManagedServiceInstanceList(**result.json())
+        return self._parse(
+            result, ManagedServiceInstanceList, kwargs.get("response_mode")
+        )
+
+    def iter_instances(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[ManagedServiceInstance]:
+        """Iterate over all managed service instances, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_instances`.
+
+        Yields:
+            ManagedServiceInstance: Each managed service instance.
+        """
+        return walk_items(self.list_instances, limit=limit, prefetch=prefetch, **kwargs)
 
     def get_instance(self, name: str) -> ManagedServiceInstance:
         """Get an instance by its name.
@@ -1866,7 +2335,7 @@ class Client:
             headers=self.config.get_headers(),
         )
         handle_server_errors(result)
-        return ManagedServiceInstance(**result.json())
+        return self._parse(result, ManagedServiceInstance)
 
     def create_instance(
         self, body: ManagedServiceInstance | dict[str, Any]
@@ -1885,7 +2354,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return ManagedServiceInstance(**result.json())
+        return self._parse(result, ManagedServiceInstance)
 
     def delete_instance(self, name: str) -> None:
         """Delete an instance.
@@ -1927,7 +2396,34 @@ class Client:
             },
         )
         handle_server_errors(result)
-        return ManagedServiceBindingList(**result.json())
+        return self._parse(result, ManagedServiceBindingList)
+
+    def iter_instance_bindings(
+        self,
+        instance_name: str,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[ManagedServiceBinding]:
+        """Iterate over all bindings of a managed service instance, fetching one page at a time.
+
+        Args:
+            instance_name (str): Instance name.
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_instance_bindings`.
+
+        Yields:
+            ManagedServiceBinding: Each binding.
+        """
+        return walk_items(
+            self.list_instance_bindings,
+            instance_name=instance_name,
+            limit=limit,
+            prefetch=prefetch,
+            **kwargs,
+        )
 
     def create_instance_binding(
         self, instance_name: str, body: ManagedServiceBinding | dict[str, Any]
@@ -1950,7 +2446,7 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return ManagedServiceBinding(**result.json())
+        return self._parse(result, ManagedServiceBinding)
 
     def get_instance_binding(
         self, instance_name: str, name: str
@@ -1969,7 +2465,7 @@ class Client:
             headers=self.config.get_headers(),
         )
         handle_server_errors(result)
-        return ManagedServiceBinding(**result.json())
+        return self._parse(result, ManagedServiceBinding)
 
     def delete_instance_binding(self, instance_name: str, name: str) -> None:
         """Delete an instance binding.
@@ -2016,7 +2512,26 @@ class Client:
 
         handle_server_errors(response=result)
 
-        return UserGroupList(**result.json())
+        return self._parse(result, UserGroupList, kwargs.get("response_mode"))
+
+    def iter_user_groups(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[UserGroup]:
+        """Iterate over all user groups, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_user_groups`.
+
+        Yields:
+            UserGroup: Each user group.
+        """
+        return walk_items(self.list_user_groups, limit=limit, prefetch=prefetch, **kwargs)
 
     def get_user_group(self, group_name: str, group_guid: str, **kwargs) -> UserGroup:
         result = self.c.get(
@@ -2027,7 +2542,7 @@ class Client:
         )
         handle_server_errors(result)
 
-        return UserGroup(**result.json())
+        return self._parse(result, UserGroup, kwargs.get("response_mode"))
 
     def create_user_group(self, user_group: UserGroup | dict, **kwargs) -> UserGroup:
         if isinstance(user_group, dict):
@@ -2039,7 +2554,7 @@ class Client:
         )
         handle_server_errors(result)
 
-        return UserGroup(**result.json())
+        return self._parse(result, UserGroup, kwargs.get("response_mode"))
 
     def update_user_group(self, user_group: UserGroup | dict, **kwargs) -> UserGroup:
         if isinstance(user_group, dict):
@@ -2056,7 +2571,7 @@ class Client:
         )
         handle_server_errors(result)
 
-        return UserGroup(**result.json())
+        return self._parse(result, UserGroup, kwargs.get("response_mode"))
 
     def delete_user_group(self, group_name: str, group_guid: str, **kwargs) -> None:
         result = self.c.delete(
@@ -2093,7 +2608,26 @@ class Client:
 
         handle_server_errors(result)
 
-        return RoleList(**result.json())
+        return self._parse(result, RoleList, kwargs.get("response_mode"))
+
+    def iter_roles(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[Role]:
+        """Iterate over all roles, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_roles`.
+
+        Yields:
+            Role: Each role.
+        """
+        return walk_items(self.list_roles, limit=limit, prefetch=prefetch, **kwargs)
 
     def get_role(self, role_name: str, **kwargs) -> Role:
         result = self.c.get(
@@ -2102,7 +2636,7 @@ class Client:
         )
         handle_server_errors(result)
 
-        return Role(**result.json())
+        return self._parse(result, Role, kwargs.get("response_mode"))
 
     def create_role(self, role: Role | dict, **kwargs) -> Role:
         if isinstance(role, dict):
@@ -2114,7 +2648,7 @@ class Client:
         )
         handle_server_errors(result)
 
-        return Role(**result.json())
+        return self._parse(result, Role, kwargs.get("response_mode"))
 
     def update_role(self, role: Role, **kwargs) -> Role:
         if isinstance(role, dict):
@@ -2126,7 +2660,7 @@ class Client:
         )
         handle_server_errors(result)
 
-        return Role(**result.json())
+        return self._parse(result, Role, kwargs.get("response_mode"))
 
     def delete_role(self, role_name: str, **kwargs) -> None:
         result = self.c.delete(
@@ -2182,7 +2716,28 @@ class Client:
 
         handle_server_errors(result)
 
-        return RoleBindingList(**result.json())
+        return self._parse(result, RoleBindingList, kwargs.get("response_mode"))
+
+    def iter_role_bindings(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[RoleBinding]:
+        """Iterate over all role bindings, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_role_bindings`.
+
+        Yields:
+            RoleBinding: Each role binding.
+        """
+        return walk_items(
+            self.list_role_bindings, limit=limit, prefetch=prefetch, **kwargs
+        )
 
     def get_role_binding(self, binding_guid: str, **kwargs) -> RoleBinding:
         result = self.c.get(
@@ -2191,7 +2746,7 @@ class Client:
         )
         handle_server_errors(result)
 
-        return RoleBinding(**result.json())
+        return self._parse(result, RoleBinding, kwargs.get("response_mode"))
 
     def update_role_binding(
         self, binding: BulkRoleBindingUpdate | dict, **kwargs
@@ -2206,9 +2761,9 @@ class Client:
         handle_server_errors(result)
 
         try:
-            return RoleBinding(**result.json())
+            return self._parse(result, RoleBinding, kwargs.get("response_mode"))
         except Exception:
-            return result.json()
+            return self.codec.loads(result.content)
 
     # -------------------ServiceAccount-------------------
 
@@ -2240,7 +2795,28 @@ class Client:
 
         handle_server_errors(result)
 
-        return ServiceAccountList(**result.json())
+        return self._parse(result, ServiceAccountList, kwargs.get("response_mode"))
+
+    def iter_service_accounts(
+        self,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[ServiceAccount]:
+        """Iterate over all service accounts, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_service_accounts`.
+
+        Yields:
+            ServiceAccount: Each service account.
+        """
+        return walk_items(
+            self.list_service_accounts, limit=limit, prefetch=prefetch, **kwargs
+        )
 
     def get_service_account(
         self,
@@ -2253,7 +2829,7 @@ class Client:
         )
 
         handle_server_errors(result)
-        return ServiceAccount(**result.json())
+        return self._parse(result, ServiceAccount, kwargs.get("response_mode"))
 
     def create_service_account(
         self,
@@ -2269,7 +2845,7 @@ class Client:
         )
 
         handle_server_errors(result)
-        return ServiceAccount(**result.json())
+        return self._parse(result, ServiceAccount, kwargs.get("response_mode"))
 
     def update_service_account(
         self,
@@ -2288,7 +2864,7 @@ class Client:
         )
 
         handle_server_errors(result)
-        return ServiceAccount(**result.json())
+        return self._parse(result, ServiceAccount, kwargs.get("response_mode"))
 
     def delete_service_account(
         self,
@@ -2313,7 +2889,7 @@ class Client:
 
         handle_server_errors(result)
 
-        return ServiceAccountTokenList(**result.json())
+        return self._parse(result, ServiceAccountTokenList, kwargs.get("response_mode"))
 
     def create_service_account_token(
         self, name: str, expiry_at: ServiceAccountToken | dict, **kwargs
@@ -2329,7 +2905,7 @@ class Client:
 
         handle_server_errors(result)
 
-        return ServiceAccountTokenInfo(**result.json())
+        return self._parse(result, ServiceAccountTokenInfo, kwargs.get("response_mode"))
 
     def refresh_service_account_token(
         self, name: str, token_id: str, expiry_at: ServiceAccountToken | dict, **kwargs
@@ -2345,7 +2921,7 @@ class Client:
 
         handle_server_errors(result)
 
-        return ServiceAccountTokenInfo(**result.json())
+        return self._parse(result, ServiceAccountTokenInfo, kwargs.get("response_mode"))
 
     def delete_service_account_token(self, name: str, token_id: str, **kwargs) -> None:
         result = self.c.delete(
@@ -2396,7 +2972,34 @@ class Client:
             params=params,
         )
         handle_server_errors(result)
-        return FileUploadList(**result.json())
+        return self._parse(result, FileUploadList, kwargs.get("response_mode"))
+
+    def iter_fileuploads(
+        self,
+        device_guid: str,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[FileUpload]:
+        """Iterate over all file uploads of a device, fetching one page at a time.
+
+        Args:
+            device_guid (str): Device GUID.
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_fileuploads`.
+
+        Yields:
+            FileUpload: Each file upload.
+        """
+        return walk_items(
+            self.list_fileuploads,
+            device_guid=device_guid,
+            limit=limit,
+            prefetch=prefetch,
+            **kwargs,
+        )
 
     def get_fileupload(
         self,
@@ -2418,7 +3021,7 @@ class Client:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return FileUpload(**result.json())
+        return self._parse(result, FileUpload, kwargs.get("response_mode"))
 
     def create_fileupload(
         self,
@@ -2444,7 +3047,7 @@ class Client:
             json=body.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
         handle_server_errors(result)
-        return FileUpload(**result.json())
+        return self._parse(result, FileUpload, kwargs.get("response_mode"))
 
     def delete_fileupload(
         self,
@@ -2508,7 +3111,7 @@ class Client:
             headers=self.config.get_headers(**kwargs),
         )
         handle_server_errors(result)
-        return result.json()
+        return self.codec.loads(result.content)
 
     # -------------------SharedURL-------------------
     def list_sharedurls(
@@ -2537,7 +3140,34 @@ class Client:
             },
         )
         handle_server_errors(result)
-        return SharedURLList(**result.json())
+        return self._parse(result, SharedURLList, kwargs.get("response_mode"))
+
+    def iter_sharedurls(
+        self,
+        fileupload_guid: str,
+        limit: int = 50,
+        prefetch: int = 0,
+        **kwargs,
+    ) -> Iterator[SharedURL]:
+        """Iterate over all shared URLs of a file upload, fetching one page at a time.
+
+        Args:
+            fileupload_guid (str): File upload GUID.
+            limit (int, optional): Number of items fetched per request. Defaults to 50.
+            prefetch (int, optional): Number of pages to fetch ahead in a
+                background thread, see `walk_pages`. Defaults to 0.
+            **kwargs: Filters passed on to `list_sharedurls`.
+
+        Yields:
+            SharedURL: Each shared URL.
+        """
+        return walk_items(
+            self.list_sharedurls,
+            fileupload_guid=fileupload_guid,
+            limit=limit,
+            prefetch=prefetch,
+            **kwargs,
+        )
 
     def get_sharedurl(
         self,
@@ -2587,7 +3217,7 @@ class Client:
             json=body.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
         handle_server_errors(result)
-        return SharedURL(**result.json())
+        return self._parse(result, SharedURL, kwargs.get("response_mode"))
 
     # -------------------SSH Certificates-------------------
     def sign_ssh_public_key(
@@ -2615,4 +3245,104 @@ class Client:
             json=body.model_dump(by_alias=True),
         )
         handle_server_errors(result)
-        return SSHKeySignResponse(**result.json())
+        return self._parse(result, SSHKeySignResponse, kwargs.get("response_mode"))
+
+    # -------------------Bulk-------------------
+    def create_many(
+        self,
+        resources: Sequence[Any],
+        concurrency: int = 8,
+        fail_fast: bool = False,
+        **kwargs,
+    ) -> list[BulkResult]:
+        """Create resources on a thread pool, at most `concurrency` at a time.
+
+        Args:
+            resources (Sequence): Deployments, disks, networks, secrets, static routes
+                or packages, as models or dicts with a ``kind``.
+            concurrency (int, optional): Maximum number of requests in flight.
+                Defaults to 8.
+            fail_fast (bool, optional): Stop at the first error instead of trying
+                every resource. Defaults to False.
+
+        Returns:
+            list[BulkResult]: The outcome of every resource, in the same order.
+
+        Raises:
+            BulkError: A resource failed and `fail_fast` is set.
+        """
+        # bulk loads apply and every model, so it is not imported with the client.
+        from rapyuta_io_sdk_v2.bulk import create_stages, run_stages
+
+        stages = create_stages(self, resources, kwargs)
+        return run_stages(stages, concurrency, fail_fast)
+
+    def update_many(
+        self,
+        resources: Sequence[Any],
+        concurrency: int = 8,
+        fail_fast: bool = False,
+        **kwargs,
+    ) -> list[BulkResult]:
+        """Update deployments, secrets and static routes on a thread pool.
+
+        Args:
+            resources (Sequence): Resources to update, as models or dicts with a
+                ``kind``.
+            concurrency (int, optional): Maximum number of requests in flight.
+                Defaults to 8.
+            fail_fast (bool, optional): Stop at the first error instead of trying
+                every resource. Defaults to False.
+
+        Returns:
+            list[BulkResult]: The outcome of every resource, in the same order.
+
+        Raises:
+            ValueError: A resource cannot be updated, e.g. a disk.
+            BulkError: A resource failed and `fail_fast` is set.
+        """
+        from rapyuta_io_sdk_v2.bulk import run_stages, update_stages
+
+        stages = update_stages(self, resources, kwargs)
+        return run_stages(stages, concurrency, fail_fast)
+
+    def delete_many(
+        self,
+        resources: Sequence[Any],
+        concurrency: int = 8,
+        fail_fast: bool = False,
+        timeout: float = 300.0,
+        poll: PollPolicy | None = None,
+        **kwargs,
+    ) -> list[BulkResult]:
+        """Delete resources on a thread pool, in dependency order.
+
+        Deployments are deleted first, then static routes, networks, disks,
+        secrets and packages, so no resource is deleted while a deployment being
+        deleted still uses it. Every kind is polled until it is gone before the
+        next one is deleted. The resources used by a deployment that cannot be
+        deleted are skipped.
+
+        Args:
+            resources (Sequence): Resources as models, dicts with a ``kind`` or keys
+                such as ``disk:data``. Packages must be passed as resources, since
+                deleting them needs their version.
+            concurrency (int, optional): Maximum number of requests in flight.
+                Defaults to 8.
+            fail_fast (bool, optional): Stop at the first error instead of trying
+                every resource. Defaults to False.
+            timeout (float, optional): Seconds to wait for the resources of a kind
+                to be gone. Defaults to 300.
+            poll (PollPolicy, optional): Polling interval while waiting.
+
+        Returns:
+            list[BulkResult]: The outcome of every resource, in the same order.
+
+        Raises:
+            BulkError: A resource failed and `fail_fast` is set.
+        """
+        from rapyuta_io_sdk_v2.bulk import delete_stages, run_stages
+
+        uses: dict[str, list[str] | None] = {}
+        stages = delete_stages(self, resources, kwargs, uses, timeout, poll)
+        return run_stages(stages, concurrency, fail_fast, uses)
@@ -0,0 +1,102 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import json
+import typing
+
+import httpx
+
+
+class JSONCodec:
+    """Encodes request bodies and decodes response bodies.
+
+    Subclass it and pass an instance as ``codec`` to Client or AsyncClient to plug
+    in another JSON library.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> typing.Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson (``pip install orjson``)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "OrjsonCodec requires the 'orjson' package, "
+                "install it with `pip install orjson`"
+            )
+        self._orjson = orjson
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes | str) -> typing.Any:
+        return self._orjson.loads(data)
+
+
+def default_codec() -> JSONCodec:
+    """orjson when it is installed, the standard library otherwise."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JSONCodec()
+
+
+def _encode_json(codec: JSONCodec, kwargs: dict[str, typing.Any]) -> None:
+    """Replace the ``json`` argument of ``build_request`` with encoded content."""
+    body = kwargs.pop("json", None)
+    if body is None:
+        return
+    headers = httpx.Headers(kwargs.get("headers"))
+    headers.setdefault("Content-Type", "application/json")
+    kwargs["headers"] = headers
+    kwargs["content"] = codec.dumps(body)
+
+
+class CodecClient(httpx.Client):
+    """``httpx.Client`` encoding ``json=`` request bodies with a JSONCodec."""
+
+    def __init__(self, *args: typing.Any, codec: JSONCodec, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.codec = codec
+
+    def build_request(self, *args: typing.Any, **kwargs: typing.Any) -> httpx.Request:
+        _encode_json(self.codec, kwargs)
+        return super().build_request(*args, **kwargs)
+
+
+class AsyncCodecClient(httpx.AsyncClient):
+    """``httpx.AsyncClient`` encoding ``json=`` request bodies with a JSONCodec."""
+
+    def __init__(self, *args: typing.Any, codec: JSONCodec, **kwargs: typing.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.codec = codec
+
+    def build_request(self, *args: typing.Any, **kwargs: typing.Any) -> httpx.Request:
+        _encode_json(self.codec, kwargs)
+        return super().build_request(*args, **kwargs)
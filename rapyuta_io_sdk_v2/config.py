@@ -15,7 +15,11 @@ from __future__ import annotations
 
 import json
 import os
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterator, Mapping
 
 from rapyuta_io_sdk_v2.constants import (
     APP_NAME,
@@ -25,6 +29,61 @@ from rapyuta_io_sdk_v2.constants import (
 from rapyuta_io_sdk_v2.exceptions import ValidationError
 from rapyuta_io_sdk_v2.utils import get_default_app_dir
 
+# Values of the current context, e.g. of an asyncio task, set with ``scope``.
+# X-Request-ID sent with the requests; takes precedence over the REQUEST_ID
+# environment variable.
+current_request_id: ContextVar[str | None] = ContextVar(
+    "rapyuta_io_sdk_v2.request_id", default=None
+)
+# Organization and project used instead of the ones of the configuration.
+current_organization_guid: ContextVar[str | None] = ContextVar(
+    "rapyuta_io_sdk_v2.organization_guid", default=None
+)
+current_project_guid: ContextVar[str | None] = ContextVar(
+    "rapyuta_io_sdk_v2.project_guid", default=None
+)
+
+
+@contextmanager
+def scope(
+    organization_guid: str | None = None,
+    project_guid: str | None = None,
+    request_id: str | None = None,
+) -> Iterator[None]:
+    """Override the organization, project and request ID in the current context.
+
+    Requests made in the block, by any client, use the given values unless a call
+    passes its own ``organization_guid`` or ``project_guid``. Context variables are
+    local to the current thread or asyncio task, so concurrent tasks can share one
+    client with different scopes. Scopes nest; values left as None are inherited.
+
+    Args:
+        organization_guid (str, optional): Organization GUID to use.
+        project_guid (str, optional): Project GUID to use.
+        request_id (str, optional): X-Request-ID sent with the requests.
+    """
+    tokens = [
+        (var, var.set(value))
+        for var, value in (
+            (current_organization_guid, organization_guid),
+            (current_project_guid, project_guid),
+            (current_request_id, request_id),
+        )
+        if value is not None
+    ]
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+# Fields the memoized headers are computed from.
+_HEADER_FIELDS = frozenset({"auth_token", "organization_guid", "project_guid"})
+# Maximum number of memoized header sets per configuration.
+_MAX_HEADER_SETS = 256
+_UNSET = object()
+
 
 @dataclass
 class Configuration:
@@ -49,6 +108,13 @@ class Configuration:
 
         self.hosts = {}
         self.set_environment(self.environment)
+        self._headers: dict[tuple, Mapping[str, str]] = {}
+        self._env_request_id = _UNSET
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _HEADER_FIELDS:
+            self.__dict__["_headers"] = {}
 
     @classmethod
     def from_env(cls) -> Configuration:
@@ -88,9 +154,17 @@ class Configuration:
         with_group: bool = False,
         group_guid: str | None = None,
         **kwargs,
-    ) -> dict[str, str]:
+    ) -> Mapping[str, str]:
         """Get the headers for the configuration.
 
+        The organization, project and request ID of the current ``scope`` take
+        precedence over the ones of the configuration; the request ID otherwise
+        comes from the REQUEST_ID environment variable, read on first use. Header
+        sets are memoized until the token, organization or project of the
+        configuration change, so the returned mapping is read-only; copy it to add
+        headers. The request ID of a scope is added to the memoized headers on
+        every call, as it usually differs for every request.
+
         Args:
             with_organization (bool): Whether to include the organization headers. Defaults to True.
             organization_guid (str, optional): The organization guid. Defaults to None.
@@ -101,34 +175,77 @@ class Configuration:
             **kwargs: Additional keyword arguments (e.g., x_checksum, content_type).
 
         Returns:
-            dict: Headers for the configuration, including Authorization, organizationguid,
+            Mapping: Headers for the configuration, including Authorization, organizationguid,
                   project, groupguid, and other custom headers.
         """
+        # Changing the token, organization or project swaps in a new memo. Headers
+        # built from the old values are written to the memo taken beforehand, so
+        # they never end up in the new one.
+        memo = self._headers
+        if self._env_request_id is _UNSET:
+            self._env_request_id = os.getenv("REQUEST_ID")
+
+        x_checksum = kwargs.get("x_checksum", None)
+        key = (
+            with_organization and (organization_guid or self.scoped_organization_guid),
+            with_project and (project_guid or self.scoped_project_guid),
+            with_group and group_guid,
+            self._env_request_id,
+            kwargs.get("content_type", None),
+        )
+        headers = None if x_checksum else memo.get(key)
+        if headers is None:
+            headers = MappingProxyType(self._build_headers(*key, x_checksum))
+            # Checksums differ for every upload, so they are not memoized.
+            if not x_checksum:
+                if len(memo) >= _MAX_HEADER_SETS:
+                    memo.clear()
+                memo[key] = headers
+
+        request_id = current_request_id.get()
+        if request_id is not None:
+            headers = MappingProxyType({**headers, "X-Request-ID": request_id})
+        return headers
+
+    @property
+    def scoped_organization_guid(self) -> str | None:
+        """Organization GUID of the current scope, or else of the configuration."""
+        return current_organization_guid.get() or self.organization_guid
+
+    @property
+    def scoped_project_guid(self) -> str | None:
+        """Project GUID of the current scope, or else of the configuration."""
+        return current_project_guid.get() or self.project_guid
+
+    def _build_headers(
+        self,
+        organization_guid: str | None,
+        project_guid: str | None,
+        group_guid: str | None,
+        request_id: str | None,
+        content_type: str | None,
+        x_checksum: str | None,
+    ) -> dict[str, str]:
         auth_value = self.auth_token.strip() if self.auth_token else None
         if auth_value and not auth_value.lower().startswith("bearer "):
             auth_value = f"Bearer {auth_value}"
         headers = {"Authorization": auth_value} if auth_value else {}
 
-        organization_guid = organization_guid or self.organization_guid
-        if with_organization and organization_guid:
+        if organization_guid:
             headers["organizationguid"] = organization_guid
 
-        project_guid = project_guid or self.project_guid
-        if with_project and project_guid:
+        if project_guid:
             headers["project"] = project_guid
 
-        if with_group and group_guid:
+        if group_guid:
             headers["groupguid"] = group_guid
 
-        custom_client_request_id = os.getenv("REQUEST_ID")
-        if custom_client_request_id:
-            headers["X-Request-ID"] = custom_client_request_id
+        if request_id:
+            headers["X-Request-ID"] = request_id
 
-        x_checksum = kwargs.get("x_checksum", None)
         if x_checksum:
             headers["X-Checksum"] = x_checksum
 
-        content_type = kwargs.get("content_type", None)
         if content_type:
             headers["Content-Type"] = content_type
 
@@ -91,3 +91,57 @@ class UnknownError(Exception):
     def __init__(self, message="unknown error"):
         self.message = message
         super().__init__(self.message)
+
+
+class ResourceFailedError(Exception):
+    """Raised when a resource being waited for reaches a failed state."""
+
+    def __init__(self, message="resource failed", resource=None):
+        self.message = message
+        self.resource = resource
+        super().__init__(self.message)
+
+
+class DeploymentFailedError(ResourceFailedError):
+    """Raised when a deployment being waited for reaches a failed phase."""
+
+    def __init__(self, message="deployment failed", deployment=None):
+        self.deployment = deployment
+        super().__init__(message, resource=deployment)
+
+
+class WaitTimeoutError(TimeoutError):
+    """Raised when resources did not become ready before the timeout."""
+
+    def __init__(self, message="timed out waiting", pending=None):
+        self.message = message
+        self.pending = pending or []
+        super().__init__(self.message)
+
+
+class ApplyError(Exception):
+    """Raised when resources could not be applied.
+
+    ``errors`` maps the keys of the failed resources, e.g. ``deployment:name``, to
+    their exceptions. ``applied`` holds the resources applied before the failure
+    and ``skipped`` the keys of the resources that were not attempted.
+    """
+
+    def __init__(self, message="apply failed", errors=None, applied=None, skipped=None):
+        self.message = message
+        self.errors = errors or {}
+        self.applied = applied or {}
+        self.skipped = skipped or []
+        super().__init__(self.message)
+
+
+class BulkError(Exception):
+    """Raised when an item of a bulk operation fails with fail_fast set.
+
+    ``results`` holds the BulkResult of every item, in the order of the items.
+    """
+
+    def __init__(self, message="bulk operation failed", results=None):
+        self.message = message
+        self.results = results or []
+        super().__init__(self.message)
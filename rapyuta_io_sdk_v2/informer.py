@@ -0,0 +1,579 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import contextvars
+import copy
+import functools
+import threading
+import time
+import typing
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+
+from rapyuta_io_sdk_v2.models import (
+    Deployment,
+    Disk,
+    FileUpload,
+    ManagedServiceInstance,
+    Network,
+    Secret,
+    StaticRoute,
+)
+from rapyuta_io_sdk_v2.utils import walk_items
+
+if typing.TYPE_CHECKING:
+    from rapyuta_io_sdk_v2.client import Client
+
+T = typing.TypeVar("T", bound=BaseModel)
+
+# Computes the values an object is indexed under, e.g. its labels.
+Indexer = typing.Callable[[typing.Any], typing.Iterable[typing.Hashable]]
+
+
+def name_key(item: dict) -> str:
+    """Key of a listed item by ``metadata.name``."""
+    return item["metadata"]["name"]
+
+
+def guid_key(item: dict) -> str:
+    """Key of a listed item by ``metadata.guid``."""
+    return item["metadata"]["guid"]
+
+
+@dataclass
+class EventHandler:
+    """Callbacks of an informer, each optional.
+
+    Args:
+        on_add: Called with an object that appeared.
+        on_update: Called with the previous and the current object when an object
+            changed, and with the same object twice on a periodic resync.
+        on_delete: Called with the last known state of an object that is gone.
+    """
+
+    on_add: typing.Callable[[typing.Any], None] | None = None
+    on_update: typing.Callable[[typing.Any, typing.Any], None] | None = None
+    on_delete: typing.Callable[[typing.Any], None] | None = None
+
+
+class Store(typing.Generic[T]):
+    """Thread-safe local cache of objects, with secondary indexes.
+
+    Objects are stored by key. Each indexer maps an object to the values it can be
+    looked up by with ``by_index``. Lookups return the objects held by the store;
+    treat them as read-only.
+
+    Args:
+        indexers (dict[str, Callable], optional): Index name to a function
+            returning the index values of an object.
+    """
+
+    def __init__(self, indexers: dict[str, Indexer] | None = None) -> None:
+        self.indexers = dict(indexers or {})
+        self._items: dict[typing.Hashable, T] = {}
+        self._indexes: dict[str, dict[typing.Hashable, set]] = {
+            name: {} for name in self.indexers
+        }
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: typing.Hashable) -> T | None:
+        return self._items.get(key)
+
+    def keys(self) -> list[typing.Hashable]:
+        with self._lock:
+            return list(self._items)
+
+    def list(self) -> list[T]:
+        with self._lock:
+            return list(self._items.values())
+
+    def by_index(self, index: str, value: typing.Hashable) -> list[T]:
+        """Objects whose indexer for `index` returned `value`."""
+        with self._lock:
+            keys = self._indexes[index].get(value, ())
+            return [self._items[key] for key in keys]
+
+    def put(self, key: typing.Hashable, obj: T) -> T | None:
+        """Store an object, returning the object it replaced."""
+        with self._lock:
+            old = self.delete(key)
+            self._items[key] = obj
+            for index, values in self._index_values(obj):
+                for value in values:
+                    self._indexes[index].setdefault(value, set()).add(key)
+            return old
+
+    def delete(self, key: typing.Hashable) -> T | None:
+        """Remove an object, returning it."""
+        with self._lock:
+            obj = self._items.pop(key, None)
+            if obj is None:
+                return None
+            for index, values in self._index_values(obj):
+                for value in values:
+                    keys = self._indexes[index].get(value)
+                    if keys is not None:
+                        keys.discard(key)
+                        if not keys:
+                            del self._indexes[index][value]
+            return obj
+
+    def _index_values(
+        self, obj: T
+    ) -> typing.Iterator[tuple[str, typing.Iterable[typing.Hashable]]]:
+        for index, indexer in self.indexers.items():
+            yield index, [value for value in indexer(obj) if value is not None]
+
+
+class Informer(typing.Generic[T]):
+    """Keep a local cache of a resource up to date by polling a ``list_*`` method.
+
+    A background thread lists all objects every ``interval`` seconds, keeps them
+    in a Store and calls the registered handlers for the objects that were added,
+    updated or deleted since the previous poll. Several consumers in a process can
+    share one informer, and thereby one poll stream, by each registering their own
+    handlers.
+
+    Pages are fetched as raw JSON and compared before validation, so only the
+    objects that changed are validated into models on every poll.
+
+    Args:
+        list_func (Callable): A ``list_*`` method of Client, e.g.
+            ``client.list_disks``. Use ``functools.partial`` to bind positional
+            arguments such as the device of ``list_fileuploads``.
+        model (type[BaseModel]): Model of the listed items, e.g. Disk.
+        key (Callable[[dict], Hashable], optional): Key of an item, given its JSON.
+            Defaults to ``metadata.name``.
+        indexers (dict[str, Callable], optional): Secondary indexes of the store.
+        interval (float, optional): Seconds between polls. Defaults to 10.
+        resync_period (float, optional): Seconds between periodic resyncs, which
+            call ``on_update`` for every object, changed or not, so that handlers
+            can reconcile missed work. Defaults to no periodic resync.
+        page_size (int, optional): Items listed per request. Defaults to 100.
+        on_error (Callable[[Exception], None], optional): Called with exceptions
+            raised while polling or by a handler. The informer keeps polling.
+            A failing handler never stops the other handlers or events; without
+            ``on_error``, ``resync`` raises its error once the store is updated.
+        **kwargs: Filters and headers passed to `list_func`, e.g.
+            ``label_selector`` or ``project_guid``.
+    """
+
+    def __init__(
+        self,
+        list_func: typing.Callable[..., typing.Any],
+        model: type[T],
+        key: typing.Callable[[dict], typing.Hashable] = name_key,
+        indexers: dict[str, Indexer] | None = None,
+        interval: float = 10.0,
+        resync_period: float | None = None,
+        page_size: int = 100,
+        on_error: typing.Callable[[Exception], None] | None = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+        **kwargs: typing.Any,
+    ) -> None:
+        self.list_func = list_func
+        self.model = model
+        self.key = key
+        self.interval = interval
+        self.resync_period = resync_period
+        self.page_size = page_size
+        self.on_error = on_error
+        self.list_kwargs = kwargs
+        self.store: Store[T] = self._new_store(indexers)
+        self.last_error: Exception | None = None
+
+        self._clock = clock
+        self._last_resync = clock()
+        self._raw: dict[typing.Hashable, dict] = {}
+        self._handlers: list[EventHandler] = []
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _new_store(self, indexers: dict[str, Indexer] | None) -> Store[T]:
+        return Store(indexers)
+
+    def add_handler(
+        self,
+        on_add: typing.Callable[[T], None] | None = None,
+        on_update: typing.Callable[[T, T], None] | None = None,
+        on_delete: typing.Callable[[T], None] | None = None,
+    ) -> EventHandler:
+        """Register callbacks for events of the resource.
+
+        When the informer has already synced, ``on_add`` is called right away for
+        every object in the store.
+
+        Returns:
+            EventHandler: The handler, to pass to ``remove_handler``.
+        """
+        handler = EventHandler(on_add=on_add, on_update=on_update, on_delete=on_delete)
+        errors: list[Exception] = []
+        with self._lock:
+            self._handlers.append(handler)
+            if handler.on_add is not None:
+                for obj in self.store.list():
+                    self._call(errors, handler.on_add, obj)
+        self._report(errors)
+        return handler
+
+    def remove_handler(self, handler: EventHandler) -> None:
+        with self._lock:
+            self._handlers.remove(handler)
+
+    def start(self) -> Informer[T]:
+        """Start polling in a daemon thread.
+
+        The thread runs in a copy of the caller's context, so an informer started
+        within ``client.scope`` keeps polling the scoped project.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._run,),
+            name=f"{self.model.__name__}Informer",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop polling and wait for the thread to finish the current poll."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> Informer[T]:
+        return self.start()
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.stop()
+
+    @property
+    def synced(self) -> bool:
+        """Whether the store holds the result of at least one complete poll."""
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout: float | None = None) -> bool:
+        """Block until the first poll completed.
+
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        return self._synced.wait(timeout)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.resync()
+            except Exception as exc:
+                self.last_error = exc
+                if self.on_error is not None:
+                    self.on_error(exc)
+            self._stopped.wait(self.interval)
+
+    def resync(self) -> None:
+        """Poll once, update the store and call the handlers.
+
+        Called by the background thread; call it directly to drive the informer
+        without a thread. Errors of the handlers are recorded in ``last_error``
+        and, without ``on_error``, the last one is raised after every event was
+        dispatched.
+        """
+        current = {}
+        for item in walk_items(
+            self.list_func,
+            limit=self.page_size,
+            response_mode="raw",
+            **self.list_kwargs,
+        ):
+            current[self.key(item)] = item
+
+        now = self._clock()
+        periodic = (
+            self.resync_period is not None
+            and now - self._last_resync >= self.resync_period
+        )
+        if periodic:
+            self._last_resync = now
+
+        errors: list[Exception] = []
+        with self._lock:
+            for key, raw in current.items():
+                if self._raw.get(key) == raw:
+                    if periodic:
+                        obj = self.store.get(key)
+                        self._dispatch(errors, "on_update", obj, obj)
+                    continue
+                # Some model validators modify their input in place, so keep the
+                # raw item intact for comparing it with the next poll.
+                obj = self.model.model_validate(copy.deepcopy(raw))
+                old = self.store.put(key, obj)
+                self._raw[key] = raw
+                if old is None:
+                    self._dispatch(errors, "on_add", obj)
+                else:
+                    self._dispatch(errors, "on_update", old, obj)
+
+            for key in [key for key in self._raw if key not in current]:
+                del self._raw[key]
+                obj = self.store.delete(key)
+                if obj is not None:
+                    self._dispatch(errors, "on_delete", obj)
+
+        self.last_error = None
+        self._synced.set()
+        self._report(errors)
+
+    def _dispatch(self, errors: list[Exception], event: str, *args: T) -> None:
+        for handler in list(self._handlers):
+            callback = getattr(handler, event)
+            if callback is not None:
+                self._call(errors, callback, *args)
+
+    def _call(
+        self, errors: list[Exception], callback: typing.Callable, *args: T
+    ) -> None:
+        try:
+            callback(*args)
+        except Exception as exc:
+            errors.append(exc)
+            if self.on_error is not None:
+                self.on_error(exc)
+
+    def _report(self, errors: list[Exception]) -> None:
+        """Raise the last handler error, unless on_error already reported it."""
+        if errors:
+            self.last_error = errors[-1]
+            if self.on_error is None:
+                raise errors[-1]
+
+
+def _phase(obj: typing.Any) -> list[str | None]:
+    return [getattr(obj.status, "phase", None)]
+
+
+def _labels(obj: typing.Any) -> list[tuple[str, str]]:
+    metadata = obj.metadata
+    return list((metadata.labels or {}).items()) if metadata is not None else []
+
+
+def _guid(obj: typing.Any) -> list[str | None]:
+    return [obj.metadata.guid] if obj.metadata is not None else []
+
+
+def _device(deployment: Deployment) -> list[str]:
+    device = deployment.spec.device
+    if device is None or device.depends is None:
+        return []
+    return [device.depends.name_or_guid]
+
+
+class DeploymentStore(Store[Deployment]):
+    """Store of deployments keyed by name, indexed by guid, phase, label and device."""
+
+    def __init__(self, indexers: dict[str, Indexer] | None = None) -> None:
+        super().__init__(
+            {
+                "guid": _guid,
+                "phase": _phase,
+                "label": _labels,
+                "device": _device,
+                **(indexers or {}),
+            }
+        )
+
+    def get_by_guid(self, guid: str) -> Deployment | None:
+        found = self.by_index("guid", guid)
+        return found[0] if found else None
+
+    def by_phase(self, phase: str) -> list[Deployment]:
+        """Deployments in the phase, e.g. ``Succeeded``."""
+        return self.by_index("phase", phase)
+
+    def by_label(self, key: str, value: str) -> list[Deployment]:
+        """Deployments labelled ``key=value``."""
+        return self.by_index("label", (key, value))
+
+    def by_device(self, device: str) -> list[Deployment]:
+        """Deployments running on the device, by the name or guid they depend on."""
+        return self.by_index("device", device)
+
+
+class DeploymentInformer(Informer[Deployment]):
+    """Watch the deployments of a project by polling ``list_deployments``.
+
+    See Informer. The store is a DeploymentStore.
+
+    Args:
+        client (Client): Client used to list the deployments.
+        **kwargs: Arguments of Informer, and filters and headers passed to
+            ``list_deployments``, e.g. ``label_selector``, ``phases`` or
+            ``project_guid``.
+    """
+
+    def __init__(self, client: Client, **kwargs: typing.Any) -> None:
+        self.client = client
+        super().__init__(client.list_deployments, Deployment, **kwargs)
+
+    def _new_store(self, indexers: dict[str, Indexer] | None) -> DeploymentStore:
+        return DeploymentStore(indexers)
+
+
+class InformerFactory:
+    """Shared informers for the resources of a project.
+
+    Asking twice for the informer of the same resource with the same filters
+    returns the same informer, so every consumer in a process shares one poll
+    stream per resource, i.e. roughly one list call per resource per interval.
+
+    Args:
+        client (Client): Client used to list the resources.
+        interval (float, optional): Seconds between polls. Defaults to 10.
+        resync_period (float, optional): Seconds between periodic resyncs.
+        on_error (Callable[[Exception], None], optional): Called with polling and
+            handler errors of every informer.
+        **kwargs: Headers passed to every ``list_*`` call, e.g. ``project_guid``.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        interval: float = 10.0,
+        resync_period: float | None = None,
+        on_error: typing.Callable[[Exception], None] | None = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        self.client = client
+        self.options = dict(
+            interval=interval, resync_period=resync_period, on_error=on_error, **kwargs
+        )
+        self._informers: dict[tuple, Informer] = {}
+        self._started = False
+        self._lock = threading.Lock()
+
+    def informer(
+        self,
+        list_func: typing.Callable[..., typing.Any],
+        model: type[T],
+        key: typing.Callable[[dict], typing.Hashable] = name_key,
+        **kwargs: typing.Any,
+    ) -> Informer[T]:
+        """Shared informer for any ``list_*`` method; see Informer."""
+        return self._shared(
+            (list_func, model, key),
+            kwargs,
+            lambda options: Informer(list_func, model, key=key, **options),
+        )
+
+    def _shared(
+        self,
+        resource: tuple,
+        kwargs: dict[str, typing.Any],
+        create: typing.Callable[[dict[str, typing.Any]], Informer],
+    ) -> Informer:
+        cache_key = (resource, repr(sorted(kwargs.items())))
+        with self._lock:
+            informer = self._informers.get(cache_key)
+            if informer is None:
+                informer = create({**self.options, **kwargs})
+                self._informers[cache_key] = informer
+                if self._started:
+                    informer.start()
+            return informer
+
+    def deployments(self, **kwargs: typing.Any) -> DeploymentInformer:
+        return self._shared(
+            ("deployments",),
+            kwargs,
+            lambda options: DeploymentInformer(self.client, **options),
+        )
+
+    def disks(self, **kwargs: typing.Any) -> Informer[Disk]:
+        return self.informer(self.client.list_disks, Disk, **kwargs)
+
+    def networks(self, **kwargs: typing.Any) -> Informer[Network]:
+        return self.informer(self.client.list_networks, Network, **kwargs)
+
+    def staticroutes(self, **kwargs: typing.Any) -> Informer[StaticRoute]:
+        return self.informer(self.client.list_staticroutes, StaticRoute, **kwargs)
+
+    def secrets(self, **kwargs: typing.Any) -> Informer[Secret]:
+        return self.informer(self.client.list_secrets, Secret, **kwargs)
+
+    def instances(self, **kwargs: typing.Any) -> Informer[ManagedServiceInstance]:
+        return self.informer(self.client.list_instances, ManagedServiceInstance, **kwargs)
+
+    def fileuploads(self, device_guid: str, **kwargs: typing.Any) -> Informer[FileUpload]:
+        return self._shared(
+            ("fileuploads", device_guid),
+            kwargs,
+            lambda options: Informer(
+                functools.partial(self.client.list_fileuploads, device_guid),
+                FileUpload,
+                key=guid_key,
+                **options,
+            ),
+        )
+
+    def start(self) -> InformerFactory:
+        """Start every informer, including the ones requested later."""
+        with self._lock:
+            self._started = True
+            informers = list(self._informers.values())
+        for informer in informers:
+            informer.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._lock:
+            self._started = False
+            informers = list(self._informers.values())
+        for informer in informers:
+            informer.stop(timeout)
+
+    def wait_for_sync(self, timeout: float | None = None) -> bool:
+        """Block until every informer completed its first poll.
+
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            informers = list(self._informers.values())
+        for informer in informers:
+            remaining = (
+                None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+            if not informer.wait_for_sync(remaining):
+                return False
+        return True
+
+    def __enter__(self) -> InformerFactory:
+        return self.start()
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.stop()
@@ -4,119 +4,234 @@ Models package for Rapyuta IO SDK v2.
 This module provides flattened imports for all model classes.
 """
 
-# Deployment models
-from rapyuta_io_sdk_v2.models.deployment import (
-    Deployment as Deployment,
-    DeploymentList as DeploymentList,
-)
-
-# Disk models
-from rapyuta_io_sdk_v2.models.disk import (
-    Disk as Disk,
-    DiskList as DiskList,
-)
-
-# Managed Service models
-from rapyuta_io_sdk_v2.models.managedservice import (
-    ManagedServiceBinding as ManagedServiceBinding,
-    ManagedServiceBindingList as ManagedServiceBindingList,
-    ManagedServiceInstance as ManagedServiceInstance,
-    ManagedServiceInstanceList as ManagedServiceInstanceList,
-    ManagedServiceProvider as ManagedServiceProvider,
-    ManagedServiceProviderList as ManagedServiceProviderList,
-)
-
-# Network models
-from rapyuta_io_sdk_v2.models.network import (
-    Network as Network,
-    NetworkList as NetworkList,
-)
-
-# OAuth2 models
-from rapyuta_io_sdk_v2.models.oauth2 import (
-    OAuth2UpdateURI as OAuth2UpdateURI,
-)
-
-# Organization models
-from rapyuta_io_sdk_v2.models.organization import (
-    Organization as Organization,
-)
-
-# Package models
-from rapyuta_io_sdk_v2.models.package import (
-    Package as Package,
-    PackageList as PackageList,
-)
-
-# Project models
-from rapyuta_io_sdk_v2.models.project import (
-    Project as Project,
-    ProjectList as ProjectList,
-)
-
-# Role models
-from rapyuta_io_sdk_v2.models.role import (
-    Role as Role,
-    RoleList as RoleList,
-)
-
-# Role Binding models
-from rapyuta_io_sdk_v2.models.rolebinding import (
-    RoleBinding as RoleBinding,
-    RoleBindingList as RoleBindingList,
-    BulkRoleBindingUpdate as BulkRoleBindingUpdate,
-)
-
-# Secret models
-from rapyuta_io_sdk_v2.models.secret import (
-    Secret as Secret,
-    SecretList as SecretList,
-    SecretCreate as SecretCreate,
-)
-
-# Static Route models
-from rapyuta_io_sdk_v2.models.staticroute import (
-    StaticRoute as StaticRoute,
-    StaticRouteList as StaticRouteList,
-)
-
-# User models
-from rapyuta_io_sdk_v2.models.user import (
-    User as User,
-    UserList as UserList,
-    UserPermissions as UserPermissions,
-)
-
-# User Group models
-from rapyuta_io_sdk_v2.models.usergroup import (
-    UserGroup as UserGroup,
-    UserGroupCreate as UserGroupCreate,
-    UserGroupList as UserGroupList,
-)
-
-from rapyuta_io_sdk_v2.models.daemons import Daemon as Daemon
-
-from rapyuta_io_sdk_v2.models.serviceaccount import (
-    ServiceAccount as ServiceAccount,
-    ServiceAccountList as ServiceAccountList,
-    ServiceAccountTokenList as ServiceAccountTokenList,
-    ServiceAccountToken as ServiceAccountToken,
-    ServiceAccountTokenInfo as ServiceAccountTokenInfo,
-)
-
-# FileUpload models
-from rapyuta_io_sdk_v2.models.fileupload import (
-    FileUpload as FileUpload,
-    FileUploadList as FileUploadList,
-    FileUploadSpec as FileUploadSpec,
-    FileUploadStatus as FileUploadStatus,
-    SharedURL as SharedURL,
-    SharedURLList as SharedURLList,
-    SharedURLSpec as SharedURLSpec,
-)
-
-# SSH Key models
-from rapyuta_io_sdk_v2.models.sshkey import (
-    SSHKeySignRequest as SSHKeySignRequest,
-    SSHKeySignResponse as SSHKeySignResponse,
-)
+from __future__ import annotations
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    # Deployment models
+    from rapyuta_io_sdk_v2.models.deployment import (
+        Deployment as Deployment,
+        DeploymentList as DeploymentList,
+    )
+
+    # Disk models
+    from rapyuta_io_sdk_v2.models.disk import (
+        Disk as Disk,
+        DiskList as DiskList,
+    )
+
+    # Managed Service models
+    from rapyuta_io_sdk_v2.models.managedservice import (
+        ManagedServiceBinding as ManagedServiceBinding,
+        ManagedServiceBindingList as ManagedServiceBindingList,
+        ManagedServiceInstance as ManagedServiceInstance,
+        ManagedServiceInstanceList as ManagedServiceInstanceList,
+        ManagedServiceProvider as ManagedServiceProvider,
+        ManagedServiceProviderList as ManagedServiceProviderList,
+    )
+
+    # Network models
+    from rapyuta_io_sdk_v2.models.network import (
+        Network as Network,
+        NetworkList as NetworkList,
+    )
+
+    # OAuth2 models
+    from rapyuta_io_sdk_v2.models.oauth2 import (
+        OAuth2UpdateURI as OAuth2UpdateURI,
+    )
+
+    # Organization models
+    from rapyuta_io_sdk_v2.models.organization import (
+        Organization as Organization,
+    )
+
+    # Package models
+    from rapyuta_io_sdk_v2.models.package import (
+        Package as Package,
+        PackageList as PackageList,
+    )
+
+    # Project models
+    from rapyuta_io_sdk_v2.models.project import (
+        Project as Project,
+        ProjectList as ProjectList,
+    )
+
+    # Role models
+    from rapyuta_io_sdk_v2.models.role import (
+        Role as Role,
+        RoleList as RoleList,
+    )
+
+    # Role Binding models
+    from rapyuta_io_sdk_v2.models.rolebinding import (
+        RoleBinding as RoleBinding,
+        RoleBindingList as RoleBindingList,
+        BulkRoleBindingUpdate as BulkRoleBindingUpdate,
+    )
+
+    # Secret models
+    from rapyuta_io_sdk_v2.models.secret import (
+        Secret as Secret,
+        SecretList as SecretList,
+        SecretCreate as SecretCreate,
+    )
+
+    # Static Route models
+    from rapyuta_io_sdk_v2.models.staticroute import (
+        StaticRoute as StaticRoute,
+        StaticRouteList as StaticRouteList,
+    )
+
+    # User models
+    from rapyuta_io_sdk_v2.models.user import (
+        User as User,
+        UserList as UserList,
+        UserPermissions as UserPermissions,
+    )
+
+    # User Group models
+    from rapyuta_io_sdk_v2.models.usergroup import (
+        UserGroup as UserGroup,
+        UserGroupCreate as UserGroupCreate,
+        UserGroupList as UserGroupList,
+    )
+
+    from rapyuta_io_sdk_v2.models.daemons import Daemon as Daemon
+
+    from rapyuta_io_sdk_v2.models.utils import (
+        LazyItems as LazyItems,
+        LazyList as LazyList,
+    )
+
+    from rapyuta_io_sdk_v2.models.serviceaccount import (
+        ServiceAccount as ServiceAccount,
+        ServiceAccountList as ServiceAccountList,
+        ServiceAccountTokenList as ServiceAccountTokenList,
+        ServiceAccountToken as ServiceAccountToken,
+        ServiceAccountTokenInfo as ServiceAccountTokenInfo,
+    )
+
+    # FileUpload models
+    from rapyuta_io_sdk_v2.models.fileupload import (
+        FileUpload as FileUpload,
+        FileUploadList as FileUploadList,
+        FileUploadSpec as FileUploadSpec,
+        FileUploadStatus as FileUploadStatus,
+        SharedURL as SharedURL,
+        SharedURLList as SharedURLList,
+        SharedURLSpec as SharedURLSpec,
+    )
+
+    # SSH Key models
+    from rapyuta_io_sdk_v2.models.sshkey import (
+        SSHKeySignRequest as SSHKeySignRequest,
+        SSHKeySignResponse as SSHKeySignResponse,
+    )
+
+# Models are imported from their modules on first access; see the package
+# ``__init__``. Keep this in sync with the imports above.
+
+_EXPORTS = {
+    "rapyuta_io_sdk_v2.models.deployment": (
+        "Deployment",
+        "DeploymentList",
+    ),
+    "rapyuta_io_sdk_v2.models.disk": (
+        "Disk",
+        "DiskList",
+    ),
+    "rapyuta_io_sdk_v2.models.managedservice": (
+        "ManagedServiceBinding",
+        "ManagedServiceBindingList",
+        "ManagedServiceInstance",
+        "ManagedServiceInstanceList",
+        "ManagedServiceProvider",
+        "ManagedServiceProviderList",
+    ),
+    "rapyuta_io_sdk_v2.models.network": (
+        "Network",
+        "NetworkList",
+    ),
+    "rapyuta_io_sdk_v2.models.oauth2": ("OAuth2UpdateURI",),
+    "rapyuta_io_sdk_v2.models.organization": ("Organization",),
+    "rapyuta_io_sdk_v2.models.package": (
+        "Package",
+        "PackageList",
+    ),
+    "rapyuta_io_sdk_v2.models.project": (
+        "Project",
+        "ProjectList",
+    ),
+    "rapyuta_io_sdk_v2.models.role": (
+        "Role",
+        "RoleList",
+    ),
+    "rapyuta_io_sdk_v2.models.rolebinding": (
+        "RoleBinding",
+        "RoleBindingList",
+        "BulkRoleBindingUpdate",
+    ),
+    "rapyuta_io_sdk_v2.models.secret": (
+        "Secret",
+        "SecretList",
+        "SecretCreate",
+    ),
+    "rapyuta_io_sdk_v2.models.staticroute": (
+        "StaticRoute",
+        "StaticRouteList",
+    ),
+    "rapyuta_io_sdk_v2.models.user": (
+        "User",
+        "UserList",
+        "UserPermissions",
+    ),
+    "rapyuta_io_sdk_v2.models.usergroup": (
+        "UserGroup",
+        "UserGroupCreate",
+        "UserGroupList",
+    ),
+    "rapyuta_io_sdk_v2.models.daemons": ("Daemon",),
+    "rapyuta_io_sdk_v2.models.utils": (
+        "LazyItems",
+        "LazyList",
+    ),
+    "rapyuta_io_sdk_v2.models.serviceaccount": (
+        "ServiceAccount",
+        "ServiceAccountList",
+        "ServiceAccountTokenList",
+        "ServiceAccountToken",
+        "ServiceAccountTokenInfo",
+    ),
+    "rapyuta_io_sdk_v2.models.fileupload": (
+        "FileUpload",
+        "FileUploadList",
+        "FileUploadSpec",
+        "FileUploadStatus",
+        "SharedURL",
+        "SharedURLList",
+        "SharedURLSpec",
+    ),
+    "rapyuta_io_sdk_v2.models.sshkey": (
+        "SSHKeySignRequest",
+        "SSHKeySignResponse",
+    ),
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Generic, Literal, TypeVar
+from typing import (
+    Any,
+    Generic,
+    Iterator,
+    Literal,
+    Sequence,
+    TypeVar,
+    get_args,
+    get_origin,
+    overload,
+)
 
 from pydantic import AliasChoices, BaseModel, Field, field_validator, model_validator
 
@@ -102,6 +112,102 @@ class BaseList(BaseModel, Generic[T]):
     items: list[T] | None = Field(default=[], description="List of resource items")
 
 
+class LazyItems(Sequence[T]):
+    """Items of a LazyList, validated one at a time on first access.
+
+    Validated items are cached, so accessing an item again is free. The raw item
+    dicts stay available through ``raw``.
+    """
+
+    def __init__(self, raw: list[dict[str, Any]], item_type: type[T]) -> None:
+        self.raw = raw
+        self.item_type = item_type
+        self._cache: list[Any] = [_UNSET] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        item = self._cache[index]
+        if item is _UNSET:
+            item = self.item_type.model_validate(self.raw[index])
+            self._cache[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazyItems, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyItems({self.item_type.__name__}, {len(self)} items)"
+
+
+class LazyList(Generic[T]):
+    """List response whose items are only validated when they are accessed.
+
+    Mirrors the attributes of the ``*List`` models (``kind``, ``apiVersion``,
+    ``metadata`` and ``items``), but listing 500 deployments does not build 500
+    ``Deployment`` models up front. ``names()`` and ``guids()`` read the raw
+    items without validating them at all.
+
+    Args:
+        model (type[BaseList]): List model describing the response, e.g. DeploymentList.
+        data (dict): Decoded list response.
+    """
+
+    def __init__(self, model: type[BaseList[T]], data: dict[str, Any]) -> None:
+        self.model = model
+        self.kind: str | None = data.get("kind")
+        self.apiVersion: str | None = data.get("apiVersion", "api.rapyuta.io/v2")
+        metadata = data.get("metadata")
+        self.metadata = (
+            ListMeta.model_validate(metadata) if metadata is not None else None
+        )
+        self.items: LazyItems[T] = LazyItems(data.get("items") or [], _item_type(model))
+        self._data = data
+
+    def names(self) -> list[str | None]:
+        """Names of all items, read without validation."""
+        return [(item.get("metadata") or {}).get("name") for item in self.items.raw]
+
+    def guids(self) -> list[str | None]:
+        """GUIDs of all items, read without validation."""
+        return [(item.get("metadata") or {}).get("guid") for item in self.items.raw]
+
+    def to_model(self) -> BaseList[T]:
+        """Validate the whole response into the list model."""
+        return self.model.model_validate(self._data)
+
+    def __repr__(self) -> str:
+        return f"LazyList({self.model.__name__}, {len(self.items)} items)"
+
+
+_UNSET = object()
+
+
+def _item_type(model: type[BaseList]) -> type[BaseModel]:
+    """Item model of a BaseList subclass, e.g. Deployment for DeploymentList."""
+    annotation = model.model_fields["items"].annotation
+    for arg in (annotation, *get_args(annotation)):
+        if get_origin(arg) is list:
+            return get_args(arg)[0]
+    raise TypeError(f"{model.__name__} has no typed items")
+
+
 class Depends(BaseModel):
     name_or_guid: str = Field(
         validation_alias=AliasChoices("nameOrGUID", "nameOrGuid"),
@@ -213,4 +319,3 @@ class ValueFrom(BaseModel):
         alias="secretKeyRef",
         description="Selects a key of a Secret in the same namespace",
     )
-
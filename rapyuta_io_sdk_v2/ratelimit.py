@@ -0,0 +1,187 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Rate of a token bucket.
+
+    Args:
+        rate (float): Sustained number of requests per second.
+        burst (int, optional): Bucket capacity, i.e. the number of requests that may
+            be sent at once. Defaults to ``max(1, rate)``.
+    """
+
+    rate: float
+    burst: int | None = None
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens are reserved rather than polled: a caller that finds the bucket empty
+    takes a token from the future and is told how long to wait for it. Concurrent
+    callers therefore queue up behind each other and a burst is spread out at the
+    bucket rate instead of retrying in lockstep.
+    """
+
+    def __init__(
+        self,
+        limit: RateLimit,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if limit.rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate = float(limit.rate)
+        self.capacity = float(limit.burst or max(1.0, limit.rate))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens from the bucket.
+
+        Returns:
+            float: Seconds the caller must wait before the tokens are available.
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Client-side rate limiter with a token bucket per host and endpoint family.
+
+    A single limiter can be passed to any number of Client and AsyncClient
+    instances and is safe to use from many threads and event-loop tasks at once.
+
+    An endpoint family is matched when its name appears as a path segment of the
+    request URL, e.g. ``fileuploads`` matches
+    ``/v2/devices/<guid>/fileuploads/``. Requests wait for every bucket they match.
+
+    Args:
+        rate (float, optional): Requests per second allowed for each host. No
+            per-host limit is applied when omitted.
+        burst (int, optional): Bucket capacity of the per-host limit.
+        hosts (dict[str, RateLimit], optional): Limits overriding ``rate`` for
+            specific hostnames.
+        families (dict[str, RateLimit], optional): Limits for endpoint families such
+            as ``deployments``, ``configtrees`` or ``fileuploads``, applied per host.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        hosts: dict[str, RateLimit] | None = None,
+        families: dict[str, RateLimit] | None = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.default = RateLimit(rate, burst) if rate is not None else None
+        self.hosts = {host.lower(): limit for host, limit in (hosts or {}).items()}
+        self.families = dict(families or {})
+        self._clock = clock
+        self._buckets: dict[tuple[str, str | None], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str, family: str | None, limit: RateLimit) -> TokenBucket:
+        key = (host, family)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = TokenBucket(limit, clock=self._clock)
+                    self._buckets[key] = bucket
+        return bucket
+
+    def reserve(self, request: httpx.Request) -> float:
+        """Reserve a token for the request in every matching bucket.
+
+        Returns:
+            float: Seconds to wait before the request may be sent.
+        """
+        host = request.url.host.lower()
+        delay = 0.0
+
+        limit = self.hosts.get(host, self.default)
+        if limit is not None:
+            delay = self._bucket(host, None, limit).reserve()
+
+        if self.families:
+            segments = set(request.url.path.split("/"))
+            for family, limit in self.families.items():
+                if family in segments:
+                    delay = max(delay, self._bucket(host, family, limit).reserve())
+
+        return delay
+
+    def acquire(self, request: httpx.Request) -> None:
+        """Block the calling thread until the request may be sent."""
+        delay = self.reserve(request)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, request: httpx.Request) -> None:
+        """Suspend the calling task until the request may be sent."""
+        delay = self.reserve(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Transport that paces requests of the wrapped transport with a RateLimiter."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.limiter.acquire(request)
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Async transport that paces requests of the wrapped transport with a RateLimiter."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.limiter.acquire_async(request)
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,128 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import functools
+import typing
+
+import httpx
+from pydantic import BaseModel, TypeAdapter
+
+from rapyuta_io_sdk_v2.cache import PARSED_EXTENSION
+from rapyuta_io_sdk_v2.codec import JSONCodec
+from rapyuta_io_sdk_v2.models.utils import BaseList, LazyList
+
+ResponseMode = typing.Literal["model", "raw", "construct", "lazy"]
+
+# "model": validate the response into the model (default).
+# "raw": return the decoded JSON as plain dicts and lists. This is the cheapest
+#   mode, see benchmarks/response_modes.py.
+# "construct": shallow ``model_construct`` without validation. Nested objects stay
+#   dicts. About as cheap as "raw".
+# "lazy": return list responses as LazyList, which validates items on access.
+#   Other responses are validated as in "model".
+RESPONSE_MODES: tuple[str, ...] = typing.get_args(ResponseMode)
+
+M = typing.TypeVar("M", bound=BaseModel)
+
+_STDLIB_CODEC = JSONCodec()
+
+
+def check_response_mode(mode: str) -> str:
+    if mode not in RESPONSE_MODES:
+        raise ValueError(
+            f"invalid response mode {mode!r}, expected one of {', '.join(RESPONSE_MODES)}"
+        )
+    return mode
+
+
+def parse_response(
+    response: httpx.Response,
+    model: type[M],
+    mode: str = "model",
+    codec: JSONCodec | None = None,
+) -> M | typing.Any:
+    """Decode a response body into `model` according to the response mode.
+
+    Args:
+        response (httpx.Response): Successful response with a JSON body.
+        model (type[BaseModel]): Model describing the body.
+        mode (str, optional): One of "model", "raw", "construct" or "lazy".
+            Defaults to "model".
+        codec (JSONCodec, optional): Codec decoding the body in the "raw",
+            "construct" and "lazy" modes. Defaults to the standard library.
+
+    Returns:
+        The validated model, the decoded JSON, the unvalidated model or a LazyList.
+    """
+    check_response_mode(mode)
+    # Bodies revalidated by a ConditionalCache carry the models parsed from them
+    # before. Raw dicts are decoded again since callers commonly modify them.
+    parsed = response.extensions.get(PARSED_EXTENSION)
+    if parsed is not None and mode != "raw":
+        key = (model, mode)
+        if key not in parsed:
+            parsed[key] = _parse(response, model, mode, codec)
+        return parsed[key]
+    return _parse(response, model, mode, codec)
+
+
+def _parse(
+    response: httpx.Response,
+    model: type[M],
+    mode: str,
+    codec: JSONCodec | None,
+) -> M | typing.Any:
+    if mode == "model" or (mode == "lazy" and not issubclass(model, BaseList)):
+        return validate_json(model, response.content)
+
+    data = (codec or _STDLIB_CODEC).loads(response.content)
+    if mode == "raw":
+        return data
+    if mode == "construct":
+        return construct(model, data)
+    return LazyList(model, data)
+
+
+def validate_json(tp: type[M] | typing.Any, data: bytes | str) -> M | typing.Any:
+    """Validate a JSON document into `tp` in a single pass.
+
+    The JSON is parsed by pydantic-core while validating, instead of being decoded
+    into dicts first and validated afterwards.
+
+    Args:
+        tp: A model, or any type pydantic can validate such as ``list[Deployment]``.
+        data (bytes | str): JSON document.
+    """
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return tp.model_validate_json(data)
+    return type_adapter(tp).validate_json(data)
+
+
+@functools.lru_cache(maxsize=None)
+def type_adapter(tp: typing.Any) -> TypeAdapter:
+    """Cached TypeAdapter for `tp`; building one compiles a new validator."""
+    return TypeAdapter(tp)
+
+
+def construct(model: type[M], data: typing.Any) -> M | typing.Any:
+    """Build `model` from trusted data with ``model.model_construct``.
+
+    Only the top level is constructed: nested objects, such as the metadata of a
+    deployment or the items of a list, stay the decoded dicts and lists. Values
+    are neither validated nor coerced.
+    """
+    if not isinstance(data, dict):
+        return data
+    return model.model_construct(**data)
@@ -0,0 +1,208 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import typing
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRYABLE_EXCEPTIONS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+@dataclass
+class RetryEvent:
+    """Details of a retry, passed to ``RetryPolicy.on_retry``."""
+
+    request: httpx.Request
+    # Number of the retry about to be made, starting at 1.
+    attempt: int
+    # Seconds to wait before the retry.
+    delay: float
+    response: httpx.Response | None = None
+    exception: Exception | None = None
+
+
+@dataclass
+class RetryPolicy:
+    """Retry policy for transient server and connection errors.
+
+    Requests are retried with full-jitter exponential backoff, i.e. a random delay
+    between 0 and ``min(backoff_max, backoff_base * 2 ** retry)``. A ``Retry-After``
+    header sent with the response takes precedence over the computed delay.
+
+    Only idempotent methods are retried by default. POST requests are retried only
+    when ``retry_post`` is set.
+
+    Args:
+        max_retries (int): Maximum number of retries per request. Defaults to 3.
+        backoff_base (float): Base delay in seconds. Defaults to 0.5.
+        backoff_max (float): Upper bound of the computed delay. Defaults to 30.
+        max_elapsed (float, optional): Total time budget in seconds for a request
+            including retries. No retry is made once it would be exceeded.
+        methods (frozenset[str]): HTTP methods that may be retried.
+        retry_post (bool): Also retry POST requests. Defaults to False.
+        status_codes (frozenset[int]): Response status codes that are retried.
+        respect_retry_after (bool): Honour the ``Retry-After`` header. Defaults to True.
+        on_retry (callable, optional): Called with a RetryEvent before every retry.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_elapsed: float | None = None
+    methods: frozenset[str] = IDEMPOTENT_METHODS
+    retry_post: bool = False
+    status_codes: frozenset[int] = RETRYABLE_STATUS_CODES
+    respect_retry_after: bool = True
+    on_retry: typing.Callable[[RetryEvent], None] | None = field(default=None, repr=False)
+
+    def is_retryable_method(self, method: str) -> bool:
+        method = method.upper()
+        return method in self.methods or (self.retry_post and method == "POST")
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter delay before the given retry (starting at 1)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (retry - 1)))
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self,
+        request: httpx.Request,
+        retry: int,
+        started_at: float,
+        response: httpx.Response | None = None,
+        exception: Exception | None = None,
+    ) -> float | None:
+        """Delay before the given retry, or None if the request must not be retried."""
+        if retry > self.max_retries or not self.is_retryable_method(request.method):
+            return None
+        if response is not None and response.status_code not in self.status_codes:
+            return None
+        if exception is not None and not isinstance(exception, RETRYABLE_EXCEPTIONS):
+            return None
+
+        delay = None
+        if response is not None and self.respect_retry_after:
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = self.backoff(retry)
+
+        if self.max_elapsed is not None:
+            if time.monotonic() - started_at + delay > self.max_elapsed:
+                return None
+
+        if self.on_retry is not None:
+            self.on_retry(
+                RetryEvent(
+                    request=request,
+                    attempt=retry,
+                    delay=delay,
+                    response=response,
+                    exception=exception,
+                )
+            )
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Transport that retries requests of the wrapped transport per RetryPolicy."""
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy) -> None:
+        self.transport = transport
+        self.policy = policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        retry = 1
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+            except Exception as exc:
+                delay = self.policy.next_delay(request, retry, started_at, exception=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.next_delay(
+                    request, retry, started_at, response=response
+                )
+                if delay is None:
+                    return response
+                response.close()
+
+            time.sleep(delay)
+            retry += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async transport that retries requests of the wrapped transport per RetryPolicy."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy) -> None:
+        self.transport = transport
+        self.policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        retry = 1
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except Exception as exc:
+                delay = self.policy.next_delay(request, retry, started_at, exception=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.next_delay(
+                    request, retry, started_at, response=response
+                )
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,149 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+
+import httpx
+
+from rapyuta_io_sdk_v2.cache import _WIRE_HEADERS, SCOPE_HEADERS, is_streamed
+
+
+def _flight_key(request: httpx.Request) -> tuple:
+    """Requests with the same key are answered with the same response."""
+    return (
+        str(request.url),
+        request.headers.get("authorization"),
+        tuple(request.headers.get(header) for header in SCOPE_HEADERS),
+        # Every request keeps its own correlation ID.
+        request.headers.get("x-request-id"),
+    )
+
+
+def _share(request: httpx.Request, response: httpx.Response) -> httpx.Response:
+    """Copy of a response whose body has been read, for another request."""
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=[
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in _WIRE_HEADERS
+        ],
+        content=response.content,
+        request=request,
+        extensions={
+            name: value
+            for name, value in response.extensions.items()
+            if name != "network_stream"
+        },
+    )
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: httpx.Response | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlightTransport(httpx.BaseTransport):
+    """Transport sending concurrent identical GET requests only once.
+
+    The first GET request for a URL is sent; threads requesting the same URL with
+    the same credentials, organization/project headers and request ID while it is
+    in flight wait for it and receive a copy of its response, or the exception it
+    raised. Requests with different request IDs are never shared.
+    Streamed requests, e.g. deployment logs, are always sent on their own.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self.transport = transport
+        self._flights: dict[tuple, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET" or is_streamed(request):
+            return self.transport.handle_request(request)
+
+        key = _flight_key(request)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _share(request, flight.response)
+
+        try:
+            response = self.transport.handle_request(request)
+            response.read()
+            flight.response = response
+            return response
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncSingleFlightTransport(httpx.AsyncBaseTransport):
+    """Async transport sending concurrent identical GET requests only once.
+
+    See SingleFlightTransport. The shared request runs in its own task, so a
+    caller being cancelled does not cancel it for the others.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+        self._flights: dict[tuple, asyncio.Future] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET" or is_streamed(request):
+            return await self.transport.handle_async_request(request)
+
+        key = _flight_key(request)
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._send(request))
+            self._flights[key] = flight
+            flight.add_done_callback(functools.partial(self._land, key))
+
+        response = await asyncio.shield(flight)
+        return _share(request, response)
+
+    def _land(self, key: tuple, flight: asyncio.Future) -> None:
+        self._flights.pop(key, None)
+        # Every caller may have been cancelled; retrieve the exception so that
+        # asyncio does not report it as never retrieved.
+        if not flight.cancelled():
+            flight.exception()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
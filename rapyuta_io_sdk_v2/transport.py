@@ -0,0 +1,341 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+import httpx
+
+from rapyuta_io_sdk_v2.cache import (
+    AsyncCacheTransport,
+    AsyncConditionalTransport,
+    AsyncPackageCacheTransport,
+    CacheTransport,
+    ConditionalCache,
+    ConditionalTransport,
+    PackageCache,
+    PackageCacheTransport,
+    ResponseCache,
+)
+from rapyuta_io_sdk_v2.config import Configuration
+from rapyuta_io_sdk_v2.ratelimit import (
+    AsyncRateLimitTransport,
+    RateLimiter,
+    RateLimitTransport,
+)
+from rapyuta_io_sdk_v2.retry import AsyncRetryTransport, RetryPolicy, RetryTransport
+from rapyuta_io_sdk_v2.singleflight import (
+    AsyncSingleFlightTransport,
+    SingleFlightTransport,
+)
+
+
+@dataclass
+class PoolLimits:
+    """Connection limits of a ConnectionPool.
+
+    Limits given for a host in ``host_limits`` apply to that host alone. The
+    default ``limits`` are shared by all other hosts together, e.g. at most 100
+    connections in total across them.
+
+    Args:
+        max_connections (int, optional): Maximum number of concurrent connections.
+            Defaults to 100.
+        max_keepalive_connections (int, optional): Maximum number of idle connections
+            kept alive for reuse. Defaults to 20.
+        keepalive_expiry (float, optional): Seconds after which an idle connection is
+            closed. Defaults to 30.
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 30.0
+
+    def to_httpx(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+def _host_key(host: str | None) -> str | None:
+    """Normalize a host URL (``https://api.rapyuta.io``) or hostname to a hostname."""
+    if not host:
+        return None
+    if "://" in host:
+        return httpx.URL(host).host
+    return host.lower()
+
+
+class ConnectionPool:
+    """Connection pool that can be shared between Client and AsyncClient instances.
+
+    The pool owns the underlying connections. Clients created with the same pool
+    reuse its sockets, so e.g. one client per project does not open a new set of
+    connections for every client. Closing a client does not close a pool passed to
+    it; call ``close``/``aclose`` once all clients sharing it are done. A client
+    created without a pool closes its private pool when it is closed.
+
+    Args:
+        limits (PoolLimits, optional): Limits shared by all hosts without an entry
+            in ``host_limits``. Defaults to PoolLimits().
+        host_limits (dict[str, PoolLimits], optional): Per-host limits keyed by host
+            URL or hostname, e.g. separate limits for ``rip_host`` and ``v2api_host``.
+            Each of these hosts gets its own connections, limited separately.
+        http2 (bool, optional): Enable HTTP/2. Requires the ``h2`` package
+            (``pip install httpx[http2]``). Defaults to False.
+    """
+
+    def __init__(
+        self,
+        limits: PoolLimits | None = None,
+        host_limits: dict[str, PoolLimits] | None = None,
+        http2: bool = False,
+    ) -> None:
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "http2=True requires the 'h2' package, "
+                    "install it with `pip install httpx[http2]`"
+                )
+
+        self.limits = limits or PoolLimits()
+        self.host_limits = {
+            _host_key(host): host_limit
+            for host, host_limit in (host_limits or {}).items()
+        }
+        self.http2 = http2
+
+        self._lock = threading.Lock()
+        self._transports: dict[str | None, httpx.HTTPTransport] = {}
+        self._async_transports: dict[str | None, httpx.AsyncHTTPTransport] = {}
+        self._transport = _PooledTransport(self)
+        self._async_transport = _AsyncPooledTransport(self)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Configuration,
+        limits: PoolLimits | None = None,
+        v2api_limits: PoolLimits | None = None,
+        rip_limits: PoolLimits | None = None,
+        http2: bool = False,
+    ) -> ConnectionPool:
+        """Create a pool with separate limits for the hosts of a configuration.
+
+        Args:
+            config (Configuration): Configuration providing ``v2api_host`` and ``rip_host``.
+            limits (PoolLimits, optional): Limits shared by all other hosts.
+            v2api_limits (PoolLimits, optional): Limits for ``v2api_host``.
+            rip_limits (PoolLimits, optional): Limits for ``rip_host``.
+            http2 (bool, optional): Enable HTTP/2. Defaults to False.
+
+        Returns:
+            ConnectionPool: The connection pool.
+        """
+        host_limits = {}
+        if v2api_limits is not None and config.hosts.get("v2api_host"):
+            host_limits[config.hosts["v2api_host"]] = v2api_limits
+        if rip_limits is not None and config.hosts.get("rip_host"):
+            host_limits[config.hosts["rip_host"]] = rip_limits
+
+        return cls(limits=limits, host_limits=host_limits, http2=http2)
+
+    def transport(self, owned: bool = False) -> httpx.BaseTransport:
+        """Transport to pass to an ``httpx.Client`` using this pool.
+
+        Args:
+            owned (bool, optional): Close the pool when the transport is closed.
+                Only for a pool used by a single client. Defaults to False.
+        """
+        return _PooledTransport(self, owned=True) if owned else self._transport
+
+    def async_transport(self, owned: bool = False) -> httpx.AsyncBaseTransport:
+        """Transport to pass to an ``httpx.AsyncClient`` using this pool.
+
+        Async connections are bound to the event loop they were opened on, so a pool
+        should only be shared between async clients running on the same loop.
+
+        Args:
+            owned (bool, optional): Close the pool when the transport is closed.
+                Only for a pool used by a single client. Defaults to False.
+        """
+        if owned:
+            return _AsyncPooledTransport(self, owned=True)
+        return self._async_transport
+
+    def _limits_for(self, key: str | None) -> PoolLimits:
+        return self.host_limits.get(key, self.limits)
+
+    def _transport_for(self, host: str) -> httpx.HTTPTransport:
+        key = _host_key(host)
+        if key not in self.host_limits:
+            key = None
+
+        transport = self._transports.get(key)
+        if transport is None:
+            with self._lock:
+                transport = self._transports.get(key)
+                if transport is None:
+                    transport = httpx.HTTPTransport(
+                        limits=self._limits_for(key).to_httpx(), http2=self.http2
+                    )
+                    self._transports[key] = transport
+        return transport
+
+    def _async_transport_for(self, host: str) -> httpx.AsyncHTTPTransport:
+        key = _host_key(host)
+        if key not in self.host_limits:
+            key = None
+
+        transport = self._async_transports.get(key)
+        if transport is None:
+            with self._lock:
+                transport = self._async_transports.get(key)
+                if transport is None:
+                    transport = httpx.AsyncHTTPTransport(
+                        limits=self._limits_for(key).to_httpx(), http2=self.http2
+                    )
+                    self._async_transports[key] = transport
+        return transport
+
+    def close(self) -> None:
+        """Close all sync connections held by the pool."""
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+        for transport in transports:
+            transport.close()
+
+    async def aclose(self) -> None:
+        """Close all async connections held by the pool."""
+        with self._lock:
+            transports = list(self._async_transports.values())
+            self._async_transports.clear()
+        for transport in transports:
+            await transport.aclose()
+
+
+class _PooledTransport(httpx.BaseTransport):
+    """Routes requests to the per-host transports of a ConnectionPool."""
+
+    def __init__(self, pool: ConnectionPool, owned: bool = False) -> None:
+        self.pool = pool
+        self.owned = owned
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.pool._transport_for(request.url.host).handle_request(request)
+
+    def close(self) -> None:
+        # A shared pool may still be used by other clients, so only a pool owned
+        # by this transport's client is torn down with it.
+        if self.owned:
+            self.pool.close()
+
+
+class _AsyncPooledTransport(httpx.AsyncBaseTransport):
+    """Routes requests to the per-host async transports of a ConnectionPool."""
+
+    def __init__(self, pool: ConnectionPool, owned: bool = False) -> None:
+        self.pool = pool
+        self.owned = owned
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = self.pool._async_transport_for(request.url.host)
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # See _PooledTransport.close.
+        if self.owned:
+            await self.pool.aclose()
+
+
+def build_transport(
+    pool: ConnectionPool,
+    retry: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    cache: ResponseCache | None = None,
+    package_cache: PackageCache | None = None,
+    conditional_cache: ConditionalCache | None = None,
+    single_flight: bool = False,
+    owns_pool: bool = False,
+) -> httpx.BaseTransport:
+    """Stack the optional client middleware on top of the pool transport.
+
+    Every retry attempt goes through the rate limiter, so retries are paced too.
+    Cached responses are served before either of them, and published package
+    versions before any other cached response. Requests missing both caches are
+    coalesced with identical requests in flight, then revalidated with the
+    conditional cache.
+
+    Args:
+        pool (ConnectionPool): Pool the requests are sent through.
+        retry (RetryPolicy, optional): Retry policy for transient errors.
+        rate_limiter (RateLimiter, optional): Client-side rate limiter.
+        cache (ResponseCache, optional): Cache for GET responses.
+        package_cache (PackageCache, optional): Cache for published package versions.
+        conditional_cache (ConditionalCache, optional): Validators for conditional
+            GET requests.
+        single_flight (bool, optional): Send concurrent identical GET requests once.
+        owns_pool (bool, optional): Close the pool when the transport is closed.
+            Defaults to False.
+
+    Returns:
+        httpx.BaseTransport: Transport to pass to ``httpx.Client``.
+    """
+    transport = pool.transport(owned=owns_pool)
+    if rate_limiter is not None:
+        transport = RateLimitTransport(transport, rate_limiter)
+    if retry is not None:
+        transport = RetryTransport(transport, retry)
+    if conditional_cache is not None:
+        transport = ConditionalTransport(transport, conditional_cache)
+    if single_flight:
+        transport = SingleFlightTransport(transport)
+    if cache is not None:
+        transport = CacheTransport(transport, cache)
+    if package_cache is not None:
+        transport = PackageCacheTransport(transport, package_cache)
+    return transport
+
+
+def build_async_transport(
+    pool: ConnectionPool,
+    retry: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    cache: ResponseCache | None = None,
+    package_cache: PackageCache | None = None,
+    conditional_cache: ConditionalCache | None = None,
+    single_flight: bool = False,
+    owns_pool: bool = False,
+) -> httpx.AsyncBaseTransport:
+    """Async counterpart of ``build_transport``."""
+    transport = pool.async_transport(owned=owns_pool)
+    if rate_limiter is not None:
+        transport = AsyncRateLimitTransport(transport, rate_limiter)
+    if retry is not None:
+        transport = AsyncRetryTransport(transport, retry)
+    if conditional_cache is not None:
+        transport = AsyncConditionalTransport(transport, conditional_cache)
+    if single_flight:
+        transport = AsyncSingleFlightTransport(transport)
+    if cache is not None:
+        transport = AsyncCacheTransport(transport, cache)
+    if package_cache is not None:
+        transport = AsyncPackageCacheTransport(transport, package_cache)
+    return transport
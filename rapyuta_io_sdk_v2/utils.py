@@ -12,9 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # from rapyuta_io_sdk_v2.config import Configuration
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextvars
 import json
 import os
+import queue
 import sys
+import threading
 import typing
 
 import httpx
@@ -84,11 +91,105 @@ def get_default_app_dir(app_name: str) -> str:
     return os.path.join(xdg_config_home, app_name)
 
 
+def _page_items(data: typing.Any) -> tuple[list, typing.Any]:
+    """Extract the items and the next continuation token from a list response."""
+    if isinstance(data, dict):
+        items = data.get("items", [])
+        cont_next = data.get("metadata", {}).get("continue")
+    else:
+        items = getattr(data, "items", [])
+        cont_next = getattr(getattr(data, "metadata", {}), "continue_", None)
+    return items, cont_next
+
+
+def _iter_pages(
+    func: typing.Callable,
+    args: tuple,
+    kwargs: dict,
+    limit: int,
+    cont: int,
+) -> typing.Iterator[list]:
+    while True:
+        call_kwargs = dict(kwargs or {})
+        if "cont" not in call_kwargs:
+            call_kwargs["cont"] = cont
+        if "limit" not in call_kwargs:
+            call_kwargs["limit"] = limit
+
+        data = func(*args, **call_kwargs)
+        items, cont_next = _page_items(data)
+
+        if not items:
+            break
+
+        yield items
+
+        if cont_next is None or len(items) < limit:
+            break
+
+        cont = cont_next
+
+
+def _prefetch_pages(pages: typing.Iterator[list], depth: int) -> typing.Iterator[list]:
+    """Fetch pages in a background thread, keeping up to `depth` pages buffered.
+
+    The next page is requested while the caller is still processing the current
+    one. Errors raised while fetching, including ``SystemExit`` and other
+    BaseExceptions, are re-raised in the caller, and closing the generator early
+    stops the background thread after its in-flight request.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: tuple[str, typing.Any]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not put(("page", page)):
+                    return
+        except BaseException as exc:
+            put(("error", exc))
+        else:
+            put(("done", None))
+
+    # The pages are fetched in the caller's context, to keep its scope.
+    context = contextvars.copy_context()
+    worker = threading.Thread(
+        target=context.run, args=(produce,), name="walk-pages-prefetch", daemon=True
+    )
+    worker.start()
+    try:
+        while True:
+            try:
+                kind, value = buffer.get(timeout=0.1)
+            except queue.Empty:
+                # Never wait for a thread that died without queueing a result.
+                if worker.is_alive() or not buffer.empty():
+                    continue
+                raise RuntimeError("the page prefetching thread stopped unexpectedly")
+            if kind == "done":
+                return
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        stop.set()
+
+
 def walk_pages(
     func: typing.Callable,
     *args,
     limit: int = 50,
     cont: int = 0,
+    prefetch: int = 0,
     **kwargs,
 ):
     """A generator function to paginate through list API results.
@@ -98,36 +199,36 @@ def walk_pages(
         *args: Positional arguments to pass to the API function.
         limit (int, optional): Maximum number of items to return. Defaults to 50.
         cont (int, optional): Initial continuation token. Defaults to 0.
+        prefetch (int, optional): Number of pages to fetch ahead in a background
+            thread while the current page is processed. `func` must then be safe to
+            call from another thread, which is the case for `Client` methods.
+            Defaults to 0 (no prefetching).
         **kwargs: Additional keyword arguments to pass to the API function.
 
     Yields:
         Dict[str, Any]: Each item from the API response.
     """
-    while True:
-        call_kwargs = dict(kwargs or {})
-        if "cont" not in call_kwargs:
-            call_kwargs["cont"] = cont
-        if "limit" not in call_kwargs:
-            call_kwargs["limit"] = limit
+    pages = _iter_pages(func, args, kwargs, limit, cont)
+    if prefetch > 0:
+        pages = _prefetch_pages(pages, prefetch)
 
-        data = func(*args, **call_kwargs)
+    yield from pages
 
-        if isinstance(data, dict):
-            items = data.get("items", [])
-            cont_next = data.get("metadata", {}).get("continue")
-        else:
-            items = getattr(data, "items", [])
-            cont_next = getattr(getattr(data, "metadata", {}), "continue_", None)
 
-        if not items:
-            break
+def walk_items(func: typing.Callable, *args, **kwargs) -> typing.Iterator:
+    """Iterate over the items of every page returned by `walk_pages`.
 
-        yield items
-
-        if cont_next is None or len(items) < limit:
-            break
+    Args:
+        func (callable): The API function to call, must accept `cont` and `limit` as arguments.
+        *args: Positional arguments to pass to `walk_pages`.
+        **kwargs: Keyword arguments to pass to `walk_pages`, e.g. `limit` and
+            `prefetch`.
 
-        cont = cont_next
+    Yields:
+        Any: Each item from the API responses.
+    """
+    for page in walk_pages(func, *args, **kwargs):
+        yield from page
 
 
 async def walk_pages_async(
@@ -135,6 +236,7 @@ async def walk_pages_async(
     *args,
     limit: int = 50,
     cont: int = 0,
+    concurrency: int = 1,
     **kwargs,
 ) -> typing.AsyncGenerator:
     """A generator function to paginate through list API results.
@@ -144,34 +246,106 @@ async def walk_pages_async(
         *args: Positional arguments to pass to the API function.
         limit (int, optional): Maximum number of items to return. Defaults to 50.
         cont (int, optional): Initial continuation token. Defaults to 0.
+        concurrency (int, optional): Maximum number of page requests in flight. With
+            a value above 1 the next page is fetched while the current one is being
+            consumed. If the continuation token turns out to be a plain integer
+            offset, up to `concurrency` offset pages are requested at once.
+            Defaults to 1 (pages are fetched one after another).
         **kwargs: Additional keyword arguments to pass to the API function.
 
     Yields:
         Dict[str, Any]: Each item from the API response.
     """
-    while True:
+
+    def fetch(cont: typing.Any) -> typing.Awaitable:
         call_kwargs = dict(kwargs or {})
         if "cont" not in call_kwargs:
             call_kwargs["cont"] = cont
         if "limit" not in call_kwargs:
             call_kwargs["limit"] = limit
+        return func(*args, **call_kwargs)
 
-        data = await func(*args, **call_kwargs)
+    if concurrency <= 1:
+        while True:
+            items, cont_next = _page_items(await fetch(cont))
 
-        if isinstance(data, dict):
-            items = data.get("items", [])
-            cont_next = data.get("metadata", {}).get("continue")
-        else:
-            items = getattr(data, "items", [])
-            cont_next = getattr(getattr(data, "metadata", {}), "continue_", None)
+            if not items:
+                break
 
-        if not items:
-            break
+            yield items
 
-        yield items
+            if cont_next is None or len(items) < limit:
+                break
 
-        if cont_next is None or len(items) < limit:
-            break
+            cont = cont_next
+        return
 
-        cont = cont_next
+    # Requests scheduled ahead of the consumer, in page order.
+    pending: collections.deque[tuple[typing.Any, asyncio.Task]] = collections.deque()
+    try:
+        items, cont_next = _page_items(await fetch(cont))
+        offsets = _is_offset(cont, items, cont_next)
+
+        while items:
+            if cont_next is None or len(items) < limit:
+                yield items
+                return
+
+            if offsets:
+                next_cont = pending[-1][0] + limit if pending else cont_next
+                while len(pending) < concurrency:
+                    pending.append((next_cont, asyncio.ensure_future(fetch(next_cont))))
+                    next_cont += limit
+            elif not pending:
+                pending.append((cont_next, asyncio.ensure_future(fetch(cont_next))))
+
+            yield items
+
+            cont, task = pending.popleft()
+            items, cont_next = _page_items(await task)
+
+            if offsets and len(items) == limit and not _is_offset(cont, items, cont_next):
+                # The server is not paging by offset after all: drop the
+                # speculative requests and follow the tokens it returns.
+                offsets = False
+                _cancel_all(pending)
+    finally:
+        _cancel_all(pending)
+
+
+def _is_offset(cont: typing.Any, items: list, cont_next: typing.Any) -> bool:
+    """Whether `cont_next` is the integer offset following a page of `items`."""
+    return type(cont) is int and type(cont_next) is int and cont_next == cont + len(items)
+
+
+def _cancel_all(pending: collections.deque) -> None:
+    while pending:
+        _, task = pending.popleft()
+        if task.done():
+            if not task.cancelled():
+                # Retrieve the result so failed speculative requests are not
+                # reported as unhandled.
+                task.exception()
+        else:
+            task.cancel()
+
+
+async def walk_items_async(
+    func: typing.Callable,
+    *args,
+    **kwargs,
+) -> typing.AsyncGenerator:
+    """Iterate over the items of every page returned by `walk_pages_async`.
 
+    Args:
+        func (callable): The API function to call, must accept `cont` and `limit` as arguments.
+        *args: Positional arguments to pass to `walk_pages_async`.
+        **kwargs: Keyword arguments to pass to `walk_pages_async`, e.g. `limit` and
+            `concurrency`.
+
+    Yields:
+        Any: Each item from the API responses.
+    """
+    async for page in walk_pages_async(func, *args, **kwargs):
+        for item in page:
+            yield item
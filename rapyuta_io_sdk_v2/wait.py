@@ -0,0 +1,71 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import typing
+from dataclasses import dataclass
+
+from rapyuta_io_sdk_v2.exceptions import DeploymentFailedError
+from rapyuta_io_sdk_v2.models import Deployment
+
+FAILED_PHASES = ("FailedToStart", "FailedToUpdate")
+
+
+@dataclass
+class PollPolicy:
+    """Adaptive polling interval of the ``wait_for_*`` methods.
+
+    Polls are frequent at first, when a quick result is likely, and back off
+    geometrically up to ``max_interval`` for slow rollouts.
+
+    Args:
+        interval (float): Seconds before the second poll. Defaults to 1.
+        factor (float): Growth of the interval after every poll. Defaults to 1.5.
+        max_interval (float): Upper bound of the interval. Defaults to 15.
+    """
+
+    interval: float = 1.0
+    factor: float = 1.5
+    max_interval: float = 15.0
+
+    def intervals(self) -> typing.Iterator[float]:
+        interval = self.interval
+        while True:
+            yield min(interval, self.max_interval)
+            interval *= self.factor
+
+
+def deployment_ready(
+    deployment: Deployment,
+    phases: typing.Collection[str],
+    statuses: typing.Collection[str] | None = None,
+) -> bool:
+    """Whether the deployment reached one of the phases (and statuses).
+
+    Raises:
+        DeploymentFailedError: The deployment is in a failed phase that is not
+            awaited.
+    """
+    status = deployment.status
+    phase = status.phase if status is not None else None
+    if phase in FAILED_PHASES and phase not in phases:
+        errors = ", ".join(status.error_codes or [])
+        raise DeploymentFailedError(
+            f"deployment {deployment.metadata.name} is {phase}"
+            + (f": {errors}" if errors else ""),
+            deployment=deployment,
+        )
+    if phase not in phases:
+        return False
+    return statuses is None or status.status in statuses
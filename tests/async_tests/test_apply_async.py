@@ -0,0 +1,47 @@
+import asyncio
+import copy
+
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import apply_resources_async
+from rapyuta_io_sdk_v2.exceptions import HttpNotFoundError
+from tests.utils.fixtures import async_client
+from tests.data import cloud_deployment_model_mock
+
+
+@pytest.mark.asyncio
+async def test_apply_resources_async(async_client, cloud_deployment_model_mock, mocker):
+    created, waited, active, peak = [], [], [0], [0]
+
+    async def create(body, **kwargs):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        created.append(body.metadata.name)
+        return body
+
+    async def wait(name, **kwargs):
+        waited.append(name)
+
+    mocker.patch.object(async_client, "get_deployment", side_effect=HttpNotFoundError())
+    mocker.patch.object(async_client, "create_deployment", side_effect=create)
+    mocker.patch.object(async_client, "wait_for_deployment", side_effect=wait)
+
+    def deployment(name, *depends):
+        body = copy.deepcopy(cloud_deployment_model_mock)
+        body["metadata"]["name"] = name
+        body["spec"]["depends"] = [
+            {"kind": "deployment", "nameOrGUID": dep} for dep in depends
+        ]
+        return body
+
+    resources = [deployment("base")] + [deployment(f"w-{i}", "base") for i in range(4)]
+    applied = await apply_resources_async(async_client, resources, concurrency=2)
+
+    assert created[0] == "base"
+    assert waited == ["base"]
+    assert peak[0] == 2
+    assert len(applied) == 5
+    assert {result.action for result in applied.values()} == {"created"}
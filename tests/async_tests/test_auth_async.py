@@ -0,0 +1,32 @@
+import asyncio
+import base64
+import json
+
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import AsyncTokenManager
+from tests.utils.fixtures import async_client
+
+
+def jwt(**claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+@pytest.mark.asyncio
+async def test_async_background_refresh(async_client, mocker):
+    refreshed = asyncio.Event()
+    async_client.config.auth_token = jwt(exp=1100)
+
+    async def refresh_token():
+        async_client.config.auth_token = jwt(exp=100000)
+        refreshed.set()
+
+    mocker.patch.object(async_client, "refresh_token", side_effect=refresh_token)
+
+    async with AsyncTokenManager(async_client, clock=lambda: 1000.0) as manager:
+        await asyncio.wait_for(refreshed.wait(), 1)
+
+    assert await manager.expires_at() == 100000.0
+    assert manager._task is None
@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import PollPolicy
+from rapyuta_io_sdk_v2.exceptions import BulkError, HttpNotFoundError
+from tests.utils.fixtures import async_client
+
+GONE = httpx.Response(status_code=404, json={"error": "not found"})
+
+
+@pytest.mark.asyncio
+async def test_delete_many_async(async_client, mocker):
+    deleted, active, peak = [], [0], [0]
+
+    async def delete(url, **kwargs):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        deleted.append(httpx.URL(url).path)
+        return httpx.Response(status_code=204)
+
+    mocker.patch("httpx.AsyncClient.delete", side_effect=delete)
+    mocker.patch("httpx.AsyncClient.get", return_value=GONE)
+    keys = ["disk:data"] + [f"deployment:d{i}" for i in range(4)]
+
+    results = await async_client.delete_many(keys, concurrency=2)
+
+    assert all(result.ok for result in results)
+    assert deleted[-1] == "/v2/disks/data/"
+    assert peak[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_many_async_fail_fast(async_client, mocker):
+    mocker.patch("httpx.AsyncClient.delete", return_value=httpx.Response(status_code=404))
+    mocker.patch("httpx.AsyncClient.get", return_value=GONE)
+
+    with pytest.raises(BulkError) as exc:
+        await async_client.delete_many(
+            ["deployment:a", "disk:b"], concurrency=1, fail_fast=True
+        )
+
+    assert isinstance(exc.value.results[0].error, HttpNotFoundError)
+    assert exc.value.results[1].skipped
+
+
+@pytest.mark.asyncio
+async def test_delete_many_async_waits_until_deployments_are_gone(async_client, mocker):
+    events = []
+
+    async def get(url, **kwargs):
+        events.append("get")
+        if events.count("get") < 3:
+            return httpx.Response(status_code=200, json={})
+        return GONE
+
+    async def delete(url, **kwargs):
+        events.append(f"delete {httpx.URL(url).path}")
+        return httpx.Response(status_code=204)
+
+    mocker.patch("httpx.AsyncClient.get", side_effect=get)
+    mocker.patch("httpx.AsyncClient.delete", side_effect=delete)
+
+    results = await async_client.delete_many(
+        ["disk:data", "network:net"],
+        poll=PollPolicy(interval=0.01),
+    )
+
+    assert all(result.ok for result in results)
+    assert events == [
+        "delete /v2/networks/net/",
+        "get",
+        "get",
+        "get",
+        "delete /v2/disks/data/",
+    ]
@@ -0,0 +1,197 @@
+import asyncio
+
+import httpx
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import (
+    AsyncClient,
+    ConditionalCache,
+    Deployment,
+    Package,
+    PackageCache,
+    ResponseCache,
+)
+from rapyuta_io_sdk_v2.cache import AsyncCacheTransport, AsyncPackageCacheTransport
+from tests.data import cloud_deployment_model_mock, cloud_package_model_mock
+
+URL = "https://api.rapyuta.io/v2/packages/pkg/"
+
+
+def _client(cache, calls):
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        return httpx.Response(status_code=200, json={"n": len(calls)})
+
+    transport = AsyncCacheTransport(httpx.MockTransport(handler), cache)
+    return httpx.AsyncClient(transport=transport)
+
+
+@pytest.mark.asyncio
+async def test_async_get_is_served_from_cache():
+    cache, calls = ResponseCache(), []
+
+    async with _client(cache, calls) as c:
+        first = await c.get(URL)
+        second = await c.get(URL)
+
+    assert first.json() == second.json() == {"n": 1}
+    assert len(calls) == 1
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_async_writes_invalidate_the_resource():
+    cache, calls = ResponseCache(), []
+
+    async with _client(cache, calls) as c:
+        await c.get(URL)
+        await c.delete(URL)
+        await c.get(URL)
+
+    assert calls == [
+        ("GET", "/v2/packages/pkg/"),
+        ("DELETE", "/v2/packages/pkg/"),
+        ("GET", "/v2/packages/pkg/"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_get_in_flight_during_a_write_is_not_cached():
+    cache, calls = ResponseCache(), []
+    sent, release = asyncio.Event(), asyncio.Event()
+
+    async def handler(request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            sent.set()
+            await release.wait()
+        return httpx.Response(status_code=200, json={"n": len(calls)})
+
+    transport = AsyncCacheTransport(httpx.MockTransport(handler), cache)
+    async with httpx.AsyncClient(transport=transport) as c:
+        reader = asyncio.create_task(c.get(URL))
+        await sent.wait()
+        await c.put(URL)
+        release.set()
+        await reader
+
+        assert (await c.get(URL)).json() == {"n": 3}
+
+    assert calls == ["GET", "PUT", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_async_client_with_cache(mocker):
+    cache = ResponseCache(ttls={"configtrees": 30})
+    client = AsyncClient(cache=cache)
+    handle_request = mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        side_effect=lambda request: httpx.Response(
+            status_code=200, json={"metadata": {"name": "tree"}}
+        ),
+    )
+
+    assert await client.get_configtree("tree") == {"metadata": {"name": "tree"}}
+    assert await client.get_configtree("tree") == {"metadata": {"name": "tree"}}
+
+    assert handle_request.call_count == 1
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_async_streamed_logs_are_not_buffered_or_cached(mocker):
+    events = []
+
+    def handler(request):
+        async def body():
+            events.append("sent:one")
+            yield b"one\n"
+            events.append("sent:two")
+            yield b"two\n"
+
+        return httpx.Response(status_code=200, content=body())
+
+    client = AsyncClient(cache=ResponseCache())
+    handle_request = mocker.patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", side_effect=handler
+    )
+
+    async for line in client.stream_deployment_logs("dep", "exec"):
+        events.append(line)
+    assert [line async for line in client.stream_deployment_logs("dep", "exec")] == [
+        "one",
+        "two",
+    ]
+
+    assert events[:4] == ["sent:one", "one", "sent:two", "two"]
+    assert handle_request.call_count == 2
+    assert len(client.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_package_versions_are_cached(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        return httpx.Response(status_code=200, json={"n": len(calls)})
+
+    cache = PackageCache(persist=True, path=str(tmp_path))
+    transport = AsyncPackageCacheTransport(httpx.MockTransport(handler), cache)
+    async with httpx.AsyncClient(transport=transport) as c:
+        first = await c.get(URL, params={"version": "v1"})
+        second = await c.get(URL, params={"version": "v1"})
+        await c.delete(URL, params={"version": "v1"})
+        await c.get(URL, params={"version": "v1"})
+
+    assert first.json() == second.json() == {"n": 1}
+    assert calls == [
+        ("GET", "/v2/packages/pkg/"),
+        ("DELETE", "/v2/packages/pkg/"),
+        ("GET", "/v2/packages/pkg/"),
+    ]
+    assert len(list(tmp_path.rglob("*.json"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_with_package_cache(cloud_package_model_mock, mocker):
+    client = AsyncClient(package_cache=PackageCache())
+    handle_request = mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        return_value=httpx.Response(status_code=200, json=cloud_package_model_mock),
+    )
+
+    first = await client.get_package("gostproxy", version="v1.0.0")
+    second = await client.get_package("gostproxy", version="v1.0.0")
+
+    assert isinstance(second, Package)
+    assert first == second
+    assert handle_request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_with_conditional_cache(cloud_deployment_model_mock, mocker):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(status_code=304, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            status_code=200, headers={"ETag": '"v1"'}, json=cloud_deployment_model_mock
+        )
+
+    client = AsyncClient(conditional_cache=ConditionalCache())
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", side_effect=handler
+    )
+
+    first = await client.get_deployment("dep")
+    second = await client.get_deployment("dep")
+
+    assert isinstance(first, Deployment)
+    assert second is first
+    assert requests[1].headers["If-None-Match"] == '"v1"'
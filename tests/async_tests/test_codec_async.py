@@ -0,0 +1,54 @@
+import httpx
+import pytest
+
+from rapyuta_io_sdk_v2 import AsyncClient
+from rapyuta_io_sdk_v2.codec import AsyncCodecClient, JSONCodec
+
+
+class RecordingCodec(JSONCodec):
+    def __init__(self):
+        self.dumped = []
+        self.loaded = []
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+@pytest.mark.asyncio
+async def test_async_codec_client_encodes_json_bodies():
+    codec = RecordingCodec()
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200)
+
+    async with AsyncCodecClient(transport=httpx.MockTransport(handler), codec=codec) as c:
+        await c.post("https://api.rapyuta.io/v2/disks/", json={"name": "disk"})
+
+    assert codec.dumped == [{"name": "disk"}]
+    assert requests[0].content == b'{"name":"disk"}'
+    assert requests[0].headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_codec(mocker):
+    codec = RecordingCodec()
+    client = AsyncClient(codec=codec)
+    handle_request = mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        return_value=httpx.Response(status_code=200, json={"metadata": {"name": "t"}}),
+    )
+
+    response = await client.create_configtree({"metadata": {"name": "t"}})
+
+    assert response == {"metadata": {"name": "t"}}
+    assert codec.dumped == [{"metadata": {"name": "t"}}]
+    assert len(codec.loaded) == 1
+    assert handle_request.call_args.args[0].content == b'{"metadata":{"name":"t"}}'
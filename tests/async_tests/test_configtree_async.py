@@ -189,6 +189,23 @@ async def test_list_revisions_success(async_client, mocker: AsyncMock):
     ]
 
 
+@pytest.mark.asyncio
+async def test_iter_revisions_success(async_client, mocker: AsyncMock):
+    mock_get = mocker.patch("httpx.AsyncClient.get")
+    mock_get.return_value = httpx.Response(
+        status_code=200,
+        json={
+            "metadata": {"continue": 1},
+            "items": [{"name": "test-revision", "guid": "mock_revision_guid"}],
+        },
+    )
+    revisions = [
+        r async for r in async_client.iter_revisions(tree_name="mock_configtree_name")
+    ]
+    assert revisions == [{"name": "test-revision", "guid": "mock_revision_guid"}]
+    assert "mock_configtree_name" in mock_get.call_args.kwargs["url"]
+
+
 @pytest.mark.asyncio
 async def test_create_revision_success(async_client, mocker: AsyncMock):
     # Mock the httpx.AsyncClient.post method
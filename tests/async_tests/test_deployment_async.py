@@ -4,6 +4,7 @@ from pytest_mock import MockFixture
 
 # ruff: noqa: F811, F401
 from rapyuta_io_sdk_v2.models import DeploymentList, Deployment
+from rapyuta_io_sdk_v2.exceptions import DeploymentFailedError
 from rapyuta_io_sdk_v2.models.deployment import EnvArgsSpec
 from tests.utils.fixtures import async_client
 from tests.data import (
@@ -55,6 +56,35 @@ async def test_list_deployments_not_found(async_client, mocker: MockFixture):
     assert str(exc.value) == "not found"
 
 
+@pytest.mark.asyncio
+async def test_iter_deployments_success(
+    async_client, deploymentlist_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.AsyncClient.get")
+    first, second = dict(deploymentlist_model_mock), dict(deploymentlist_model_mock)
+    first["metadata"] = {"continue": 2}
+    second["items"] = deploymentlist_model_mock["items"][:1]
+    second["metadata"] = {"continue": 3}
+    mock_get.side_effect = [
+        httpx.Response(status_code=200, json=first),
+        httpx.Response(status_code=200, json=second),
+    ]
+
+    deployments = [
+        d async for d in async_client.iter_deployments(limit=2, phases=["InProgress"])
+    ]
+
+    assert [d.metadata.guid for d in deployments] == [
+        "dep-cloud-001",
+        "dep-device-001",
+        "dep-cloud-001",
+    ]
+    assert all(isinstance(d, Deployment) for d in deployments)
+    assert mock_get.call_count == 2
+    assert mock_get.call_args_list[1].kwargs["params"]["continue"] == 2
+    assert mock_get.call_args_list[1].kwargs["params"]["phases"] == ["InProgress"]
+
+
 @pytest.mark.asyncio
 async def test_get_cloud_deployment_success(
     async_client, cloud_deployment_model_mock, mocker: MockFixture
@@ -289,3 +319,34 @@ def test_env_args_spec_plain_and_valuefrom_coexist():
     assert arg.valueFrom.secret_key_ref.value == "injected"
 
 
+@pytest.mark.asyncio
+async def test_wait_for_deployment_success(
+    async_client, cloud_deployment_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.AsyncClient.get")
+    mock_get.side_effect = [
+        httpx.Response(
+            200, json={**cloud_deployment_model_mock, "status": {"phase": phase}}
+        )
+        for phase in ("InProgress", "Succeeded")
+    ]
+    mock_sleep = mocker.patch("asyncio.sleep")
+
+    deployment = await async_client.wait_for_deployment("cloud_deployment_sample")
+
+    assert deployment.status.phase == "Succeeded"
+    mock_sleep.assert_awaited_once_with(1.0)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_deployments_fails_fast(
+    async_client, cloud_deployment_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.AsyncClient.get")
+    failed = {**cloud_deployment_model_mock, "status": {"phase": "FailedToUpdate"}}
+    mock_get.return_value = httpx.Response(200, json={"metadata": {}, "items": [failed]})
+
+    with pytest.raises(DeploymentFailedError):
+        await async_client.wait_for_deployments(["cloud_deployment_sample", "other"])
+
+    assert mock_get.call_count == 1
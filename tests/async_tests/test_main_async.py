@@ -0,0 +1,106 @@
+import asyncio
+
+import httpx
+import pytest
+from pytest_mock import MockFixture
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2.exceptions import UnauthorizedAccessError
+from tests.utils.fixtures import async_client
+
+
+@pytest.mark.asyncio
+async def test_get_auth_token_success(async_client, mocker: MockFixture):
+    mock_post = mocker.patch("httpx.AsyncClient.post")
+    mock_post.return_value = httpx.Response(
+        status_code=200,
+        json={"success": True, "data": {"token": "mock_token"}},
+    )
+
+    response = await async_client.get_auth_token(
+        email="mock_email", password="mock_password"
+    )
+
+    assert response == "mock_token"
+
+
+@pytest.mark.asyncio
+async def test_login_success(async_client, mocker: MockFixture):
+    mocker.patch.object(async_client, "get_auth_token", return_value="mock_token_2")
+
+    await async_client.login(email="mock_email", password="mock_password")
+
+    assert async_client.config.auth_token == "mock_token_2"
+
+
+@pytest.mark.asyncio
+async def test_get_subject_success(async_client, mocker: MockFixture):
+    mock_get = mocker.patch("httpx.AsyncClient.get")
+    mock_get.return_value = httpx.Response(
+        status_code=200, json={"kind": "User", "guid": "mock_guid"}
+    )
+
+    response = await async_client.get_subject(auth_token="mock_token")
+
+    assert response["guid"] == "mock_guid"
+    assert mock_get.call_args.kwargs["headers"]["Authorization"] == "Bearer mock_token"
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_is_shared_by_concurrent_tasks(
+    async_client, mocker: MockFixture
+):
+    calls = []
+
+    async def post(url, **kwargs):
+        calls.append(kwargs["json"]["token"])
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            status_code=200, json={"success": True, "data": {"token": "new_token"}}
+        )
+
+    mocker.patch("httpx.AsyncClient.post", side_effect=post)
+    async_client.config.auth_token = "old_token"
+
+    tokens = await asyncio.gather(*(async_client.refresh_token() for _ in range(5)))
+
+    assert tokens == ["new_token"] * 5
+    assert calls == ["old_token"]
+    assert async_client.config.auth_token == "new_token"
+    assert async_client._refreshes == {}
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_failure(async_client, mocker: MockFixture):
+    mocker.patch(
+        "httpx.AsyncClient.post",
+        return_value=httpx.Response(status_code=401, json={"error": "expired"}),
+    )
+
+    results = await asyncio.gather(
+        async_client.refresh_token("old_token"),
+        async_client.refresh_token("old_token"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, UnauthorizedAccessError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_scopes_of_concurrent_tasks(async_client, mocker: MockFixture):
+    seen = {}
+
+    async def get(url, headers, **kwargs):
+        await asyncio.sleep(0.01)
+        seen[headers["X-Request-ID"]] = httpx.URL(url).path
+        return httpx.Response(status_code=200, json={})
+
+    mocker.patch("httpx.AsyncClient.get", side_effect=get)
+
+    async def tenant(project):
+        with async_client.scope(project_guid=project, request_id=f"req-{project}"):
+            await async_client.get_project(response_mode="raw")
+
+    await asyncio.gather(tenant("a"), tenant("b"))
+
+    assert seen == {"req-a": "/v2/projects/a/", "req-b": "/v2/projects/b/"}
@@ -0,0 +1,48 @@
+import asyncio
+
+import httpx
+import pytest
+
+from rapyuta_io_sdk_v2 import AsyncClient, RateLimiter
+from rapyuta_io_sdk_v2.ratelimit import AsyncRateLimitTransport
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_async_transport_waits_for_limiter(mocker):
+    sleep = mocker.patch("rapyuta_io_sdk_v2.ratelimit.asyncio.sleep")
+    limiter = RateLimiter(rate=4, burst=1, clock=FakeClock())
+    transport = AsyncRateLimitTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200)), limiter
+    )
+
+    async with httpx.AsyncClient(transport=transport) as c:
+        await asyncio.gather(
+            *(c.get("https://api.rapyuta.io/v2/deployments/") for _ in range(3))
+        )
+
+    delays = sorted(call.args[0] for call in sleep.await_args_list)
+    assert delays == [pytest.approx(0.25), pytest.approx(0.5)]
+
+
+@pytest.mark.asyncio
+async def test_async_client_with_rate_limiter(mocker):
+    sleep = mocker.patch("rapyuta_io_sdk_v2.ratelimit.asyncio.sleep")
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        return_value=httpx.Response(status_code=200, json={}),
+    )
+    client = AsyncClient(rate_limiter=RateLimiter(rate=1, burst=1, clock=FakeClock()))
+
+    await client.get_configtree("tree")
+    await client.get_configtree("tree")
+
+    sleep.assert_awaited_once_with(pytest.approx(1.0))
@@ -0,0 +1,31 @@
+import httpx
+import pytest
+from pytest_mock import MockFixture
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import AsyncClient
+from rapyuta_io_sdk_v2.models import Deployment
+from tests.data import cloud_deployment_model_mock
+from tests.utils.fixtures import async_client
+
+
+def test_async_client_invalid_response_mode():
+    with pytest.raises(ValueError):
+        AsyncClient(response_mode="fast")
+
+
+@pytest.mark.asyncio
+async def test_async_client_response_mode(
+    async_client, cloud_deployment_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.AsyncClient.get")
+    mock_get.return_value = httpx.Response(
+        status_code=200, json=cloud_deployment_model_mock
+    )
+
+    async_client.response_mode = "raw"
+    assert await async_client.get_deployment(name="mock") == cloud_deployment_model_mock
+
+    deployment = await async_client.get_deployment(name="mock", response_mode="construct")
+    assert isinstance(deployment, Deployment)
+    assert deployment.metadata["guid"] == "dep-cloud-001"
@@ -0,0 +1,91 @@
+import httpx
+import pytest
+
+from rapyuta_io_sdk_v2 import AsyncClient, RetryPolicy
+from rapyuta_io_sdk_v2.retry import AsyncRetryTransport
+
+
+def _transport(statuses, policy, calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        status, headers = statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return httpx.Response(status_code=status, headers=headers, json={})
+
+    return AsyncRetryTransport(httpx.MockTransport(handler), policy)
+
+
+@pytest.fixture
+def no_sleep(mocker):
+    return mocker.patch("rapyuta_io_sdk_v2.retry.asyncio.sleep")
+
+
+@pytest.mark.asyncio
+async def test_retries_gateway_errors_until_success(no_sleep):
+    calls = []
+    transport = _transport([(502, {}), (504, {}), (200, {})], RetryPolicy(), calls)
+
+    async with httpx.AsyncClient(transport=transport) as c:
+        response = await c.get("https://api.rapyuta.io/v2/deployments/")
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert no_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_by_default(no_sleep):
+    calls = []
+    transport = _transport([(503, {}), (200, {})], RetryPolicy(), calls)
+
+    async with httpx.AsyncClient(transport=transport) as c:
+        response = await c.post("https://api.rapyuta.io/v2/deployments/", json={})
+
+    assert response.status_code == 503
+    assert calls == ["POST"]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured(no_sleep):
+    calls = []
+    transport = _transport([(503, {"Retry-After": "2"}), (200, {})], RetryPolicy(), calls)
+
+    async with httpx.AsyncClient(transport=transport) as c:
+        await c.get("https://api.rapyuta.io/v2/deployments/")
+
+    no_sleep.assert_awaited_once_with(2.0)
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_are_retried(no_sleep):
+    calls = []
+    transport = _transport(
+        [(httpx.ConnectError("reset"), {}), (200, {})], RetryPolicy(), calls
+    )
+
+    async with httpx.AsyncClient(transport=transport) as c:
+        response = await c.get("https://api.rapyuta.io/v2/deployments/")
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_with_retry_policy(mocker, no_sleep):
+    events = []
+    client = AsyncClient(retry=RetryPolicy(on_retry=events.append))
+    handle_request = mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        side_effect=[
+            httpx.Response(status_code=502, json={"error": "bad gateway"}),
+            httpx.Response(status_code=200, json={"nodes": []}),
+        ],
+    )
+
+    response = await client.get_configtree("tree")
+
+    assert response == {"nodes": []}
+    assert handle_request.await_count == 2
+    assert len(events) == 1
@@ -0,0 +1,112 @@
+import asyncio
+
+import httpx
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import AsyncClient
+from rapyuta_io_sdk_v2.singleflight import AsyncSingleFlightTransport
+from tests.data import cloud_deployment_model_mock
+
+URL = "https://api.rapyuta.io/v2/deployments/dep/"
+
+
+def _client(handler):
+    transport = AsyncSingleFlightTransport(httpx.MockTransport(handler))
+    return httpx.AsyncClient(transport=transport)
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_gets_share_one_request():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(status_code=200, json={"n": len(calls)})
+
+    async with _client(handler) as c:
+        results = await asyncio.gather(*(c.get(URL) for _ in range(5)))
+        after = await c.get(URL)
+
+    assert len(calls) == 2
+    assert [r.json() for r in results] == [{"n": 1}] * 5
+    assert after.json() == {"n": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_gets_share_the_exception():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        raise httpx.ConnectError("boom")
+
+    async with _client(handler) as c:
+        results = await asyncio.gather(
+            *(c.get(URL) for _ in range(3)), return_exceptions=True
+        )
+
+    assert len(calls) == 1
+    assert all(isinstance(r, httpx.ConnectError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_caller_does_not_cancel_the_others():
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(status_code=200, json={})
+
+    async with _client(handler) as c:
+        first = asyncio.ensure_future(c.get(URL))
+        second = asyncio.ensure_future(c.get(URL))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert (await second).status_code == 200
+        assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_async_client_with_single_flight(cloud_deployment_model_mock, mocker):
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(status_code=200, json=cloud_deployment_model_mock)
+
+    client = AsyncClient(single_flight=True)
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", side_effect=handler
+    )
+
+    results = await asyncio.gather(*(client.get_deployment("dep") for _ in range(4)))
+
+    assert len(calls) == 1
+    assert {r.metadata.name for r in results} == {"cloud_deployment_sample"}
+
+
+@pytest.mark.asyncio
+async def test_async_streamed_logs_bypass_single_flight(mocker):
+    events = []
+
+    def handler(request):
+        async def body():
+            events.append("sent:one")
+            yield b"one\n"
+            events.append("sent:two")
+            yield b"two\n"
+
+        return httpx.Response(status_code=200, content=body())
+
+    client = AsyncClient(single_flight=True)
+    mocker.patch.object(
+        httpx.AsyncHTTPTransport, "handle_async_request", side_effect=handler
+    )
+
+    async for line in client.stream_deployment_logs("dep", "exec"):
+        events.append(line)
+
+    assert events == ["sent:one", "one", "sent:two", "two"]
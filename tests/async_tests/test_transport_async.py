@@ -0,0 +1,62 @@
+import httpx
+import pytest
+
+from rapyuta_io_sdk_v2 import AsyncClient, ConnectionPool, PoolLimits
+
+
+def test_shared_pool_is_reused_by_async_clients():
+    pool = ConnectionPool()
+    client_a = AsyncClient(pool=pool)
+    client_b = AsyncClient(pool=pool)
+
+    assert client_a.c._transport is client_b.c._transport
+    assert pool._async_transport_for("api.rapyuta.io") is pool._async_transport_for(
+        "api.rapyuta.io"
+    )
+
+
+def test_async_host_limits():
+    pool = ConnectionPool(
+        host_limits={"api.rapyuta.io": PoolLimits(max_connections=64)},
+    )
+
+    transport = pool._async_transport_for("api.rapyuta.io")
+
+    assert transport._pool._max_connections == 64
+    assert pool._async_transport_for("example.com")._pool._max_connections == 100
+
+
+@pytest.mark.asyncio
+async def test_async_requests_are_routed_through_pool(mocker):
+    pool = ConnectionPool()
+    client = AsyncClient(pool=pool)
+    handle_request = mocker.patch.object(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        return_value=httpx.Response(status_code=200, json={}),
+    )
+
+    await client.c.get("https://api.rapyuta.io/v2/projects/")
+    await client.c.aclose()
+
+    handle_request.assert_called_once()
+    assert pool._async_transports != {}
+    await pool.aclose()
+    assert pool._async_transports == {}
+
+
+@pytest.mark.asyncio
+async def test_async_client_closes_private_pool_only():
+    pool = ConnectionPool()
+    pool._async_transport_for("api.rapyuta.io")
+
+    async with AsyncClient(pool=pool) as shared:
+        pass
+    private = AsyncClient()
+    private.pool._async_transport_for("api.rapyuta.io")
+    await private.aclose()
+
+    assert shared.c.is_closed
+    assert pool._async_transports != {}
+    assert private.pool._async_transports == {}
+    await pool.aclose()
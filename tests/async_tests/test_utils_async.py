@@ -1,5 +1,7 @@
+import asyncio
+
 import pytest
-from rapyuta_io_sdk_v2.utils import walk_pages_async
+from rapyuta_io_sdk_v2.utils import walk_items_async, walk_pages_async
 
 
 def _make_sdk_model(items, continue_=None):
@@ -168,3 +170,125 @@ class TestWalkPagesAsyncWithSdkModelResponse:
 
         pages = await _collect(walk_pages_async(list_func))
         assert pages == []
+
+
+def _offset_list_func(total, calls, delay=0.0, in_flight=None):
+    """Offset-paginated list function over range(total)."""
+    active = [0]
+
+    async def list_func(cont, limit):
+        calls.append(cont)
+        active[0] += 1
+        if in_flight is not None:
+            in_flight.append(active[0])
+        await asyncio.sleep(delay)
+        active[0] -= 1
+        items = list(range(total))[cont : cont + limit]
+        return {"items": items, "metadata": {"continue": cont + len(items)}}
+
+    return list_func
+
+
+class TestWalkPagesAsyncConcurrency:
+    @pytest.mark.asyncio
+    async def test_offset_pages_are_fetched_concurrently(self):
+        calls, in_flight = [], []
+        list_func = _offset_list_func(23, calls, delay=0.01, in_flight=in_flight)
+
+        pages = await _collect(walk_pages_async(list_func, limit=5, concurrency=3))
+
+        assert [item for page in pages for item in page] == list(range(23))
+        assert max(in_flight) == 3
+        assert calls[:5] == [0, 5, 10, 15, 20]
+
+    @pytest.mark.asyncio
+    async def test_speculative_requests_past_the_end_are_cancelled(self):
+        calls = []
+        list_func = _offset_list_func(10, calls, delay=0.01)
+
+        pages = await _collect(walk_pages_async(list_func, limit=5, concurrency=4))
+
+        assert pages == [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+
+    @pytest.mark.asyncio
+    async def test_opaque_tokens_are_followed_one_page_ahead(self):
+        responses = {
+            0: {"items": ["a", "b"], "metadata": {"continue": "t1"}},
+            "t1": {"items": ["c", "d"], "metadata": {"continue": "t2"}},
+            "t2": {"items": ["e"], "metadata": {"continue": None}},
+        }
+        calls = []
+
+        async def list_func(cont, limit):
+            calls.append(cont)
+            return responses[cont]
+
+        pages = await _collect(walk_pages_async(list_func, limit=2, concurrency=4))
+        assert pages == [["a", "b"], ["c", "d"], ["e"]]
+        assert calls == [0, "t1", "t2"]
+
+    @pytest.mark.asyncio
+    async def test_next_page_is_fetched_while_consuming(self):
+        calls = []
+        list_func = _offset_list_func(4, calls)
+        gen = walk_pages_async(list_func, limit=2, concurrency=2)
+
+        assert await gen.__anext__() == [0, 1]
+        await asyncio.sleep(0)
+        assert calls == [0, 2, 4]
+        await gen.aclose()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_tokens_stop_being_offsets(self):
+        responses = {
+            0: {"items": [1, 2], "metadata": {"continue": 2}},
+            2: {"items": [3, 4], "metadata": {"continue": 100}},
+            4: {"items": ["wrong"], "metadata": {"continue": None}},
+            100: {"items": [5], "metadata": {"continue": None}},
+        }
+
+        async def list_func(cont, limit):
+            return responses[cont]
+
+        pages = await _collect(walk_pages_async(list_func, limit=2, concurrency=2))
+        assert pages == [[1, 2], [3, 4], [5]]
+
+    @pytest.mark.asyncio
+    async def test_error_is_raised_and_pending_requests_cancelled(self):
+        cancelled = []
+
+        async def list_func(cont, limit):
+            if cont == 2:
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(0.05 if cont else 0)
+            except asyncio.CancelledError:
+                cancelled.append(cont)
+                raise
+            return {"items": [cont, cont + 1], "metadata": {"continue": cont + 2}}
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await _collect(walk_pages_async(list_func, limit=2, concurrency=3))
+        await asyncio.sleep(0)
+        assert sorted(cancelled) == [4, 6]
+
+
+class TestWalkItemsAsync:
+    @pytest.mark.asyncio
+    async def test_yields_items(self):
+        calls = []
+        list_func = _offset_list_func(7, calls)
+
+        items = [item async for item in walk_items_async(list_func, limit=3)]
+        assert items == list(range(7))
+        assert calls == [0, 3, 6]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_forwarded(self):
+        calls = []
+        list_func = _offset_list_func(7, calls, delay=0.01)
+
+        items = [
+            item async for item in walk_items_async(list_func, limit=3, concurrency=3)
+        ]
+        assert items == list(range(7))
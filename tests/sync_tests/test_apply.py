@@ -0,0 +1,181 @@
+import copy
+import threading
+import time
+
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import Deployment, apply_resource, apply_resources
+from rapyuta_io_sdk_v2.apply import diff_resource, plan
+from rapyuta_io_sdk_v2.exceptions import (
+    ApplyError,
+    HttpAlreadyExistsError,
+    HttpNotFoundError,
+)
+from tests.utils.fixtures import client
+from tests.data import cloud_deployment_model_mock, disk_model_mock
+
+
+@pytest.fixture
+def deployment(cloud_deployment_model_mock):
+    def make(name, *depends):
+        body = copy.deepcopy(cloud_deployment_model_mock)
+        body["metadata"]["name"] = name
+        body["spec"]["depends"] = [
+            {"kind": "deployment", "nameOrGUID": dep} for dep in depends
+        ]
+        body.pop("status")
+        return body
+
+    return make
+
+
+class Recorder:
+    """Records creations and the peak number of concurrent creations."""
+
+    def __init__(self, fail=(), existing=()):
+        self.fail = fail
+        self.existing = {
+            body["metadata"]["name"]: Deployment.model_validate(body) for body in existing
+        }
+        self.created, self.updated, self.waited = [], [], []
+        self.active = self.peak = 0
+        self.lock = threading.Lock()
+
+    def create(self, body, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+            self.created.append(body.metadata.name)
+        if body.metadata.name in self.fail:
+            raise HttpAlreadyExistsError()
+        return body
+
+    def get(self, name, **kwargs):
+        if name not in self.existing:
+            raise HttpNotFoundError()
+        return self.existing[name]
+
+    def update(self, body, **kwargs):
+        self.updated.append(body.metadata.name)
+        return body
+
+    def wait(self, name, **kwargs):
+        self.waited.append(name)
+
+
+def _patch(mocker, client, recorder):
+    mocker.patch.object(client, "get_deployment", side_effect=recorder.get)
+    mocker.patch.object(client, "get_disk", side_effect=HttpNotFoundError())
+    mocker.patch.object(client, "update_deployment", side_effect=recorder.update)
+    mocker.patch.object(client, "create_deployment", side_effect=recorder.create)
+    mocker.patch.object(client, "create_disk", side_effect=recorder.create)
+    mocker.patch.object(client, "wait_for_deployment", side_effect=recorder.wait)
+
+
+def test_plan_orders_resources_in_waves(deployment, disk_model_mock):
+    disk = copy.deepcopy(disk_model_mock)
+    db = deployment("db")
+    db["spec"]["volumes"] = [
+        {
+            "execName": "exec",
+            "mountPath": "/data",
+            "depends": {"kind": "disk", "nameOrGUID": "mock_disk_1"},
+        }
+    ]
+    resources = [deployment("web", "api"), deployment("api", "db"), db, disk]
+
+    result = plan(resources)
+
+    assert result.waves() == [
+        ["disk:mock_disk_1"],
+        ["deployment:db"],
+        ["deployment:api"],
+        ["deployment:web"],
+    ]
+    assert result.awaited("deployment:api")
+    assert not result.awaited("deployment:web")
+
+
+def test_plan_rejects_cycles(deployment):
+    with pytest.raises(ValueError, match="cycle between deployment:a, deployment:b"):
+        plan([deployment("a", "b"), deployment("b", "a"), deployment("c")])
+
+
+def test_apply_creates_independent_resources_concurrently(client, deployment, mocker):
+    recorder = Recorder()
+    _patch(mocker, client, recorder)
+    resources = [deployment(f"worker-{i}", "base") for i in range(6)]
+    resources.append(deployment("base"))
+
+    applied = apply_resources(client, resources, concurrency=4)
+
+    assert recorder.created[0] == "base"
+    assert recorder.waited == ["base"]
+    assert recorder.peak == 4
+    assert len(applied) == 7
+    assert applied["deployment:worker-0"].action == "created"
+    assert isinstance(applied["deployment:worker-0"].resource, Deployment)
+
+
+def test_apply_skips_dependents_of_failed_resources(client, deployment, mocker):
+    recorder = Recorder(fail=("base",))
+    _patch(mocker, client, recorder)
+    resources = [deployment("base"), deployment("app", "base"), deployment("other")]
+
+    with pytest.raises(ApplyError) as exc:
+        apply_resources(client, resources, concurrency=1)
+
+    assert list(exc.value.errors) == ["deployment:base"]
+    assert isinstance(exc.value.errors["deployment:base"], HttpAlreadyExistsError)
+    assert exc.value.skipped == ["deployment:app", "deployment:other"]
+    assert "deployment:app" not in recorder.created
+
+
+def test_diff_ignores_server_defaults_and_compares_labels(deployment):
+    current = Deployment.model_validate(deployment("web"))
+    desired = deployment("web")
+    desired["spec"].pop("staticRoutes")
+    desired["metadata"]["labels"] = {"app": "web"}
+
+    assert diff_resource(Deployment.model_validate(desired), current) == [
+        "metadata.labels"
+    ]
+
+    desired["metadata"]["labels"] = current.metadata.labels
+    desired["spec"]["envArgs"][1]["value"] = "rotated"
+    assert diff_resource(Deployment.model_validate(desired), current) == [
+        "spec.envArgs[1].value"
+    ]
+
+
+def test_apply_resource_patches_only_changed_resources(client, deployment, mocker):
+    recorder = Recorder(existing=[deployment("same"), deployment("changed")])
+    _patch(mocker, client, recorder)
+    changed = deployment("changed")
+    changed["spec"]["envArgs"][1]["value"] = "rotated"
+
+    unchanged = apply_resource(client, deployment("same"))
+    updated = apply_resource(client, changed)
+    created = apply_resource(client, deployment("new"))
+
+    assert unchanged.action == "unchanged"
+    assert updated.action == "updated"
+    assert updated.changes == ["spec.envArgs[1].value"]
+    assert created.action == "created"
+    assert recorder.updated == ["changed"]
+    assert recorder.created == ["new"]
+
+
+def test_apply_does_not_wait_for_unchanged_resources(client, deployment, mocker):
+    recorder = Recorder(existing=[deployment("base")])
+    _patch(mocker, client, recorder)
+
+    applied = apply_resources(client, [deployment("base"), deployment("app", "base")])
+
+    assert applied["deployment:base"].action == "unchanged"
+    assert applied["deployment:app"].action == "created"
+    assert recorder.waited == []
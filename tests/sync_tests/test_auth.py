@@ -0,0 +1,95 @@
+import base64
+import json
+import threading
+
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import TokenManager
+from rapyuta_io_sdk_v2.auth import subject_expiry, token_expiry
+from rapyuta_io_sdk_v2.exceptions import UnauthorizedAccessError
+from tests.utils.fixtures import client
+
+
+def jwt(**claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_expiry():
+    assert token_expiry(jwt(exp=1700000000)) == 1700000000.0
+    assert token_expiry(jwt(sub="user")) is None
+    assert token_expiry("opaque-token") is None
+    assert token_expiry("a.!!!.c") is None
+
+
+def test_subject_expiry():
+    assert subject_expiry({"exp": 1234}) == 1234.0
+    assert subject_expiry({"data": {"expiresAt": "1970-01-01T00:01:00Z"}}) == 60.0
+    assert subject_expiry({"guid": "user"}) is None
+
+
+def test_refresh_if_needed(client, mocker):
+    clock = FakeClock()
+    client.config.auth_token = jwt(exp=2000)
+
+    def refresh_token():
+        client.config.auth_token = jwt(exp=5000)
+
+    refresh = mocker.patch.object(client, "refresh_token", side_effect=refresh_token)
+    manager = TokenManager(client, refresh_before=300, clock=clock)
+
+    assert not manager.refresh_if_needed()
+    clock.now = 1700
+    assert manager.refresh_if_needed()
+    assert manager.expires_at() == 5000.0
+    assert not manager.refresh_if_needed()
+    assert refresh.call_count == 1
+
+
+def test_expiry_learned_from_subject(client, mocker):
+    clock = FakeClock()
+    client.config.auth_token = "opaque-token"
+    subject = mocker.patch.object(client, "get_subject", return_value={"guid": "user"})
+    manager = TokenManager(client, lifetime=600, clock=clock)
+
+    assert manager.expires_at() == 1600.0
+    assert manager.expires_at() == 1600.0
+    subject.assert_called_once_with("opaque-token")
+
+
+def test_background_refresh(client, mocker):
+    refreshed = threading.Event()
+    client.config.auth_token = jwt(exp=1100)
+
+    def refresh_token():
+        client.config.auth_token = jwt(exp=100000)
+        refreshed.set()
+
+    mocker.patch.object(client, "refresh_token", side_effect=refresh_token)
+
+    with TokenManager(client, refresh_before=300, clock=FakeClock()):
+        assert refreshed.wait(1)
+
+
+def test_background_refresh_errors(client, mocker):
+    errors = []
+    client.config.auth_token = jwt(exp=1100)
+    mocker.patch.object(
+        client, "refresh_token", side_effect=UnauthorizedAccessError("expired")
+    )
+    manager = TokenManager(client, clock=FakeClock(), on_error=errors.append)
+
+    manager.start()
+    manager.stop()
+
+    assert isinstance(errors[0], UnauthorizedAccessError)
+    assert manager.last_error is errors[0]
@@ -0,0 +1,166 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import BulkResult, Disk, PollPolicy
+from rapyuta_io_sdk_v2.exceptions import BulkError, HttpNotFoundError
+from tests.utils.fixtures import client
+from tests.data import cloud_deployment_model_mock, disk_model_mock
+
+GONE = httpx.Response(status_code=404, json={"error": "not found"})
+
+
+class DeleteRecorder:
+    """Records deleted paths and the peak number of concurrent deletes."""
+
+    def __init__(self, missing=()):
+        self.missing = missing
+        self.deleted = []
+        self.active = self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        path = httpx.URL(url).path
+        with self.lock:
+            self.active -= 1
+            self.deleted.append(path)
+        status_code = 404 if path in self.missing else 204
+        return httpx.Response(status_code=status_code)
+
+
+def test_delete_many_deletes_deployments_first(client, mocker):
+    recorder = DeleteRecorder()
+    mocker.patch("httpx.Client.delete", side_effect=recorder)
+    mocker.patch("httpx.Client.get", return_value=GONE)
+    keys = ["disk:data", "network:net", "deployment:a", "deployment:b", "secret:s"]
+
+    results = client.delete_many(keys, concurrency=2)
+
+    assert [result.key for result in results] == keys
+    assert all(result.ok for result in results)
+    assert set(recorder.deleted[:2]) == {"/v2/deployments/a/", "/v2/deployments/b/"}
+    assert recorder.deleted[2:] == [
+        "/v2/networks/net/",
+        "/v2/disks/data/",
+        "/v2/secrets/s/",
+    ]
+    assert recorder.peak == 2
+
+
+def test_delete_many_collects_errors(client, mocker):
+    recorder = DeleteRecorder(missing=("/v2/disks/a/",))
+    mocker.patch("httpx.Client.delete", side_effect=recorder)
+
+    results = client.delete_many(["disk:a", "disk:b"])
+
+    assert isinstance(results[0].error, HttpNotFoundError)
+    assert results[1] == BulkResult("disk:b")
+
+
+def test_delete_many_fail_fast_skips_remaining(client, mocker):
+    recorder = DeleteRecorder(missing=("/v2/deployments/a/",))
+    mocker.patch("httpx.Client.delete", side_effect=recorder)
+    mocker.patch("httpx.Client.get", return_value=GONE)
+
+    with pytest.raises(BulkError) as exc:
+        client.delete_many(["deployment:a", "deployment:b", "disk:c"], 1, True)
+
+    results = exc.value.results
+    assert isinstance(results[0].error, HttpNotFoundError)
+    assert [result.skipped for result in results] == [False, True, True]
+    assert recorder.deleted == ["/v2/deployments/a/"]
+
+
+def test_delete_many_waits_until_deployments_are_gone(
+    client, cloud_deployment_model_mock, mocker
+):
+    events = []
+
+    def get(url, **kwargs):
+        events.append("get")
+        if events.count("get") < 4:
+            return httpx.Response(status_code=200, json=cloud_deployment_model_mock)
+        return GONE
+
+    def delete(url, **kwargs):
+        events.append(f"delete {httpx.URL(url).path}")
+        return httpx.Response(status_code=204)
+
+    mocker.patch("httpx.Client.get", side_effect=get)
+    mocker.patch("httpx.Client.delete", side_effect=delete)
+
+    results = client.delete_many(
+        ["disk:data", "deployment:dep"], poll=PollPolicy(interval=0.01)
+    )
+
+    assert all(result.ok for result in results)
+    assert events == [
+        "get",
+        "delete /v2/deployments/dep/",
+        "get",
+        "get",
+        "get",
+        "delete /v2/disks/data/",
+    ]
+
+
+def test_delete_many_skips_resources_of_failed_deployments(
+    client, cloud_deployment_model_mock, mocker
+):
+    mocker.patch(
+        "httpx.Client.get",
+        return_value=httpx.Response(status_code=200, json=cloud_deployment_model_mock),
+    )
+    recorder = DeleteRecorder(missing=("/v2/deployments/dep/",))
+    mocker.patch("httpx.Client.delete", side_effect=recorder)
+
+    results = client.delete_many(
+        ["deployment:dep", "staticroute:cloudroute-sample", "staticroute:other"]
+    )
+
+    assert isinstance(results[0].error, HttpNotFoundError)
+    assert results[1].skipped
+    assert results[2].ok
+    assert recorder.deleted == ["/v2/deployments/dep/", "/v2/staticroutes/other/"]
+
+
+def test_delete_many_rejects_package_keys(client):
+    with pytest.raises(ValueError, match="pass the package"):
+        client.delete_many(["package:pkg"])
+
+
+def test_create_many(client, disk_model_mock, mocker):
+    mocker.patch(
+        "httpx.Client.post",
+        return_value=httpx.Response(status_code=200, json=disk_model_mock),
+    )
+
+    results = client.create_many([disk_model_mock, disk_model_mock])
+
+    assert len(results) == 2
+    assert all(isinstance(result.result, Disk) for result in results)
+
+
+def test_update_many_rejects_disks(client, disk_model_mock):
+    with pytest.raises(ValueError, match="disks cannot be updated"):
+        client.update_many([disk_model_mock])
+
+
+def test_bulk_calls_keep_the_scope(client, mocker):
+    mock_delete = mocker.patch(
+        "httpx.Client.delete", return_value=httpx.Response(status_code=204)
+    )
+
+    with client.scope(project_guid="scoped_project", request_id="bulk"):
+        client.delete_many(["disk:a", "disk:b"])
+
+    for call in mock_delete.call_args_list:
+        assert call.kwargs["headers"]["project"] == "scoped_project"
+        assert call.kwargs["headers"]["X-Request-ID"] == "bulk"
@@ -0,0 +1,511 @@
+import gzip
+import threading
+
+import httpx
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import (
+    Client,
+    ConditionalCache,
+    Deployment,
+    Package,
+    PackageCache,
+    ResponseCache,
+)
+from rapyuta_io_sdk_v2.cache import (
+    CacheTransport,
+    ConditionalTransport,
+    PackageCacheTransport,
+)
+from tests.data import cloud_deployment_model_mock, cloud_package_model_mock
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _client(cache, calls, status=200):
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        return httpx.Response(status_code=status, json={"n": len(calls)})
+
+    return httpx.Client(transport=CacheTransport(httpx.MockTransport(handler), cache))
+
+
+URL = "https://api.rapyuta.io/v2/packages/pkg/"
+
+
+def test_get_is_served_from_cache():
+    cache, calls = ResponseCache(), []
+
+    with _client(cache, calls) as c:
+        first = c.get(URL, params={"version": "v1"})
+        second = c.get(URL, params={"version": "v1"})
+
+    assert first.json() == second.json() == {"n": 1}
+    assert len(calls) == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_key_includes_params_and_scope_headers():
+    cache, calls = ResponseCache(), []
+
+    with _client(cache, calls) as c:
+        c.get(URL, params={"version": "v1"})
+        c.get(URL, params={"version": "v2"})
+        c.get(URL, params={"version": "v1"}, headers={"project": "project-a"})
+        c.get(URL, params={"version": "v1"}, headers={"project": "project-a"})
+
+    assert len(calls) == 3
+
+
+def test_key_includes_credentials():
+    cache, calls = ResponseCache(), []
+
+    with _client(cache, calls) as c:
+        alice = c.get(URL, headers={"Authorization": "Bearer alice"})
+        bob = c.get(URL, headers={"Authorization": "Bearer bob"})
+        c.get(URL, headers={"Authorization": "Bearer alice"})
+
+    assert alice.json() != bob.json()
+    assert len(calls) == 2
+    assert all("alice" not in repr(key) for key in cache._entries)
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache, calls = ResponseCache(ttl=10, ttls={"packages": 60}, clock=clock), []
+
+    with _client(cache, calls) as c:
+        c.get(URL)
+        c.get("https://api.rapyuta.io/v2/projects/p/")
+        clock.now = 30
+        c.get(URL)
+        c.get("https://api.rapyuta.io/v2/projects/p/")
+
+    assert calls == [
+        ("GET", "/v2/packages/pkg/"),
+        ("GET", "/v2/projects/p/"),
+        ("GET", "/v2/projects/p/"),
+    ]
+
+
+def test_zero_ttl_disables_caching():
+    cache, calls = ResponseCache(ttls={"packages": 0}), []
+
+    with _client(cache, calls) as c:
+        c.get(URL)
+        c.get(URL)
+
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_only_read_mostly_resources_are_cached_by_default():
+    cache, calls = ResponseCache(), []
+    deployment = "https://api.rapyuta.io/v2/deployments/dep/"
+    device = "https://api.rapyuta.io/v2/devices/dev/"
+
+    with _client(cache, calls) as c:
+        for _ in range(2):
+            c.get(deployment)
+            c.get(device)
+            c.get("https://api.rapyuta.io/v2/networks/net/")
+
+    assert len(calls) == 5
+    assert len(cache) == 1
+
+
+def test_ttls_enable_caching_of_other_resources():
+    cache, calls = ResponseCache(ttls={"deployments": 5}), []
+
+    with _client(cache, calls) as c:
+        c.get("https://api.rapyuta.io/v2/deployments/dep/")
+        c.get("https://api.rapyuta.io/v2/deployments/dep/")
+
+    assert len(calls) == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache, calls = ResponseCache(maxsize=2), []
+
+    with _client(cache, calls) as c:
+        c.get("https://api.rapyuta.io/v2/packages/a/")
+        c.get("https://api.rapyuta.io/v2/packages/b/")
+        c.get("https://api.rapyuta.io/v2/packages/a/")
+        c.get("https://api.rapyuta.io/v2/packages/c/")
+        c.get("https://api.rapyuta.io/v2/packages/a/")
+        c.get("https://api.rapyuta.io/v2/packages/b/")
+
+    assert [path for _, path in calls] == [
+        "/v2/packages/a/",
+        "/v2/packages/b/",
+        "/v2/packages/c/",
+        "/v2/packages/b/",
+    ]
+    assert cache.stats.evictions == 2
+
+
+@pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE"])
+def test_writes_invalidate_the_resource(method):
+    cache, calls = ResponseCache(), []
+
+    with _client(cache, calls) as c:
+        c.get(URL)
+        c.get("https://api.rapyuta.io/v2/packages/")
+        c.get("https://api.rapyuta.io/v2/projects/p/")
+        c.request(method, URL)
+        c.get(URL)
+        c.get("https://api.rapyuta.io/v2/projects/p/")
+
+    assert cache.stats.invalidations == 2
+    assert calls[-1] == ("GET", "/v2/packages/pkg/")
+
+
+def test_get_in_flight_during_a_write_is_not_cached():
+    cache, calls = ResponseCache(), []
+    sent, release = threading.Event(), threading.Event()
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            sent.set()
+            assert release.wait(timeout=5)
+        return httpx.Response(status_code=200, json={"n": len(calls)})
+
+    with httpx.Client(transport=CacheTransport(httpx.MockTransport(handler), cache)) as c:
+        reader = threading.Thread(target=c.get, args=(URL,))
+        reader.start()
+        assert sent.wait(timeout=5)
+        c.put(URL)
+        release.set()
+        reader.join(timeout=5)
+
+        assert c.get(URL).json() == {"n": 3}
+
+    assert calls == ["GET", "PUT", "GET"]
+
+
+def test_errors_are_not_cached():
+    cache, calls = ResponseCache(), []
+
+    with _client(cache, calls, status=404) as c:
+        c.get(URL)
+        c.get(URL)
+
+    assert len(calls) == 2
+
+
+def test_compressed_responses_are_replayed_decoded():
+    cache = ResponseCache()
+
+    def handler(request):
+        return httpx.Response(
+            status_code=200,
+            headers={"Content-Encoding": "gzip"},
+            content=gzip.compress(b'{"name": "pkg"}'),
+        )
+
+    transport = CacheTransport(httpx.MockTransport(handler), cache)
+    with httpx.Client(transport=transport) as c:
+        c.get(URL)
+        cached = c.get(URL)
+
+    assert cache.stats.hits == 1
+    assert cached.json() == {"name": "pkg"}
+
+
+def test_client_with_cache(mocker):
+    cache = ResponseCache(ttls={"configtrees": 30})
+    client = Client(cache=cache)
+    handle_request = mocker.patch.object(
+        httpx.HTTPTransport,
+        "handle_request",
+        side_effect=lambda request: httpx.Response(
+            status_code=200, json={"metadata": {"name": "tree"}}
+        ),
+    )
+
+    assert client.get_configtree("tree") == {"metadata": {"name": "tree"}}
+    assert client.get_configtree("tree") == {"metadata": {"name": "tree"}}
+    client.delete_configtree("tree")
+    client.get_configtree("tree")
+
+    assert handle_request.call_count == 3
+    assert cache.stats.hits == 1
+
+
+def _log_server(events):
+    def handler(request):
+        def body():
+            events.append("sent:one")
+            yield b"one\n"
+            events.append("sent:two")
+            yield b"two\n"
+
+        return httpx.Response(status_code=200, headers={"ETag": '"1"'}, content=body())
+
+    return handler
+
+
+def test_streamed_logs_are_not_buffered_or_cached(mocker):
+    events = []
+    client = Client(cache=ResponseCache())
+    handle_request = mocker.patch.object(
+        httpx.HTTPTransport, "handle_request", side_effect=_log_server(events)
+    )
+
+    for line in client.stream_deployment_logs("dep", "exec"):
+        events.append(line)
+    assert list(client.stream_deployment_logs("dep", "exec")) == ["one", "two"]
+
+    assert events[:4] == ["sent:one", "one", "sent:two", "two"]
+    assert handle_request.call_count == 2
+    assert len(client.cache) == 0
+
+
+def _package_client(cache, calls, headers=None):
+    def handler(request):
+        calls.append((request.method, str(request.url)))
+        return httpx.Response(status_code=200, json={"n": len(calls)})
+
+    transport = PackageCacheTransport(httpx.MockTransport(handler), cache)
+    return httpx.Client(transport=transport, headers=headers or {"project": "p1"})
+
+
+def test_package_versions_never_expire():
+    cache, calls = PackageCache(), []
+
+    with _package_client(cache, calls) as c:
+        first = c.get(URL, params={"version": "v1"})
+        second = c.get(URL, params={"version": "v1"})
+        c.get(URL, params={"version": "v2"})
+
+    assert first.json() == second.json() == {"n": 1}
+    assert len(calls) == 2
+    assert cache.stats.hits == 1
+
+
+def test_package_without_version_is_not_cached():
+    cache, calls = PackageCache(), []
+
+    with _package_client(cache, calls) as c:
+        c.get(URL)
+        c.get(URL, params={"version": ""})
+        c.get("https://api.rapyuta.io/v2/packages/", params={"version": "v1"})
+
+    assert len(calls) == 3
+    assert len(cache) == 0
+
+
+def test_package_cache_is_scoped_to_the_project():
+    cache, calls = PackageCache(), []
+
+    with _package_client(cache, calls, headers={"project": "p1"}) as c:
+        c.get(URL, params={"version": "v1"})
+    with _package_client(cache, calls, headers={"project": "p2"}) as c:
+        c.get(URL, params={"version": "v1"})
+
+    assert len(calls) == 2
+
+
+def test_package_cache_is_scoped_to_the_credentials():
+    cache, calls = PackageCache(), []
+    alice = {"project": "p1", "Authorization": "Bearer alice"}
+    bob = {"project": "p1", "Authorization": "Bearer bob"}
+
+    with _package_client(cache, calls, headers=alice) as c:
+        c.get(URL, params={"version": "v1"})
+    with _package_client(cache, calls, headers=bob) as c:
+        c.get(URL, params={"version": "v1"})
+
+    assert len(calls) == 2
+    assert len(cache) == 2
+
+    with _package_client(cache, calls, headers=bob) as c:
+        c.delete(URL, params={"version": "v1"})
+    assert len(cache) == 0
+
+
+def test_persisted_versions_survive_token_rotation(tmp_path):
+    calls = []
+    old = {"project": "p1", "Authorization": "Bearer old"}
+    new = {"project": "p1", "Authorization": "Bearer new"}
+
+    with _package_client(PackageCache(persist=True, path=str(tmp_path)), calls, old) as c:
+        c.get(URL, params={"version": "v1"})
+    restarted = PackageCache(persist=True, path=str(tmp_path))
+    with _package_client(restarted, calls, headers=new) as c:
+        cached = c.get(URL, params={"version": "v1"})
+        c.delete(URL, params={"version": "v1"})
+
+    assert cached.json() == {"n": 1}
+    assert len(calls) == 2
+    assert not list(tmp_path.rglob("*.json"))
+
+
+def test_delete_package_discards_versions():
+    cache, calls = PackageCache(), []
+
+    with _package_client(cache, calls) as c:
+        c.get(URL, params={"version": "v1"})
+        c.get(URL, params={"version": "v2"})
+        c.delete(URL, params={"version": "v1"})
+        assert len(cache) == 1
+        c.delete(URL)
+
+    assert len(cache) == 0
+    assert cache.stats.invalidations == 2
+
+
+def test_package_cache_persists_to_disk(tmp_path):
+    calls = []
+
+    with _package_client(PackageCache(persist=True, path=str(tmp_path)), calls) as c:
+        c.get(URL, params={"version": "v1"})
+
+    restarted = PackageCache(persist=True, path=str(tmp_path))
+    with _package_client(restarted, calls) as c:
+        cached = c.get(URL, params={"version": "v1"})
+        c.delete(URL, params={"version": "v1"})
+
+    assert cached.json() == {"n": 1}
+    assert restarted.stats.hits == 1
+    assert not list(tmp_path.rglob("*.json"))
+
+
+def test_package_cache_defaults_to_app_dir(mocker):
+    mocker.patch(
+        "rapyuta_io_sdk_v2.cache.get_default_app_dir", return_value="/tmp/rio-cli"
+    )
+
+    assert PackageCache().path == "/tmp/rio-cli/cache/packages"
+
+
+def test_client_with_package_cache(cloud_package_model_mock, mocker):
+    client = Client(package_cache=PackageCache())
+    handle_request = mocker.patch.object(
+        httpx.HTTPTransport,
+        "handle_request",
+        return_value=httpx.Response(status_code=200, json=cloud_package_model_mock),
+    )
+
+    first = client.get_package("gostproxy", version="v1.0.0")
+    second = client.get_package("gostproxy", version="v1.0.0")
+
+    assert isinstance(second, Package)
+    assert first == second
+    assert handle_request.call_count == 1
+
+
+class ETagServer:
+    """Serves a body with an ETag, answering 304 to a matching If-None-Match."""
+
+    def __init__(self, body):
+        self.body = body
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        etag = f'"{hash(repr(self.body))}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(status_code=304, headers={"ETag": etag})
+        return httpx.Response(status_code=200, headers={"ETag": etag}, json=self.body)
+
+
+def test_conditional_request_replays_body_on_304():
+    cache, server = ConditionalCache(), ETagServer({"name": "dep"})
+    transport = ConditionalTransport(httpx.MockTransport(server), cache)
+
+    with httpx.Client(transport=transport) as c:
+        first = c.get(URL)
+        second = c.get(URL)
+
+    assert "If-None-Match" not in server.requests[0].headers
+    assert server.requests[1].headers["If-None-Match"] == first.headers["ETag"]
+    assert second.status_code == 200
+    assert second.json() == {"name": "dep"}
+    assert cache.stats.hits == 1
+
+
+def test_conditional_request_sends_last_modified():
+    cache, requests = ConditionalCache(), []
+    last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            status_code=200, headers={"Last-Modified": last_modified}, json={}
+        )
+
+    transport = ConditionalTransport(httpx.MockTransport(handler), cache)
+    with httpx.Client(transport=transport) as c:
+        c.get(URL)
+        c.get(URL)
+
+    assert requests[1].headers["If-Modified-Since"] == last_modified
+    assert "If-None-Match" not in requests[1].headers
+
+
+def test_changed_resource_is_downloaded_again():
+    cache, server = ConditionalCache(), ETagServer({"phase": "InProgress"})
+    transport = ConditionalTransport(httpx.MockTransport(server), cache)
+
+    with httpx.Client(transport=transport) as c:
+        c.get(URL)
+        server.body = {"phase": "Succeeded"}
+        changed = c.get(URL)
+        unchanged = c.get(URL)
+
+    assert changed.json() == unchanged.json() == {"phase": "Succeeded"}
+    assert cache.stats.hits == 1
+
+
+def test_responses_without_validators_are_not_stored():
+    cache = ConditionalCache()
+
+    def handler(request):
+        return httpx.Response(status_code=200, json={})
+
+    transport = ConditionalTransport(httpx.MockTransport(handler), cache)
+    with httpx.Client(transport=transport) as c:
+        c.get(URL)
+
+    assert len(cache) == 0
+
+
+def test_client_with_conditional_cache_reuses_model(cloud_deployment_model_mock, mocker):
+    server = ETagServer(cloud_deployment_model_mock)
+    client = Client(conditional_cache=ConditionalCache())
+    mocker.patch.object(httpx.HTTPTransport, "handle_request", side_effect=server)
+    validate = mocker.spy(Deployment, "model_validate_json")
+
+    first = client.get_deployment("dep")
+    second = client.get_deployment("dep")
+    raw = client.get_deployment("dep", response_mode="raw")
+
+    assert isinstance(first, Deployment)
+    assert second is first
+    assert raw == cloud_deployment_model_mock
+    assert len(server.requests) == 3
+    assert validate.call_count == 1
+
+
+def test_conditional_cache_does_not_buffer_streamed_logs(mocker):
+    events = []
+    client = Client(conditional_cache=ConditionalCache())
+    mocker.patch.object(
+        httpx.HTTPTransport, "handle_request", side_effect=_log_server(events)
+    )
+
+    for line in client.stream_deployment_logs("dep", "exec"):
+        events.append(line)
+
+    assert events == ["sent:one", "one", "sent:two", "two"]
+    assert len(client.conditional_cache) == 0
@@ -0,0 +1,96 @@
+import json
+import sys
+
+import httpx
+import pytest
+
+from rapyuta_io_sdk_v2 import Client
+from rapyuta_io_sdk_v2.codec import CodecClient, JSONCodec, OrjsonCodec, default_codec
+
+
+class RecordingCodec(JSONCodec):
+    def __init__(self):
+        self.dumped = []
+        self.loaded = []
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+def test_stdlib_codec_round_trip():
+    codec = JSONCodec()
+    body = {"name": "café", "values": [1, 2.5, None, True]}
+
+    encoded = codec.dumps(body)
+
+    assert isinstance(encoded, bytes)
+    assert encoded == json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode()
+    assert codec.loads(encoded) == body
+
+
+def test_orjson_codec_round_trip():
+    pytest.importorskip("orjson")
+    codec = OrjsonCodec()
+    body = {"name": "café", "values": [1, 2.5, None, True]}
+
+    assert codec.loads(codec.dumps(body)) == body
+    assert codec.loads(JSONCodec().dumps(body)) == body
+
+
+def test_default_codec_prefers_orjson():
+    pytest.importorskip("orjson")
+    assert isinstance(default_codec(), OrjsonCodec)
+
+
+def test_default_codec_without_orjson(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+    with pytest.raises(ImportError):
+        OrjsonCodec()
+    assert type(default_codec()) is JSONCodec
+
+
+def test_codec_client_encodes_json_bodies():
+    codec = RecordingCodec()
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200)
+
+    with CodecClient(transport=httpx.MockTransport(handler), codec=codec) as c:
+        c.post("https://api.rapyuta.io/v2/disks/", json={"name": "disk"})
+        c.put(
+            "https://api.rapyuta.io/v2/disks/",
+            json=[],
+            headers={"Content-Type": "application/merge-patch+json"},
+        )
+        c.get("https://api.rapyuta.io/v2/disks/")
+
+    assert codec.dumped == [{"name": "disk"}, []]
+    assert requests[0].content == b'{"name":"disk"}'
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert requests[1].headers["Content-Type"] == "application/merge-patch+json"
+    assert requests[2].content == b""
+
+
+def test_client_uses_codec(mocker):
+    codec = RecordingCodec()
+    client = Client(codec=codec)
+    handle_request = mocker.patch.object(
+        httpx.HTTPTransport,
+        "handle_request",
+        return_value=httpx.Response(status_code=200, json={"metadata": {"name": "t"}}),
+    )
+
+    response = client.create_configtree({"metadata": {"name": "t"}})
+
+    assert response == {"metadata": {"name": "t"}}
+    assert codec.dumped == [{"metadata": {"name": "t"}}]
+    assert len(codec.loaded) == 1
+    assert handle_request.call_args.args[0].content == b'{"metadata":{"name":"t"}}'
@@ -1,9 +1,10 @@
 import json
+import threading
 
 # ruff: noqa: F811, F401
 
 import pytest
-from rapyuta_io_sdk_v2.config import Configuration
+from rapyuta_io_sdk_v2.config import Configuration, current_request_id, scope
 from rapyuta_io_sdk_v2.constants import STAGING_ENVIRONMENT_SUBDOMAIN
 from rapyuta_io_sdk_v2.exceptions import ValidationError
 from tests.data.mock_data import mock_config, config_obj
@@ -76,6 +77,100 @@ def test_get_headers_with_request_id(mocker, config_obj):
     assert headers["X-Request-ID"] == "mock_request_id"
 
 
+def test_get_headers_memoized(config_obj):
+    headers = config_obj.get_headers()
+
+    # Identical calls share one read-only mapping.
+    assert config_obj.get_headers() is headers
+    with pytest.raises(TypeError):
+        headers["project"] = "other"
+
+    # Changing the token, organization or project invalidates the memoized headers.
+    config_obj.auth_token = "new_token"
+    config_obj.set_project("new_project")
+    headers = config_obj.get_headers()
+    assert headers["Authorization"] == "Bearer new_token"
+    assert headers["project"] == "new_project"
+    assert config_obj.get_headers(project_guid="other")["project"] == "other"
+
+
+def test_get_headers_token_set_while_building(mocker, config_obj):
+    # A token refreshed from another thread while headers are being built must
+    # not leave the old token memoized.
+    building, refreshed = threading.Event(), threading.Event()
+    build_headers = config_obj._build_headers
+
+    def slow_build_headers(*args):
+        headers = build_headers(*args)
+        building.set()
+        refreshed.wait(timeout=5)
+        return headers
+
+    mocker.patch.object(config_obj, "_build_headers", side_effect=slow_build_headers)
+    request = threading.Thread(target=config_obj.get_headers)
+    request.start()
+    building.wait(timeout=5)
+    config_obj.auth_token = "refreshed_token"
+    refreshed.set()
+    request.join()
+
+    assert config_obj.get_headers()["Authorization"] == "Bearer refreshed_token"
+
+
+def test_get_headers_reads_request_id_env_once(monkeypatch, config_obj):
+    monkeypatch.setenv("REQUEST_ID", "env_request_id")
+    assert config_obj.get_headers()["X-Request-ID"] == "env_request_id"
+
+    monkeypatch.setenv("REQUEST_ID", "changed")
+    assert config_obj.get_headers()["X-Request-ID"] == "env_request_id"
+
+
+def test_get_headers_request_id_context(config_obj):
+    token = current_request_id.set("ctx_request_id")
+    try:
+        assert config_obj.get_headers()["X-Request-ID"] == "ctx_request_id"
+    finally:
+        current_request_id.reset(token)
+
+    assert "X-Request-ID" not in config_obj.get_headers()
+
+
+def test_get_headers_scoped_request_ids_are_not_memoized(config_obj):
+    headers = config_obj.get_headers()
+
+    for i in range(300):
+        with scope(request_id=f"request-{i}"):
+            assert config_obj.get_headers()["X-Request-ID"] == f"request-{i}"
+
+    assert len(config_obj._headers) == 1
+    assert config_obj.get_headers() is headers
+
+
+def test_get_headers_checksum_not_memoized(config_obj):
+    headers = config_obj.get_headers(x_checksum="abc")
+
+    assert headers["X-Checksum"] == "abc"
+    assert config_obj.get_headers(x_checksum="abc") is not headers
+    assert "X-Checksum" not in config_obj.get_headers()
+
+
+def test_scope_overrides_headers(config_obj):
+    with scope(project_guid="scoped_project", request_id="outer"):
+        with scope(organization_guid="scoped_org", request_id="inner"):
+            headers = config_obj.get_headers()
+            assert headers["organizationguid"] == "scoped_org"
+            assert headers["project"] == "scoped_project"
+            assert headers["X-Request-ID"] == "inner"
+
+        assert config_obj.get_headers()["X-Request-ID"] == "outer"
+        assert config_obj.get_headers(project_guid="explicit")["project"] == "explicit"
+        assert "project" not in config_obj.get_headers(with_project=False)
+
+    headers = config_obj.get_headers()
+    assert headers["project"] == "mock_project_guid"
+    assert "X-Request-ID" not in headers
+
+
 # ---------------------------------------------------------------------------
 # set_environment() — default hosts per environment
 # ---------------------------------------------------------------------------
@@ -122,6 +122,20 @@ def test_list_revisions_success(client, mocker: MockFixture):
     ]
 
 
+def test_iter_revisions_success(client, mocker: MockFixture):
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.return_value = httpx.Response(
+        status_code=200,
+        json={
+            "metadata": {"continue": 1},
+            "items": [{"name": "test-revision", "guid": "mock_revision_guid"}],
+        },
+    )
+    revisions = list(client.iter_revisions(tree_name="mock_configtree_name"))
+    assert revisions == [{"name": "test-revision", "guid": "mock_revision_guid"}]
+    assert "mock_configtree_name" in mock_get.call_args.kwargs["url"]
+
+
 def test_create_revision_success(client, mocker: MockFixture):
     mock_post = mocker.patch("httpx.Client.post")
     mock_post.return_value = httpx.Response(
@@ -5,7 +5,9 @@ from pytest_mock import MockFixture
 
 # ruff: noqa: F811, F401
 from rapyuta_io_sdk_v2.models import DeploymentList, Deployment
+from rapyuta_io_sdk_v2.exceptions import DeploymentFailedError, WaitTimeoutError
 from rapyuta_io_sdk_v2.models.deployment import EnvArgsSpec
+from rapyuta_io_sdk_v2.wait import PollPolicy
 from tests.utils.fixtures import client
 from tests.data import (
     deployment_body,
@@ -56,6 +58,67 @@ def test_list_deployments_not_found(client, mocker: MockFixture):
     assert str(exc.value) == "not found"
 
 
+def test_iter_deployments_success(client, deploymentlist_model_mock, mocker: MockFixture):
+    mock_get = mocker.patch("httpx.Client.get")
+    first, second = dict(deploymentlist_model_mock), dict(deploymentlist_model_mock)
+    first["metadata"] = {"continue": 2}
+    second["items"] = deploymentlist_model_mock["items"][:1]
+    second["metadata"] = {"continue": 3}
+    mock_get.side_effect = [
+        httpx.Response(status_code=200, json=first),
+        httpx.Response(status_code=200, json=second),
+    ]
+
+    deployments = list(client.iter_deployments(limit=2, phases=["InProgress"]))
+
+    assert [d.metadata.guid for d in deployments] == [
+        "dep-cloud-001",
+        "dep-device-001",
+        "dep-cloud-001",
+    ]
+    assert all(isinstance(d, Deployment) for d in deployments)
+    assert mock_get.call_count == 2
+    assert mock_get.call_args_list[1].kwargs["params"]["continue"] == 2
+    assert mock_get.call_args_list[1].kwargs["params"]["phases"] == ["InProgress"]
+
+
+def test_iter_deployments_early_exit(
+    client, deploymentlist_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.return_value = httpx.Response(
+        status_code=200, json=deploymentlist_model_mock
+    )
+
+    deployments = client.iter_deployments(limit=2)
+    assert next(deployments).metadata.guid == "dep-cloud-001"
+    deployments.close()
+
+    assert mock_get.call_count == 1
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_deployments_keeps_the_scope(
+    client, deploymentlist_model_mock, mocker: MockFixture, prefetch
+):
+    mock_get = mocker.patch("httpx.Client.get")
+    last = dict(deploymentlist_model_mock)
+    last["items"] = deploymentlist_model_mock["items"][:1]
+    last["metadata"] = {"continue": None}
+    mock_get.side_effect = [
+        httpx.Response(status_code=200, json=deploymentlist_model_mock),
+        httpx.Response(status_code=200, json=last),
+    ]
+
+    with client.scope(project_guid="scoped_project"):
+        deployments = list(client.iter_deployments(limit=2, prefetch=prefetch))
+
+    assert len(deployments) == 3
+    assert mock_get.call_count == 2
+    for call in mock_get.call_args_list:
+        assert call.kwargs["headers"]["project"] == "scoped_project"
+
+
 def test_get_cloud_deployment_success(
     client, cloud_deployment_model_mock, mocker: MockFixture
 ):
@@ -283,3 +346,88 @@ def test_env_args_spec_plain_and_valuefrom_coexist():
     assert arg.valueFrom.secret_key_ref.value == "injected"
 
 
+def _with_phase(deployment, phase, status="Running"):
+    return {**deployment, "status": {"phase": phase, "status": status}}
+
+
+def test_poll_policy_backs_off():
+    intervals = PollPolicy(interval=1, factor=2, max_interval=5).intervals()
+
+    assert [next(intervals) for _ in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_wait_for_deployment_success(
+    client, cloud_deployment_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.side_effect = [
+        httpx.Response(200, json=_with_phase(cloud_deployment_model_mock, phase))
+        for phase in ("Provisioning", "InProgress", "Succeeded")
+    ]
+    mock_sleep = mocker.patch("time.sleep")
+
+    deployment = client.wait_for_deployment("cloud_deployment_sample")
+
+    assert deployment.status.phase == "Succeeded"
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 1.5]
+
+
+def test_wait_for_deployment_fails_fast(
+    client, cloud_deployment_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.return_value = httpx.Response(
+        200,
+        json={
+            **cloud_deployment_model_mock,
+            "status": {"phase": "FailedToStart", "error_codes": ["DEP_E153"]},
+        },
+    )
+
+    with pytest.raises(DeploymentFailedError) as exc:
+        client.wait_for_deployment("cloud_deployment_sample")
+
+    assert (
+        str(exc.value) == "deployment cloud_deployment_sample is FailedToStart: DEP_E153"
+    )
+    assert exc.value.deployment.status.phase == "FailedToStart"
+    assert mock_get.call_count == 1
+
+
+def test_wait_for_deployment_timeout(
+    client, cloud_deployment_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.return_value = httpx.Response(
+        200, json=_with_phase(cloud_deployment_model_mock, "Succeeded", "Pending")
+    )
+
+    with pytest.raises(TimeoutError) as exc:
+        client.wait_for_deployment(
+            "cloud_deployment_sample", statuses=["Running"], timeout=0
+        )
+
+    assert isinstance(exc.value, WaitTimeoutError)
+    assert exc.value.pending == ["cloud_deployment_sample"]
+
+
+def test_wait_for_deployments_lists_once_per_poll(
+    client, cloud_deployment_model_mock, mocker: MockFixture
+):
+    first = _with_phase(cloud_deployment_model_mock, "Succeeded")
+    second = {**first, "metadata": {**first["metadata"], "name": "second"}}
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.side_effect = [
+        httpx.Response(200, json={"metadata": {}, "items": [first]}),
+        httpx.Response(200, json={"metadata": {}, "items": [second]}),
+    ]
+    mocker.patch("time.sleep")
+
+    deployments = client.wait_for_deployments(["second", "cloud_deployment_sample"])
+
+    assert list(deployments) == ["second", "cloud_deployment_sample"]
+    assert mock_get.call_count == 2
+    params = [call.kwargs["params"] for call in mock_get.call_args_list]
+    assert params[0]["names"] == ["second", "cloud_deployment_sample"]
+    assert params[1]["names"] == ["second"]
+    assert params[0]["phases"] == ["Succeeded", "FailedToStart", "FailedToUpdate"]
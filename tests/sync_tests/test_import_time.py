@@ -0,0 +1,89 @@
+import subprocess
+import sys
+
+import pytest
+
+import rapyuta_io_sdk_v2
+import rapyuta_io_sdk_v2.models
+
+# Budgets for `import rapyuta_io_sdk_v2` and `from rapyuta_io_sdk_v2 import Client`,
+# generous enough for slow CI machines. Importing the client loads httpx, pydantic
+# and the models it returns.
+IMPORT_BUDGET_MS = 100
+CLIENT_IMPORT_BUDGET_MS = 1500
+
+# Modules only some client methods need, loaded when they are first called.
+OPTIONAL_MODULES = (
+    "yaml",
+    "benedict",
+    "rapyuta_io_sdk_v2.apply",
+    "rapyuta_io_sdk_v2.bulk",
+    "rapyuta_io_sdk_v2.informer",
+)
+
+
+def run(code, *options):
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_loads_no_heavy_modules():
+    result = run(
+        "import sys, rapyuta_io_sdk_v2\n"
+        "heavy = ('httpx', 'pydantic', 'yaml', 'benedict', 'rapyuta_io_sdk_v2.models')\n"
+        "print(','.join(name for name in heavy if name in sys.modules))"
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_import_time_budget():
+    result = run("import rapyuta_io_sdk_v2", "-X", "importtime")
+
+    cumulative = [
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "rapyuta_io_sdk_v2"
+    ]
+    assert cumulative[0] / 1000 < IMPORT_BUDGET_MS
+
+
+@pytest.mark.parametrize("name", ["Client", "AsyncClient"])
+def test_client_import_loads_no_optional_modules(name):
+    result = run(
+        f"import sys\nfrom rapyuta_io_sdk_v2 import {name}\n"
+        f"optional = {OPTIONAL_MODULES!r}\n"
+        "print(','.join(name for name in optional if name in sys.modules))"
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_client_import_time_budget():
+    result = run(
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "from rapyuta_io_sdk_v2 import Client\n"
+        "print((time.perf_counter() - start) * 1000)"
+    )
+
+    assert float(result.stdout) < CLIENT_IMPORT_BUDGET_MS
+
+
+@pytest.mark.parametrize("package", [rapyuta_io_sdk_v2, rapyuta_io_sdk_v2.models])
+def test_lazy_exports_resolve(package):
+    for name in package._MODULES:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+
+def test_lazy_export_is_the_module_attribute():
+    from rapyuta_io_sdk_v2.client import Client
+
+    assert rapyuta_io_sdk_v2.Client is Client
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        rapyuta_io_sdk_v2.Missing  # noqa: B018
@@ -0,0 +1,276 @@
+import copy
+import threading
+
+import httpx
+import pytest
+from pytest_mock import MockFixture
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import (
+    Deployment,
+    DeploymentInformer,
+    Disk,
+    Informer,
+    InformerFactory,
+    Store,
+)
+from tests.utils.fixtures import client
+from tests.data import (
+    cloud_deployment_model_mock,
+    device_deployment_model_mock,
+    disk_model_mock,
+)
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def on_add(self, deployment):
+        self.events.append(("add", deployment.metadata.name))
+
+    def on_update(self, old, new):
+        self.events.append(("update", new.metadata.name))
+
+    def on_delete(self, deployment):
+        self.events.append(("delete", deployment.metadata.name))
+
+
+@pytest.fixture
+def deployments(
+    mocker: MockFixture, cloud_deployment_model_mock, device_deployment_model_mock
+):
+    """Deployments returned by list_deployments, modifiable by the test."""
+    items = [cloud_deployment_model_mock, device_deployment_model_mock]
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.side_effect = lambda **kwargs: httpx.Response(
+        status_code=200,
+        json={"metadata": {"continue": None}, "items": copy.deepcopy(items)},
+    )
+    return items
+
+
+def test_informer_fires_add_update_delete(client, deployments):
+    informer, recorder = DeploymentInformer(client), Recorder()
+    informer.add_handler(recorder.on_add, recorder.on_update, recorder.on_delete)
+
+    informer.resync()
+    informer.resync()
+    deployments[1]["status"]["phase"] = "Stopped"
+    del deployments[0]
+    informer.resync()
+
+    assert recorder.events == [
+        ("add", "cloud_deployment_sample"),
+        ("add", "device_deployment_sample"),
+        ("update", "device_deployment_sample"),
+        ("delete", "cloud_deployment_sample"),
+    ]
+    assert informer.synced
+    assert len(informer.store) == 1
+
+
+def test_informer_indexes_the_store(client, deployments):
+    informer = DeploymentInformer(client)
+    informer.resync()
+    store = informer.store
+
+    assert isinstance(store.get("cloud_deployment_sample"), Deployment)
+    assert store.get_by_guid("dep-device-001").metadata.name == "device_deployment_sample"
+    assert len(store.by_phase("Succeeded")) == 2
+    assert [d.metadata.name for d in store.by_label("app", "cloudapp")] == [
+        "cloud_deployment_sample"
+    ]
+    assert [d.metadata.name for d in store.by_device("device-sample-001")] == [
+        "device_deployment_sample"
+    ]
+
+    deployments[1]["status"]["phase"] = "Stopped"
+    informer.resync()
+
+    assert [d.metadata.name for d in store.by_phase("Succeeded")] == [
+        "cloud_deployment_sample"
+    ]
+    assert [d.metadata.name for d in store.by_phase("Stopped")] == [
+        "device_deployment_sample"
+    ]
+
+
+def test_unchanged_deployments_are_not_revalidated(client, deployments, mocker):
+    informer = DeploymentInformer(client)
+    validate = mocker.spy(Deployment, "model_validate")
+
+    informer.resync()
+    informer.resync()
+
+    assert validate.call_count == 2
+
+
+def test_late_handler_receives_existing_deployments(client, deployments):
+    informer, recorder = DeploymentInformer(client), Recorder()
+    informer.resync()
+
+    informer.add_handler(on_add=recorder.on_add)
+
+    assert [event for event, _ in recorder.events] == ["add", "add"]
+
+
+def test_list_filters_are_passed_through(client, deployments):
+    DeploymentInformer(client, page_size=10, phases=["Succeeded"]).resync()
+
+    params = httpx.Client.get.call_args.kwargs["params"]
+    assert params["phases"] == ["Succeeded"]
+    assert params["limit"] == 10
+
+
+def test_informer_thread_reports_errors_and_keeps_polling(client, mocker):
+    errors, polled = [], threading.Event()
+
+    def get(**kwargs):
+        if errors:
+            polled.set()
+            return httpx.Response(status_code=200, json={"items": []})
+        return httpx.Response(status_code=500, json={"error": "boom"})
+
+    mocker.patch("httpx.Client.get", side_effect=get)
+
+    with DeploymentInformer(client, interval=0.01, on_error=errors.append) as informer:
+        assert polled.wait(timeout=5)
+        assert informer.wait_for_sync(timeout=5)
+
+    assert str(errors[0]) == "boom"
+
+
+def test_failing_handler_does_not_lose_events(client, deployments):
+    informer, recorder = DeploymentInformer(client), Recorder()
+
+    def on_add(deployment):
+        raise ValueError(deployment.metadata.name)
+
+    informer.add_handler(on_add=on_add)
+    informer.add_handler(recorder.on_add)
+
+    with pytest.raises(ValueError, match="device_deployment_sample"):
+        informer.resync()
+
+    assert recorder.events == [
+        ("add", "cloud_deployment_sample"),
+        ("add", "device_deployment_sample"),
+    ]
+    assert len(informer.store) == 2
+    assert informer.synced
+    assert str(informer.last_error) == "device_deployment_sample"
+
+
+def test_handler_errors_are_passed_to_on_error(client, deployments):
+    errors = []
+    informer = DeploymentInformer(client, on_error=errors.append)
+
+    def on_add(deployment):
+        raise ValueError(deployment.metadata.name)
+
+    informer.add_handler(on_add=on_add)
+    informer.resync()
+
+    assert [str(error) for error in errors] == [
+        "cloud_deployment_sample",
+        "device_deployment_sample",
+    ]
+    assert informer.last_error is errors[-1]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_store_indexes():
+    store = Store({"size": lambda disk: [disk["size"]]})
+    store.put("a", {"size": 1})
+    store.put("b", {"size": 1})
+    store.put("a", {"size": 2})
+
+    assert store.by_index("size", 1) == [{"size": 1}]
+    assert store.by_index("size", 2) == [{"size": 2}]
+    assert store.delete("b") == {"size": 1}
+    assert store.by_index("size", 1) == []
+    assert store.keys() == ["a"]
+
+
+def test_informer_for_any_list_method(client, disk_model_mock, mocker):
+    mocker.patch(
+        "httpx.Client.get",
+        return_value=httpx.Response(status_code=200, json={"items": [disk_model_mock]}),
+    )
+    informer = Informer(
+        client.list_disks,
+        Disk,
+        indexers={"runtime": lambda disk: [disk.spec.runtime]},
+    )
+
+    informer.resync()
+
+    assert isinstance(informer.store.get("mock_disk_1"), Disk)
+    assert len(informer.store.by_index("runtime", "cloud")) == 1
+    assert httpx.Client.get.call_args.kwargs["url"].endswith("/v2/disks/")
+
+
+def test_periodic_resync_updates_unchanged_objects(client, deployments):
+    clock, recorder = FakeClock(), Recorder()
+    informer = DeploymentInformer(client, resync_period=60, clock=clock)
+    informer.add_handler(on_update=recorder.on_update)
+
+    informer.resync()
+    clock.now = 30
+    informer.resync()
+    assert recorder.events == []
+
+    clock.now = 60
+    informer.resync()
+    assert [event for event, _ in recorder.events] == ["update", "update"]
+
+
+def test_factory_shares_informers(client, disk_model_mock, deployments, mocker):
+    factory = InformerFactory(client, project_guid="project-1")
+
+    assert factory.deployments() is factory.deployments()
+    assert factory.deployments(phases=["Succeeded"]) is not factory.deployments()
+    assert factory.disks() is factory.disks()
+    assert factory.fileuploads("device-1") is not factory.fileuploads("device-2")
+
+    informer = factory.deployments()
+    informer.resync()
+
+    headers = httpx.Client.get.call_args.kwargs["headers"]
+    assert headers["project"] == "project-1"
+    assert len(informer.store) == 2
+
+
+def test_factory_starts_and_syncs_every_informer(client, mocker):
+    mocker.patch(
+        "httpx.Client.get",
+        return_value=httpx.Response(status_code=200, json={"items": []}),
+    )
+
+    with InformerFactory(client, interval=0.01) as factory:
+        factory.networks()
+        factory.secrets()
+        assert factory.wait_for_sync(timeout=5)
+
+    urls = {call.kwargs["url"] for call in httpx.Client.get.call_args_list}
+    assert {url.rsplit("/v2/", 1)[1] for url in urls} == {"networks/", "secrets/"}
+
+
+def test_informer_started_in_scope_keeps_the_scope(client, deployments, mocker):
+    with client.scope(project_guid="scoped_project"):
+        informer = DeploymentInformer(client, interval=60).start()
+    try:
+        assert informer.wait_for_sync(timeout=5)
+    finally:
+        informer.stop()
+
+    headers = httpx.Client.get.call_args.kwargs["headers"]
+    assert headers["project"] == "scoped_project"
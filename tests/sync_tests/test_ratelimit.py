@@ -0,0 +1,124 @@
+import threading
+
+import httpx
+import pytest
+
+from rapyuta_io_sdk_v2 import Client, RateLimit, RateLimiter
+from rapyuta_io_sdk_v2.ratelimit import RateLimitTransport, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _request(path="/v2/deployments/", host="api.rapyuta.io"):
+    return httpx.Request("GET", f"https://{host}{path}")
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=2, burst=2), clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now = 10
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(RateLimit(rate=0))
+
+
+def test_token_bucket_is_thread_safe():
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=10, burst=1), clock=clock)
+    delays = []
+
+    def worker():
+        for _ in range(50):
+            delays.append(bucket.reserve())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Every reservation gets its own slot, spaced at the bucket rate.
+    assert sorted(round(d, 6) for d in delays) == [round(i / 10, 6) for i in range(400)]
+
+
+def test_limiter_buckets_are_per_host():
+    limiter = RateLimiter(rate=1, burst=1, clock=FakeClock())
+
+    assert limiter.reserve(_request(host="api.rapyuta.io")) == 0
+    assert limiter.reserve(_request(host="rip.rapyuta.io")) == 0
+    assert limiter.reserve(_request(host="api.rapyuta.io")) == pytest.approx(1.0)
+
+
+def test_limiter_host_overrides():
+    limiter = RateLimiter(
+        rate=1,
+        burst=1,
+        hosts={"api.rapyuta.io": RateLimit(rate=4, burst=1)},
+        clock=FakeClock(),
+    )
+
+    limiter.reserve(_request())
+    assert limiter.reserve(_request()) == pytest.approx(0.25)
+
+
+def test_limiter_endpoint_families():
+    limiter = RateLimiter(
+        families={
+            "deployments": RateLimit(rate=1, burst=1),
+            "fileuploads": RateLimit(rate=2, burst=1),
+        },
+        clock=FakeClock(),
+    )
+
+    assert limiter.reserve(_request("/v2/deployments/")) == 0
+    assert limiter.reserve(_request("/v2/deployments/dep-1/")) == pytest.approx(1.0)
+    # Other families and unmatched endpoints are not affected.
+    assert limiter.reserve(_request("/v2/devices/d/fileuploads/")) == 0
+    assert limiter.reserve(_request("/v2/devices/d/fileuploads/")) == pytest.approx(0.5)
+    assert limiter.reserve(_request("/v2/disks/")) == 0
+
+
+def test_transport_waits_for_limiter(mocker):
+    sleep = mocker.patch("rapyuta_io_sdk_v2.ratelimit.time.sleep")
+    limiter = RateLimiter(rate=2, burst=1, clock=FakeClock())
+    transport = RateLimitTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200)), limiter
+    )
+
+    with httpx.Client(transport=transport) as c:
+        c.get("https://api.rapyuta.io/v2/deployments/")
+        c.get("https://api.rapyuta.io/v2/deployments/")
+
+    sleep.assert_called_once_with(pytest.approx(0.5))
+
+
+def test_limiter_shared_between_clients(mocker):
+    sleep = mocker.patch("rapyuta_io_sdk_v2.ratelimit.time.sleep")
+    mocker.patch.object(
+        httpx.HTTPTransport,
+        "handle_request",
+        return_value=httpx.Response(status_code=200, json={}),
+    )
+    limiter = RateLimiter(rate=1, burst=1, clock=FakeClock())
+    client_a = Client(rate_limiter=limiter)
+    client_b = Client(rate_limiter=limiter)
+
+    client_a.get_deployment_graph("dep")
+    client_b.get_deployment_graph("dep")
+
+    sleep.assert_called_once_with(pytest.approx(1.0))
@@ -0,0 +1,185 @@
+import json
+from typing import List
+
+import httpx
+import pytest
+from pytest_mock import MockFixture
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import Client
+from rapyuta_io_sdk_v2.models import Deployment, DeploymentList, LazyList
+from rapyuta_io_sdk_v2.models.utils import Depends
+from rapyuta_io_sdk_v2.response import (
+    construct,
+    parse_response,
+    type_adapter,
+    validate_json,
+)
+from tests.data import (
+    cloud_deployment_model_mock,
+    deploymentlist_model_mock,
+    device_deployment_model_mock,
+)
+from tests.utils.fixtures import client
+
+
+def test_parse_response_modes(cloud_deployment_model_mock):
+    response = httpx.Response(status_code=200, json=cloud_deployment_model_mock)
+
+    model = parse_response(response, Deployment)
+    raw = parse_response(response, Deployment, "raw")
+    constructed = parse_response(response, Deployment, "construct")
+
+    assert isinstance(model, Deployment)
+    assert raw == cloud_deployment_model_mock
+    assert isinstance(constructed, Deployment)
+    assert constructed.metadata["name"] == model.metadata.name
+    assert constructed.spec["runtime"] == model.spec.runtime
+
+
+def test_parse_response_invalid_mode(cloud_deployment_model_mock):
+    response = httpx.Response(status_code=200, json=cloud_deployment_model_mock)
+    with pytest.raises(ValueError):
+        parse_response(response, Deployment, "fast")
+
+
+def test_construct_is_shallow(deploymentlist_model_mock):
+    deployments = construct(DeploymentList, deploymentlist_model_mock)
+
+    assert isinstance(deployments, DeploymentList)
+    assert deployments.items == deploymentlist_model_mock["items"]
+    assert deployments.metadata == deploymentlist_model_mock["metadata"]
+
+
+def test_construct_matches_alias_choices():
+    depends = construct(Depends, {"nameOrGuid": "pkg"})
+    assert depends.name_or_guid == "pkg"
+
+
+def test_construct_does_not_validate():
+    deployment = construct(Deployment, {"metadata": {"name": 1}})
+    assert deployment.metadata == {"name": 1}
+
+
+def test_construct_keeps_pydantic_state():
+    deployment = construct(
+        Deployment, {"apiVersion": "apiserver.rapyuta.io/v2", "metadata": {"name": "x"}}
+    )
+
+    assert deployment.api_version == "apiserver.rapyuta.io/v2"
+    assert deployment.model_fields_set == {"api_version", "metadata"}
+    assert deployment.model_copy().metadata == {"name": "x"}
+
+
+def test_client_invalid_response_mode():
+    with pytest.raises(ValueError):
+        Client(response_mode="fast")
+
+
+def test_client_response_mode(client, cloud_deployment_model_mock, mocker: MockFixture):
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.return_value = httpx.Response(
+        status_code=200, json=cloud_deployment_model_mock
+    )
+
+    client.response_mode = "raw"
+    assert client.get_deployment(name="mock") == cloud_deployment_model_mock
+
+    deployment = client.get_deployment(name="mock", response_mode="construct")
+    assert isinstance(deployment, Deployment)
+    assert deployment.metadata["guid"] == "dep-cloud-001"
+
+
+def test_list_response_mode_with_iterator(
+    client, deploymentlist_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.return_value = httpx.Response(
+        status_code=200, json=deploymentlist_model_mock
+    )
+
+    deployments = list(client.iter_deployments(response_mode="raw"))
+
+    assert deployments == deploymentlist_model_mock["items"]
+
+
+def test_lazy_list_validates_items_on_access(deploymentlist_model_mock, mocker):
+    validate = mocker.spy(Deployment, "model_validate")
+    response = httpx.Response(status_code=200, json=deploymentlist_model_mock)
+
+    deployments = parse_response(response, DeploymentList, "lazy")
+
+    assert isinstance(deployments, LazyList)
+    assert deployments.metadata.continue_ == 123
+    assert len(deployments.items) == 2
+    assert deployments.names() == ["cloud_deployment_sample", "device_deployment_sample"]
+    assert deployments.guids() == ["dep-cloud-001", "dep-device-001"]
+    assert validate.call_count == 0
+
+    first = deployments.items[0]
+    assert isinstance(first, Deployment)
+    assert deployments.items[0] is first
+    assert deployments.items[-1].metadata.guid == "dep-device-001"
+    assert validate.call_count == 2
+
+    assert [d.metadata.guid for d in deployments.items] == [
+        "dep-cloud-001",
+        "dep-device-001",
+    ]
+    assert validate.call_count == 2
+
+
+def test_lazy_list_to_model(deploymentlist_model_mock):
+    response = httpx.Response(status_code=200, json=deploymentlist_model_mock)
+    deployments = parse_response(response, DeploymentList, "lazy").to_model()
+
+    assert isinstance(deployments, DeploymentList)
+    assert deployments.items == list(
+        parse_response(response, DeploymentList, "lazy").items
+    )
+
+
+def test_lazy_mode_validates_single_resources(cloud_deployment_model_mock):
+    response = httpx.Response(status_code=200, json=cloud_deployment_model_mock)
+    assert isinstance(parse_response(response, Deployment, "lazy"), Deployment)
+
+
+def test_lazy_list_with_walk_items(
+    client, deploymentlist_model_mock, mocker: MockFixture
+):
+    mock_get = mocker.patch("httpx.Client.get")
+    mock_get.return_value = httpx.Response(
+        status_code=200, json=deploymentlist_model_mock
+    )
+
+    page = client.list_deployments(response_mode="lazy")
+    assert isinstance(page, LazyList)
+
+    deployments = list(client.iter_deployments(response_mode="lazy"))
+    assert [d.metadata.guid for d in deployments] == ["dep-cloud-001", "dep-device-001"]
+
+
+def test_validate_json_models(cloud_deployment_model_mock):
+    content = json.dumps(cloud_deployment_model_mock).encode()
+
+    deployment = validate_json(Deployment, content)
+
+    assert deployment == Deployment(**cloud_deployment_model_mock)
+
+
+def test_validate_json_caches_type_adapters(deploymentlist_model_mock):
+    content = json.dumps(deploymentlist_model_mock["items"]).encode()
+
+    deployments = validate_json(List[Deployment], content)
+
+    assert [d.metadata.guid for d in deployments] == ["dep-cloud-001", "dep-device-001"]
+    assert type_adapter(List[Deployment]) is type_adapter(List[Deployment])
+
+
+def test_parse_response_validates_bytes(cloud_deployment_model_mock, mocker):
+    validate = mocker.spy(Deployment, "model_validate_json")
+    response = httpx.Response(status_code=200, json=cloud_deployment_model_mock)
+
+    parse_response(response, Deployment)
+
+    validate.assert_called_once_with(response.content)
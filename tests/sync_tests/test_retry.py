@@ -0,0 +1,184 @@
+import httpx
+import pytest
+
+from rapyuta_io_sdk_v2 import Client, RetryPolicy
+from rapyuta_io_sdk_v2.exceptions import ServiceUnavailableError
+from rapyuta_io_sdk_v2.retry import RetryTransport, parse_retry_after
+
+
+def _transport(statuses, policy, calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        status, headers = statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return httpx.Response(status_code=status, headers=headers, json={})
+
+    return RetryTransport(httpx.MockTransport(handler), policy)
+
+
+@pytest.fixture
+def no_sleep(mocker):
+    return mocker.patch("rapyuta_io_sdk_v2.retry.time.sleep")
+
+
+def test_retries_gateway_errors_until_success(no_sleep):
+    calls = []
+    transport = _transport([(502, {}), (503, {}), (200, {})], RetryPolicy(), calls)
+
+    with httpx.Client(transport=transport) as c:
+        response = c.get("https://api.rapyuta.io/v2/deployments/")
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert no_sleep.call_count == 2
+
+
+def test_gives_up_after_max_retries(no_sleep):
+    calls = []
+    transport = _transport([(504, {})] * 3, RetryPolicy(max_retries=2), calls)
+
+    with httpx.Client(transport=transport) as c:
+        response = c.get("https://api.rapyuta.io/v2/deployments/")
+
+    assert response.status_code == 504
+    assert len(calls) == 3
+
+
+def test_post_is_not_retried_by_default(no_sleep):
+    calls = []
+    transport = _transport([(503, {}), (200, {})], RetryPolicy(), calls)
+
+    with httpx.Client(transport=transport) as c:
+        response = c.post("https://api.rapyuta.io/v2/deployments/", json={})
+
+    assert response.status_code == 503
+    assert calls == ["POST"]
+
+
+def test_post_is_retried_when_opted_in(no_sleep):
+    calls = []
+    transport = _transport([(503, {}), (200, {})], RetryPolicy(retry_post=True), calls)
+
+    with httpx.Client(transport=transport) as c:
+        response = c.post("https://api.rapyuta.io/v2/deployments/", json={"a": 1})
+
+    assert response.status_code == 200
+    assert calls == ["POST", "POST"]
+
+
+def test_non_retryable_status_is_returned(no_sleep):
+    calls = []
+    transport = _transport([(500, {})], RetryPolicy(), calls)
+
+    with httpx.Client(transport=transport) as c:
+        response = c.get("https://api.rapyuta.io/v2/deployments/")
+
+    assert response.status_code == 500
+    assert no_sleep.call_count == 0
+
+
+def test_connection_errors_are_retried(no_sleep):
+    calls = []
+    transport = _transport(
+        [(httpx.ConnectError("reset"), {}), (200, {})], RetryPolicy(), calls
+    )
+
+    with httpx.Client(transport=transport) as c:
+        response = c.get("https://api.rapyuta.io/v2/deployments/")
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+def test_connection_error_raised_when_budget_exhausted(no_sleep):
+    calls = []
+    transport = _transport(
+        [(httpx.ReadError("reset"), {})] * 2, RetryPolicy(max_retries=1), calls
+    )
+
+    with httpx.Client(transport=transport) as c:
+        with pytest.raises(httpx.ReadError):
+            c.get("https://api.rapyuta.io/v2/deployments/")
+
+
+def test_retry_after_is_honoured(no_sleep):
+    calls = []
+    transport = _transport(
+        [(429, {"Retry-After": "7"}), (200, {})], RetryPolicy(backoff_max=1), calls
+    )
+
+    with httpx.Client(transport=transport) as c:
+        c.get("https://api.rapyuta.io/v2/deployments/")
+
+    no_sleep.assert_called_once_with(7.0)
+
+
+def test_max_elapsed_stops_retries(no_sleep):
+    calls = []
+    transport = _transport(
+        [(503, {"Retry-After": "120"}), (200, {})], RetryPolicy(max_elapsed=10), calls
+    )
+
+    with httpx.Client(transport=transport) as c:
+        response = c.get("https://api.rapyuta.io/v2/deployments/")
+
+    assert response.status_code == 503
+    assert no_sleep.call_count == 0
+
+
+def test_on_retry_hook_receives_events(no_sleep):
+    events = []
+    calls = []
+    transport = _transport(
+        [(502, {}), (502, {}), (200, {})], RetryPolicy(on_retry=events.append), calls
+    )
+
+    with httpx.Client(transport=transport) as c:
+        c.get("https://api.rapyuta.io/v2/deployments/")
+
+    assert [event.attempt for event in events] == [1, 2]
+    assert all(event.response.status_code == 502 for event in events)
+
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy(backoff_base=1, backoff_max=4)
+
+    for retry in range(1, 10):
+        assert 0 <= policy.backoff(retry) <= min(4, 2 ** (retry - 1))
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_client_with_retry_policy(mocker, no_sleep):
+    client = Client(retry=RetryPolicy())
+    handle_request = mocker.patch.object(
+        httpx.HTTPTransport,
+        "handle_request",
+        side_effect=[
+            httpx.Response(status_code=503, json={"error": "unavailable"}),
+            httpx.Response(status_code=200, json={"nodes": []}),
+        ],
+    )
+
+    response = client.get_deployment_graph("dep")
+
+    assert response == {"nodes": []}
+    assert handle_request.call_count == 2
+
+
+def test_client_without_retry_policy(mocker):
+    client = Client()
+    mocker.patch.object(
+        httpx.HTTPTransport,
+        "handle_request",
+        return_value=httpx.Response(status_code=503, json={"error": "unavailable"}),
+    )
+
+    with pytest.raises(ServiceUnavailableError):
+        client.get_deployment_graph("dep")
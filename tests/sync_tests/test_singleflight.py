@@ -0,0 +1,157 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+# ruff: noqa: F811, F401
+from rapyuta_io_sdk_v2 import Client
+from rapyuta_io_sdk_v2.singleflight import SingleFlightTransport
+from tests.data import cloud_deployment_model_mock
+
+URL = "https://api.rapyuta.io/v2/deployments/dep/"
+
+
+class SlowServer:
+    """Blocks every request until released, counting the requests received."""
+
+    def __init__(self, response=None, error=None):
+        self.response = response or httpx.Response(status_code=200, json={"n": 1})
+        self.error = error
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, request):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+def _concurrently(func, count=5, wait_for=None):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(func) for _ in range(count)]
+        if wait_for is not None:
+            wait_for()
+        return [future.exception() or future.result() for future in futures]
+
+
+def _client(server):
+    return httpx.Client(transport=SingleFlightTransport(httpx.MockTransport(server)))
+
+
+def _release_when_queued(server, transport):
+    def release():
+        while len(transport._flights) < 1 or server.calls < 1:
+            threading.Event().wait(0.01)
+        # Give the other threads time to join the flight.
+        threading.Event().wait(0.1)
+        server.release.set()
+
+    return release
+
+
+def test_concurrent_gets_share_one_request():
+    server = SlowServer()
+    c = _client(server)
+
+    results = _concurrently(
+        lambda: c.get(URL), wait_for=_release_when_queued(server, c._transport)
+    )
+
+    assert server.calls == 1
+    assert [r.json() for r in results] == [{"n": 1}] * 5
+    assert len({id(r) for r in results}) == 5
+
+
+def test_concurrent_gets_share_the_exception():
+    server = SlowServer(error=httpx.ConnectError("boom"))
+    c = _client(server)
+
+    results = _concurrently(
+        lambda: c.get(URL), wait_for=_release_when_queued(server, c._transport)
+    )
+
+    assert server.calls == 1
+    assert all(isinstance(r, httpx.ConnectError) for r in results)
+
+
+def test_sequential_and_different_requests_are_not_shared():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, str(request.url), request.headers.get("project")))
+        return httpx.Response(status_code=200, json={})
+
+    with _client(handler) as c:
+        c.get(URL)
+        c.get(URL)
+        c.get(URL, headers={"project": "p2"})
+        c.delete(URL)
+
+    assert len(calls) == 4
+
+
+def test_requests_with_different_request_ids_are_not_shared():
+    server = SlowServer()
+    received = []
+
+    def handler(request):
+        received.append(request.headers["X-Request-ID"])
+        return server(request)
+
+    c = _client(handler)
+
+    def release():
+        for _ in range(100):
+            if server.calls == 3:
+                break
+            threading.Event().wait(0.01)
+        server.release.set()
+
+    ids = ["a", "b", "c"]
+    _concurrently(
+        lambda: c.get(URL, headers={"X-Request-ID": ids.pop()}),
+        count=3,
+        wait_for=release,
+    )
+
+    assert sorted(received) == ["a", "b", "c"]
+
+
+def test_client_with_single_flight(cloud_deployment_model_mock, mocker):
+    server = SlowServer(
+        response=httpx.Response(status_code=200, json=cloud_deployment_model_mock)
+    )
+    client = Client(single_flight=True)
+    mocker.patch.object(httpx.HTTPTransport, "handle_request", side_effect=server)
+
+    results = _concurrently(
+        lambda: client.get_deployment("dep"),
+        wait_for=_release_when_queued(server, client.c._transport),
+    )
+
+    assert server.calls == 1
+    assert {r.metadata.name for r in results} == {"cloud_deployment_sample"}
+
+
+def test_streamed_logs_bypass_single_flight(mocker):
+    events = []
+
+    def handler(request):
+        def body():
+            events.append("sent:one")
+            yield b"one\n"
+            events.append("sent:two")
+            yield b"two\n"
+
+        return httpx.Response(status_code=200, content=body())
+
+    client = Client(single_flight=True)
+    mocker.patch.object(httpx.HTTPTransport, "handle_request", side_effect=handler)
+
+    for line in client.stream_deployment_logs("dep", "exec"):
+        events.append(line)
+
+    assert events == ["sent:one", "one", "sent:two", "two"]
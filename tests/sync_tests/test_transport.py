@@ -0,0 +1,127 @@
+import httpx
+import pytest
+
+from rapyuta_io_sdk_v2 import Client, Configuration, ConnectionPool, PoolLimits
+
+
+def _max_connections(transport: httpx.HTTPTransport) -> int:
+    return transport._pool._max_connections
+
+
+def test_default_pool_is_private_per_client():
+    client_a = Client()
+    client_b = Client()
+
+    assert client_a.pool is not client_b.pool
+    assert client_a.c._transport is not client_b.c._transport
+
+
+def test_shared_pool_is_reused_by_clients():
+    pool = ConnectionPool()
+    client_a = Client(pool=pool)
+    client_b = Client(pool=pool)
+
+    assert client_a.pool is pool
+    assert client_a.c._transport is client_b.c._transport
+    assert pool._transport_for("api.rapyuta.io") is pool._transport_for(
+        "garip.apps.okd4v2.prod.rapyuta.io"
+    )
+
+
+def test_default_limits():
+    pool = ConnectionPool()
+    transport = pool._transport_for("api.rapyuta.io")
+
+    assert _max_connections(transport) == 100
+    assert transport._pool._max_keepalive_connections == 20
+    assert transport._pool._keepalive_expiry == 30.0
+
+
+def test_host_limits():
+    pool = ConnectionPool(
+        limits=PoolLimits(max_connections=10),
+        host_limits={"https://api.rapyuta.io": PoolLimits(max_connections=64)},
+    )
+
+    v2api = pool._transport_for("api.rapyuta.io")
+    other = pool._transport_for("example.com")
+
+    assert v2api is not other
+    assert _max_connections(v2api) == 64
+    assert _max_connections(other) == 10
+    # Hosts without their own limits share the default ones.
+    assert pool._transport_for("example.org") is other
+
+
+def test_from_config_sets_per_host_limits():
+    config = Configuration(
+        v2_api_host="https://v2.example.com", rip_host="https://rip.example.com"
+    )
+    pool = ConnectionPool.from_config(
+        config,
+        v2api_limits=PoolLimits(max_connections=50),
+        rip_limits=PoolLimits(max_connections=2),
+    )
+
+    assert _max_connections(pool._transport_for("v2.example.com")) == 50
+    assert _max_connections(pool._transport_for("rip.example.com")) == 2
+    assert _max_connections(pool._transport_for("other.example.com")) == 100
+
+
+def test_closing_client_keeps_shared_pool_open():
+    pool = ConnectionPool()
+    client_a = Client(pool=pool)
+    client_b = Client(pool=pool)
+    transport = pool._transport_for("api.rapyuta.io")
+
+    client_a.c.close()
+
+    assert pool._transport_for("api.rapyuta.io") is transport
+    assert not client_b.c.is_closed
+
+    pool.close()
+    assert pool._transport_for("api.rapyuta.io") is not transport
+
+
+def test_closing_client_closes_private_pool(mocker):
+    client = Client()
+    transport = client.pool._transport_for("api.rapyuta.io")
+    close = mocker.spy(transport, "close")
+
+    client.close()
+
+    close.assert_called_once()
+    assert client.c.is_closed
+    assert client.pool._transports == {}
+
+
+def test_client_context_manager_keeps_shared_pool_open():
+    pool = ConnectionPool()
+    transport = pool._transport_for("api.rapyuta.io")
+
+    with Client(pool=pool) as client:
+        pass
+
+    assert client.c.is_closed
+    assert pool._transport_for("api.rapyuta.io") is transport
+
+
+def test_requests_are_routed_through_pool(mocker):
+    pool = ConnectionPool()
+    client = Client(pool=pool)
+    handle_request = mocker.patch.object(
+        httpx.HTTPTransport,
+        "handle_request",
+        return_value=httpx.Response(status_code=200, json={}),
+    )
+
+    client.c.get("https://api.rapyuta.io/v2/projects/")
+
+    handle_request.assert_called_once()
+
+
+def test_http2_requires_h2(mocker):
+    mocker.patch.dict("sys.modules", {"h2": None})
+
+    with pytest.raises(ImportError):
+        ConnectionPool(http2=True)
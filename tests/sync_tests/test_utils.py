@@ -1,4 +1,9 @@
-from rapyuta_io_sdk_v2 import walk_pages
+import threading
+import time
+
+import pytest
+
+from rapyuta_io_sdk_v2 import walk_items, walk_pages
 
 
 def _make_sdk_model(items, continue_=None):
@@ -151,3 +156,112 @@ class TestWalkPagesWithSdkModelResponse:
 
         pages = list(walk_pages(list_func))
         assert pages == []
+
+
+class TestWalkPagesPrefetch:
+    """Tests for walk_pages with background prefetching enabled."""
+
+    def test_pages_match_sequential_walk(self):
+        def list_func(cont, limit):
+            items = list(range(cont, min(cont + limit, 7)))
+            return {"items": items, "metadata": {"continue": cont + limit}}
+
+        sequential = list(walk_pages(list_func, limit=2))
+        prefetched = list(walk_pages(list_func, limit=2, prefetch=2))
+
+        assert prefetched == sequential == [[0, 1], [2, 3], [4, 5], [6]]
+
+    def test_next_page_is_fetched_while_current_is_processed(self):
+        second_page_requested = threading.Event()
+
+        def list_func(cont, limit):
+            if cont == 2:
+                second_page_requested.set()
+            return {"items": [cont, cont + 1], "metadata": {"continue": cont + 2}}
+
+        pages = walk_pages(list_func, limit=2, prefetch=1)
+        first = next(pages)
+
+        # The consumer has not asked for the second page yet.
+        assert first == [0, 1]
+        assert second_page_requested.wait(timeout=5)
+        pages.close()
+
+    def test_early_exit_stops_fetching(self):
+        calls = []
+
+        def list_func(cont, limit):
+            calls.append(cont)
+            return {"items": [cont], "metadata": {"continue": cont + 1}}
+
+        for page in walk_pages(list_func, limit=1, prefetch=2):
+            if page == [3]:
+                break
+
+        time.sleep(0.3)
+        settled = len(calls)
+        time.sleep(0.3)
+        assert len(calls) == settled
+        assert settled <= 4 + 3
+
+    def test_errors_are_raised_in_caller(self):
+        def list_func(cont, limit):
+            if cont == 1:
+                raise RuntimeError("boom")
+            return {"items": [cont], "metadata": {"continue": cont + 1}}
+
+        pages = walk_pages(list_func, limit=1, prefetch=1)
+
+        assert next(pages) == [0]
+        with pytest.raises(RuntimeError, match="boom"):
+            next(pages)
+
+    def test_base_exceptions_are_raised_in_caller(self):
+        def list_func(cont, limit):
+            raise SystemExit(3)
+
+        with pytest.raises(SystemExit):
+            list(walk_pages(list_func, limit=1, prefetch=1))
+
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_dead_prefetching_thread_does_not_block_the_caller(self, mocker):
+        # A producer that dies without queueing a result, e.g. killed mid-put.
+        mocker.patch("queue.Queue.put", side_effect=SystemExit)
+
+        def list_func(cont, limit):
+            return {"items": [cont], "metadata": {"continue": cont + 1}}
+
+        with pytest.raises(RuntimeError, match="stopped unexpectedly"):
+            list(walk_pages(list_func, limit=1, prefetch=1))
+
+    def test_sdk_model_response(self):
+        responses = [
+            _make_sdk_model(["a", "b"], continue_=2),
+            _make_sdk_model(["c"], continue_=None),
+        ]
+
+        def list_func(cont, limit):
+            return responses.pop(0)
+
+        assert list(walk_pages(list_func, limit=2, prefetch=1)) == [["a", "b"], ["c"]]
+
+
+class TestWalkItems:
+    def test_yields_items_of_all_pages(self):
+        responses = [
+            {"items": ["a", "b"], "metadata": {"continue": 2}},
+            {"items": ["c"], "metadata": {"continue": None}},
+        ]
+
+        def list_func(cont, limit):
+            return responses.pop(0)
+
+        assert list(walk_items(list_func, limit=2)) == ["a", "b", "c"]
+
+    def test_prefetch_is_forwarded(self):
+        def list_func(cont, limit):
+            return {"items": [cont], "metadata": {"continue": cont + 1}}
+
+        items = walk_items(list_func, limit=1, prefetch=2)
+        assert [next(items) for _ in range(3)] == [0, 1, 2]
+        items.close()